@@ -24,9 +24,14 @@
 #  under the License.
 
 from ._version import __title__, __url__, __version__  # noqa: F401
-from .common import SortOrder, os_version  # noqa: F401
+from .common import OrjsonSerializer, SortOrder, os_version  # noqa: F401
 from .dataframe import DataFrame
-from .etl import csv_to_opensearch, opensearch_to_pandas, pandas_to_opensearch
+from .etl import (
+    csv_to_opensearch,
+    opensearch_to_pandas,
+    pandas_to_opensearch,
+    pandas_to_opensearch_async,
+)
 from .index import Index
 from .ndframe import NDFrame
 from .series import Series
@@ -37,9 +42,11 @@ __all__ = [
     "NDFrame",
     "Index",
     "pandas_to_opensearch",
+    "pandas_to_opensearch_async",
     "opensearch_to_pandas",
     "csv_to_opensearch",
     "SortOrder",
+    "OrjsonSerializer",
 ]
 
 # Define test files and indices
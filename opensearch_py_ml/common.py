@@ -25,15 +25,28 @@
 import re
 import warnings
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pandas as pd  # type: ignore
 from opensearchpy import OpenSearch
+from opensearchpy.serializer import JSONSerializer
+from pandas.compat._optional import import_optional_dependency  # type: ignore
 
 from ._version import __version__ as _opensearch_py_ml_version
 
 if TYPE_CHECKING:
     from numpy.typing import DTypeLike
+    from opensearchpy import AsyncOpenSearch
 
 # Default number of rows displayed (different to pandas where ALL could be displayed)
 DEFAULT_NUM_ROWS_DISPLAYED = 60
@@ -41,8 +54,18 @@ DEFAULT_CHUNK_SIZE = 10000
 DEFAULT_CSV_BATCH_OUTPUT_SIZE = 10000
 DEFAULT_PROGRESS_REPORTING_NUM_ROWS = 10000
 DEFAULT_SEARCH_SIZE = 5000
+# Adaptive search_after page sizes aim for responses of about this many bytes and seconds
+DEFAULT_SEARCH_TARGET_BYTES = 10 * 1024 * 1024
+DEFAULT_SEARCH_TARGET_SECONDS = 5.0
+MIN_SEARCH_SIZE = 10
+DEFAULT_MAX_RESULT_WINDOW = 10000
 DEFAULT_PIT_KEEP_ALIVE = "3m"
+DEFAULT_SCROLL_KEEP_ALIVE = "3m"
 DEFAULT_PAGINATION_SIZE = 5000  # for composite aggregations
+DEFAULT_FIELD_MAPPINGS_CACHE_TTL = 0.0  # seconds, disables the cache
+DEFAULT_FIELD_MAPPINGS_CACHE_SIZE = 128
+DEFAULT_HIST_BUCKETS_PER_BIN = 20  # for single pass histograms
+PIT_MIN_OS_VERSION: Tuple[int, int, int] = (2, 4, 0)
 PANDAS_VERSION: Tuple[int, ...] = tuple(
     int(part) for part in pd.__version__.split(".") if part.isdigit()
 )[:2]
@@ -119,6 +142,120 @@ class SortOrder(Enum):
         return SortOrder.DESC
 
 
+# pandas.to_datetime arguments to parse each OpenSearch built-in date format
+# **Date Formats: https://opensearch.org/docs/2.2/opensearch/supported-field-types/date/
+_DATE_FORMAT_TO_DATETIME_KWARGS: Dict[str, Dict[str, Any]] = {
+    "epoch_millis": {"unit": "ms"},
+    "epoch_second": {"unit": "s"},
+    "strict_date_optional_time": {"format": "%Y-%m-%dT%H:%M:%S.%f%z", "exact": False},
+    "basic_date": {"format": "%Y%m%d"},
+    "basic_date_time": {"format": "%Y%m%dT%H%M%S.%f", "exact": False},
+    "basic_date_time_no_millis": {"format": "%Y%m%dT%H%M%S%z"},
+    "basic_ordinal_date": {"format": "%Y%j"},
+    "basic_ordinal_date_time": {"format": "%Y%jT%H%M%S.%f%z", "exact": False},
+    "basic_ordinal_date_time_no_millis": {"format": "%Y%jT%H%M%S%z"},
+    "basic_time": {"format": "%H%M%S.%f%z", "exact": False},
+    "basic_time_no_millis": {"format": "%H%M%S%z"},
+    "basic_t_time": {"format": "T%H%M%S.%f%z", "exact": False},
+    "basic_t_time_no_millis": {"format": "T%H%M%S%z"},
+    "basic_week_date": {"format": "%GW%V%u"},
+    "basic_week_date_time": {"format": "%GW%V%uT%H%M%S.%f%z", "exact": False},
+    "basic_week_date_time_no_millis": {"format": "%GW%V%uT%H%M%S%z"},
+    "strict_date": {"format": "%Y-%m-%d"},
+    "date": {"format": "%Y-%m-%d"},
+    "strict_date_hour": {"format": "%Y-%m-%dT%H"},
+    "date_hour": {"format": "%Y-%m-%dT%H"},
+    "strict_date_hour_minute": {"format": "%Y-%m-%dT%H:%M"},
+    "date_hour_minute": {"format": "%Y-%m-%dT%H:%M"},
+    "strict_date_hour_minute_second": {"format": "%Y-%m-%dT%H:%M:%S"},
+    "date_hour_minute_second": {"format": "%Y-%m-%dT%H:%M:%S"},
+    "strict_date_hour_minute_second_fraction": {
+        "format": "%Y-%m-%dT%H:%M:%S.%f",
+        "exact": False,
+    },
+    "date_hour_minute_second_fraction": {
+        "format": "%Y-%m-%dT%H:%M:%S.%f",
+        "exact": False,
+    },
+    "strict_date_hour_minute_second_millis": {
+        "format": "%Y-%m-%dT%H:%M:%S.%f",
+        "exact": False,
+    },
+    "date_hour_minute_second_millis": {
+        "format": "%Y-%m-%dT%H:%M:%S.%f",
+        "exact": False,
+    },
+    "strict_date_time": {"format": "%Y-%m-%dT%H:%M:%S.%f%z", "exact": False},
+    "date_time": {"format": "%Y-%m-%dT%H:%M:%S.%f%z", "exact": False},
+    "strict_date_time_no_millis": {"format": "%Y-%m-%dT%H:%M:%S%z"},
+    "date_time_no_millis": {"format": "%Y-%m-%dT%H:%M:%S%z"},
+    "strict_hour": {"format": "%H"},
+    "hour": {"format": "%H"},
+    "strict_hour_minute": {"format": "%H:%M"},
+    "hour_minute": {"format": "%H:%M"},
+    "strict_hour_minute_second": {"format": "%H:%M:%S"},
+    "hour_minute_second": {"format": "%H:%M:%S"},
+    "strict_hour_minute_second_fraction": {"format": "%H:%M:%S.%f", "exact": False},
+    "hour_minute_second_fraction": {"format": "%H:%M:%S.%f", "exact": False},
+    "strict_hour_minute_second_millis": {"format": "%H:%M:%S.%f", "exact": False},
+    "hour_minute_second_millis": {"format": "%H:%M:%S.%f", "exact": False},
+    "strict_ordinal_date": {"format": "%Y-%j"},
+    "ordinal_date": {"format": "%Y-%j"},
+    "strict_ordinal_date_time": {"format": "%Y-%jT%H:%M:%S.%f%z", "exact": False},
+    "ordinal_date_time": {"format": "%Y-%jT%H:%M:%S.%f%z", "exact": False},
+    "strict_ordinal_date_time_no_millis": {"format": "%Y-%jT%H:%M:%S%z"},
+    "ordinal_date_time_no_millis": {"format": "%Y-%jT%H:%M:%S%z"},
+    "strict_time": {"format": "%H:%M:%S.%f%z", "exact": False},
+    "time": {"format": "%H:%M:%S.%f%z", "exact": False},
+    "strict_time_no_millis": {"format": "%H:%M:%S%z"},
+    "time_no_millis": {"format": "%H:%M:%S%z"},
+    "strict_t_time": {"format": "T%H:%M:%S.%f%z", "exact": False},
+    "t_time": {"format": "T%H:%M:%S.%f%z", "exact": False},
+    "strict_t_time_no_millis": {"format": "T%H:%M:%S%z"},
+    "t_time_no_millis": {"format": "T%H:%M:%S%z"},
+    "strict_week_date": {"format": "%G-W%V-%u"},
+    "week_date": {"format": "%G-W%V-%u"},
+    "strict_week_date_time": {"format": "%G-W%V-%uT%H:%M:%S.%f%z", "exact": False},
+    "week_date_time": {"format": "%G-W%V-%uT%H:%M:%S.%f%z", "exact": False},
+    "strict_week_date_time_no_millis": {"format": "%G-W%V-%uT%H:%M:%S%z"},
+    "week_date_time_no_millis": {"format": "%G-W%V-%uT%H:%M:%S%z"},
+    "strict_weekyear_week_day": {"format": "%G-W%V-%u"},
+    "weekyear_week_day": {"format": "%G-W%V-%u"},
+    "strict_year": {"format": "%Y"},
+    "year": {"format": "%Y"},
+    "strict_year_month": {"format": "%Y-%m"},
+    "year_month": {"format": "%Y-%m"},
+    "strict_year_month_day": {"format": "%Y-%m-%d"},
+    "year_month_day": {"format": "%Y-%m-%d"},
+}
+
+
+def _to_datetime_kwargs(date_format: str) -> Dict[str, Any]:
+    if date_format == "strict_weekyear" or date_format == "weekyear":
+        # TODO investigate if there is a way of converting this
+        # Not supported in pandas
+        # ValueError: ISO year directive '%G' must be used with the ISO week directive '%V'
+        # and a weekday directive '%A', '%a', '%w', or '%u'.
+        raise NotImplementedError(
+            "strict_weekyear is not implemented due to support in pandas"
+        )
+    elif date_format == "strict_weekyear_week" or date_format == "weekyear_week":
+        # TODO investigate if there is a way of converting this
+        raise NotImplementedError(
+            "strict_weekyear_week is not implemented due to support in pandas"
+        )
+
+    try:
+        return _DATE_FORMAT_TO_DATETIME_KWARGS[date_format]
+    except KeyError:
+        warnings.warn(
+            f"The '{date_format}' format is not explicitly supported."
+            f"Using pandas.to_datetime(value) to parse value",
+            Warning,
+        )
+        return {}
+
+
 def opensearch_date_to_pandas_date(
     value: Union[int, str, float], date_format: Optional[str]
 ) -> pd.Timestamp:
@@ -151,172 +288,117 @@ def opensearch_date_to_pandas_date(
             )
         except ValueError:
             return pd.to_datetime(value)
-    elif date_format == "epoch_millis":
-        return pd.to_datetime(value, unit="ms")
-    elif date_format == "epoch_second":
-        return pd.to_datetime(value, unit="s")
-    elif date_format == "strict_date_optional_time":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "basic_date":
-        return pd.to_datetime(value, format="%Y%m%d")
-    elif date_format == "basic_date_time":
-        return pd.to_datetime(value, format="%Y%m%dT%H%M%S.%f", exact=False)
-    elif date_format == "basic_date_time_no_millis":
-        return pd.to_datetime(value, format="%Y%m%dT%H%M%S%z")
-    elif date_format == "basic_ordinal_date":
-        return pd.to_datetime(value, format="%Y%j")
-    elif date_format == "basic_ordinal_date_time":
-        return pd.to_datetime(value, format="%Y%jT%H%M%S.%f%z", exact=False)
-    elif date_format == "basic_ordinal_date_time_no_millis":
-        return pd.to_datetime(value, format="%Y%jT%H%M%S%z")
-    elif date_format == "basic_time":
-        return pd.to_datetime(value, format="%H%M%S.%f%z", exact=False)
-    elif date_format == "basic_time_no_millis":
-        return pd.to_datetime(value, format="%H%M%S%z")
-    elif date_format == "basic_t_time":
-        return pd.to_datetime(value, format="T%H%M%S.%f%z", exact=False)
-    elif date_format == "basic_t_time_no_millis":
-        return pd.to_datetime(value, format="T%H%M%S%z")
-    elif date_format == "basic_week_date":
-        return pd.to_datetime(value, format="%GW%V%u")
-    elif date_format == "basic_week_date_time":
-        return pd.to_datetime(value, format="%GW%V%uT%H%M%S.%f%z", exact=False)
-    elif date_format == "basic_week_date_time_no_millis":
-        return pd.to_datetime(value, format="%GW%V%uT%H%M%S%z")
-    elif date_format == "strict_date":
-        return pd.to_datetime(value, format="%Y-%m-%d")
-    elif date_format == "date":
-        return pd.to_datetime(value, format="%Y-%m-%d")
-    elif date_format == "strict_date_hour":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H")
-    elif date_format == "date_hour":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H")
-    elif date_format == "strict_date_hour_minute":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M")
-    elif date_format == "date_hour_minute":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M")
-    elif date_format == "strict_date_hour_minute_second":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S")
-    elif date_format == "date_hour_minute_second":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S")
-    elif date_format == "strict_date_hour_minute_second_fraction":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f", exact=False)
-    elif date_format == "date_hour_minute_second_fraction":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f", exact=False)
-    elif date_format == "strict_date_hour_minute_second_millis":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f", exact=False)
-    elif date_format == "date_hour_minute_second_millis":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f", exact=False)
-    elif date_format == "strict_date_time":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "date_time":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "strict_date_time_no_millis":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S%z")
-    elif date_format == "date_time_no_millis":
-        return pd.to_datetime(value, format="%Y-%m-%dT%H:%M:%S%z")
-    elif date_format == "strict_hour":
-        return pd.to_datetime(value, format="%H")
-    elif date_format == "hour":
-        return pd.to_datetime(value, format="%H")
-    elif date_format == "strict_hour_minute":
-        return pd.to_datetime(value, format="%H:%M")
-    elif date_format == "hour_minute":
-        return pd.to_datetime(value, format="%H:%M")
-    elif date_format == "strict_hour_minute_second":
-        return pd.to_datetime(value, format="%H:%M:%S")
-    elif date_format == "hour_minute_second":
-        return pd.to_datetime(value, format="%H:%M:%S")
-    elif date_format == "strict_hour_minute_second_fraction":
-        return pd.to_datetime(value, format="%H:%M:%S.%f", exact=False)
-    elif date_format == "hour_minute_second_fraction":
-        return pd.to_datetime(value, format="%H:%M:%S.%f", exact=False)
-    elif date_format == "strict_hour_minute_second_millis":
-        return pd.to_datetime(value, format="%H:%M:%S.%f", exact=False)
-    elif date_format == "hour_minute_second_millis":
-        return pd.to_datetime(value, format="%H:%M:%S.%f", exact=False)
-    elif date_format == "strict_ordinal_date":
-        return pd.to_datetime(value, format="%Y-%j")
-    elif date_format == "ordinal_date":
-        return pd.to_datetime(value, format="%Y-%j")
-    elif date_format == "strict_ordinal_date_time":
-        return pd.to_datetime(value, format="%Y-%jT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "ordinal_date_time":
-        return pd.to_datetime(value, format="%Y-%jT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "strict_ordinal_date_time_no_millis":
-        return pd.to_datetime(value, format="%Y-%jT%H:%M:%S%z")
-    elif date_format == "ordinal_date_time_no_millis":
-        return pd.to_datetime(value, format="%Y-%jT%H:%M:%S%z")
-    elif date_format == "strict_time":
-        return pd.to_datetime(value, format="%H:%M:%S.%f%z", exact=False)
-    elif date_format == "time":
-        return pd.to_datetime(value, format="%H:%M:%S.%f%z", exact=False)
-    elif date_format == "strict_time_no_millis":
-        return pd.to_datetime(value, format="%H:%M:%S%z")
-    elif date_format == "time_no_millis":
-        return pd.to_datetime(value, format="%H:%M:%S%z")
-    elif date_format == "strict_t_time":
-        return pd.to_datetime(value, format="T%H:%M:%S.%f%z", exact=False)
-    elif date_format == "t_time":
-        return pd.to_datetime(value, format="T%H:%M:%S.%f%z", exact=False)
-    elif date_format == "strict_t_time_no_millis":
-        return pd.to_datetime(value, format="T%H:%M:%S%z")
-    elif date_format == "t_time_no_millis":
-        return pd.to_datetime(value, format="T%H:%M:%S%z")
-    elif date_format == "strict_week_date":
-        return pd.to_datetime(value, format="%G-W%V-%u")
-    elif date_format == "week_date":
-        return pd.to_datetime(value, format="%G-W%V-%u")
-    elif date_format == "strict_week_date_time":
-        return pd.to_datetime(value, format="%G-W%V-%uT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "week_date_time":
-        return pd.to_datetime(value, format="%G-W%V-%uT%H:%M:%S.%f%z", exact=False)
-    elif date_format == "strict_week_date_time_no_millis":
-        return pd.to_datetime(value, format="%G-W%V-%uT%H:%M:%S%z")
-    elif date_format == "week_date_time_no_millis":
-        return pd.to_datetime(value, format="%G-W%V-%uT%H:%M:%S%z")
-    elif date_format == "strict_weekyear" or date_format == "weekyear":
-        # TODO investigate if there is a way of converting this
-        raise NotImplementedError(
-            "strict_weekyear is not implemented due to support in pandas"
-        )
-        return pd.to_datetime(value, format="%G")
-        # Not supported in pandas
-        # ValueError: ISO year directive '%G' must be used with the ISO week directive '%V'
-        # and a weekday directive '%A', '%a', '%w', or '%u'.
-    elif date_format == "strict_weekyear_week" or date_format == "weekyear_week":
-        # TODO investigate if there is a way of converting this
-        raise NotImplementedError(
-            "strict_weekyear_week is not implemented due to support in pandas"
+
+    return pd.to_datetime(value, **_to_datetime_kwargs(date_format))
+
+
+def opensearch_dates_to_pandas_dates(
+    values: Sequence[Any], date_format: Optional[str]
+) -> pd.Index:
+    """
+    Parses the values of a date field like opensearch_date_to_pandas_date, but with
+    one `to_datetime` call for all the values rather than one per value.
+
+    Values are parsed one by one when they can't be parsed together, e.g. for
+    mixed formats like "strict_date_optional_time||epoch_millis", a mix of
+    numeric and string values or numeric values of a format that isn't an
+    epoch format.
+
+    Parameters
+    ----------
+    values: Sequence[Any]
+        The date values, None or NaN for missing values.
+    date_format: str
+        The OpenSearch date format (ex. 'epoch_millis', 'epoch_second', etc.)
+
+    Returns
+    -------
+    datetimes: pd.Index
+        The parsed dates in the order of values. This is a DatetimeIndex unless
+        the values have different timezones or were parsed one by one.
+    """
+    if date_format is None or "||" not in date_format:
+        inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+        try:
+            if inferred_type in ("integer", "floating", "mixed-integer-float"):
+                if date_format in (None, "epoch_millis", "epoch_second"):
+                    return pd.to_datetime(
+                        values, unit="s" if date_format == "epoch_second" else "ms"
+                    )
+            elif inferred_type == "string" and date_format is not None:
+                return pd.to_datetime(values, **_to_datetime_kwargs(date_format))
+            elif inferred_type == "string":
+                # Without a format strings are epoch_millis if they're numeric
+                is_numeric = pd.notna(pd.to_numeric(values, errors="coerce"))
+                if (is_numeric | pd.isna(values)).all():
+                    return pd.to_datetime(values, unit="ms")
+                elif not is_numeric.any():
+                    return pd.to_datetime(values)
+        except (ValueError, TypeError):
+            pass
+
+    return pd.Index(
+        [opensearch_date_to_pandas_date(value, date_format) for value in values],
+        dtype=object,
+    )
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    opensearch-py serializer that decodes responses with orjson, which is
+    considerably faster than the json module for the large search responses
+    read when exporting a DataFrame. Requests are encoded as JSONSerializer
+    does. Requires orjson.
+
+    Responses that json accepts but orjson rejects, e.g. containing NaN, are
+    decoded with json. Unlike json, orjson decodes integers that don't fit
+    in 64 bits as floats, which is beyond the range of OpenSearch integer
+    field types.
+
+    Examples
+    --------
+    >>> from opensearchpy import OpenSearch
+    >>> client = OpenSearch("https://localhost:9200", serializer=oml.OrjsonSerializer()) # doctest: +SKIP
+    >>> df = oml.DataFrame(client, "flights") # doctest: +SKIP
+    """
+
+    def __init__(self) -> None:
+        self._orjson = import_optional_dependency("orjson")
+
+    def loads(self, s: str) -> Any:
+        try:
+            return self._orjson.loads(s)
+        except self._orjson.JSONDecodeError:
+            return super().loads(s)
+
+
+def _parse_os_version(version_info: str) -> Tuple[int, int, int]:
+    match = re.match(r"^(\d+)\.(\d+)\.(\d+)", version_info)
+    if match is None:
+        raise ValueError(f"Unable to determine version. " f"Received: {version_info}")
+    return cast(Tuple[int, int, int], tuple(int(x) for x in match.groups()))
+
+
+def _cluster_version(os_client: OpenSearch) -> Tuple[int, int, int]:
+    """Returns the OpenSearch version of the cluster, cached on the client
+    as '_os_ml_py_version'. Unlike os_version() it doesn't warn when the
+    major version doesn't match the library's, so it's safe to call from
+    inside the library.
+    """
+    if not hasattr(os_client, "_os_ml_py_version"):
+        os_client._os_ml_py_version = _parse_os_version(  # type: ignore
+            os_client.info()["version"]["number"]
         )
-        return pd.to_datetime(value, format="%G-W%V")
-        # Not supported in pandas
-        # ValueError: ISO year directive '%G' must be used with the ISO week directive '%V'
-        # and a weekday directive '%A', '%a', '%w', or '%u'.
-    elif date_format == "strict_weekyear_week_day":
-        return pd.to_datetime(value, format="%G-W%V-%u")
-    elif date_format == "weekyear_week_day":
-        return pd.to_datetime(value, format="%G-W%V-%u")
-    elif date_format == "strict_year":
-        return pd.to_datetime(value, format="%Y")
-    elif date_format == "year":
-        return pd.to_datetime(value, format="%Y")
-    elif date_format == "strict_year_month":
-        return pd.to_datetime(value, format="%Y-%m")
-    elif date_format == "year_month":
-        return pd.to_datetime(value, format="%Y-%m")
-    elif date_format == "strict_year_month_day":
-        return pd.to_datetime(value, format="%Y-%m-%d")
-    elif date_format == "year_month_day":
-        return pd.to_datetime(value, format="%Y-%m-%d")
-    else:
-        warnings.warn(
-            f"The '{date_format}' format is not explicitly supported."
-            f"Using pandas.to_datetime(value) to parse value",
-            Warning,
+    return cast(Tuple[int, int, int], os_client._os_ml_py_version)  # type: ignore
+
+
+async def _cluster_version_async(os_client: "AsyncOpenSearch") -> Tuple[int, int, int]:
+    """Async version of _cluster_version() for an AsyncOpenSearch client."""
+    if not hasattr(os_client, "_os_ml_py_version"):
+        os_client._os_ml_py_version = _parse_os_version(  # type: ignore
+            (await os_client.info())["version"]["number"]
         )
-        # TODO investigate how we could generate this just once for a bulk read.
-        return pd.to_datetime(value)
+    return cast(Tuple[int, int, int], os_client._os_ml_py_version)  # type: ignore
 
 
 def os_version(os_client: OpenSearch) -> Tuple[int, int, int]:
@@ -326,14 +408,7 @@ def os_version(os_client: OpenSearch) -> Tuple[int, int, int]:
     opensearch_py_ml_os_version: Tuple[int, int, int]
     if not hasattr(os_client, "_os_ml_py_version"):
         version_info = os_client.info()["version"]["number"]
-        match = re.match(r"^(\d+)\.(\d+)\.(\d+)", version_info)
-        if match is None:
-            raise ValueError(
-                f"Unable to determine version. " f"Received: {version_info}"
-            )
-        opensearch_py_ml_os_version = cast(
-            Tuple[int, int, int], tuple(int(x) for x in match.groups())
-        )
+        opensearch_py_ml_os_version = _parse_os_version(version_info)
         os_client._os_ml_py_version = opensearch_py_ml_os_version  # type: ignore
 
         # Raise a warning if the major version of the library doesn't match the
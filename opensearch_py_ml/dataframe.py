@@ -27,7 +27,17 @@ import re
 import sys
 import warnings
 from io import StringIO
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd  # type: ignore
@@ -50,7 +60,8 @@ from opensearch_py_ml.series import Series
 from opensearch_py_ml.utils import is_valid_attr_name, to_list_if_needed
 
 if TYPE_CHECKING:
-    from opensearchpy import OpenSearch
+    import pyarrow as pa  # type: ignore
+    from opensearchpy import AsyncOpenSearch, OpenSearch
 
     from .query_compiler import QueryCompiler
 
@@ -809,11 +820,13 @@ class DataFrame(NDFrame):
             query = query["query"]
         return DataFrame(_query_compiler=self._query_compiler.os_query(query))
 
-    def _index_summary(self):
+    def _index_summary(self, num_rows: Optional[int] = None):
         # Print index summary e.g.
         # Index: 103 entries, 0 to 102
         # Do this by getting head and tail of dataframe
-        if self.empty:
+        if num_rows is None:
+            num_rows = len(self)
+        if len(self.columns) == 0 or num_rows == 0:
             # index[0] is out of bounds for empty df
             head = self.head(1).to_pandas()
             tail = self.tail(1).to_pandas()
@@ -823,7 +836,7 @@ class DataFrame(NDFrame):
         index_summary = f", {pprint_thing(head)} to {pprint_thing(tail)}"
 
         name = "Index"
-        return f"{name}: {len(self)} entries{index_summary}"
+        return f"{name}: {num_rows} entries{index_summary}"
 
     def info(
         self,
@@ -867,11 +880,19 @@ class DataFrame(NDFrame):
         if buf is None:  # pragma: no cover
             buf = sys.stdout
 
-        lines = [str(type(self)), self._index_summary()]
-
         columns: pd.Index = self.columns
         number_of_columns: int = len(columns)
 
+        column_counts: Optional[pd.Series] = None
+        if show_counts is not False and number_of_columns > 0:
+            # The number of rows and the counts of the columns are independent
+            # searches, so read both in a single round trip
+            num_rows, column_counts = self._query_compiler._index_count_and_count()
+        else:
+            num_rows = len(self)
+
+        lines = [str(type(self)), self._index_summary(num_rows)]
+
         if number_of_columns == 0:
             lines.append(f"Empty {type(self).__name__}")
             fmt.buffer_put_lines(buf, lines)
@@ -881,10 +902,10 @@ class DataFrame(NDFrame):
         if max_cols is None:
             max_cols = pd.get_option("display.max_info_columns", number_of_columns + 1)
 
-        max_rows = pd.get_option("display.max_info_rows", len(self) + 1)
+        max_rows = pd.get_option("display.max_info_rows", num_rows + 1)
 
         if show_counts is None:
-            show_counts = (number_of_columns <= max_cols) and (len(self) < max_rows)
+            show_counts = (number_of_columns <= max_cols) and (num_rows < max_rows)
 
         exceeds_info_cols = number_of_columns > max_cols
 
@@ -910,7 +931,7 @@ class DataFrame(NDFrame):
 
             header = _put_str(id_head, space_num) + _put_str(column_head, space)
             if show_counts:
-                counts = self.count()
+                counts = column_counts if column_counts is not None else self.count()
                 if number_of_columns != len(counts):  # pragma: no cover
                     raise AssertionError(
                         f"Columns must equal counts ({number_of_columns:d} != {len(counts):d})"
@@ -1336,6 +1357,8 @@ class DataFrame(NDFrame):
         """
         Write OpenSearch data to a comma-separated values (csv) file.
 
+        Results are written a batch at a time, so the DataFrame is never held in memory.
+
         See Also
         --------
         :pandas_api_docs:`pandas.DataFrame.to_csv`
@@ -1367,15 +1390,137 @@ class DataFrame(NDFrame):
         }
         return self._query_compiler.to_csv(**kwargs)
 
-    def to_pandas(self, show_progress: bool = False) -> pd.DataFrame:
+    def to_parquet(
+        self,
+        path,
+        row_group_size: Optional[int] = None,
+        compression: Optional[str] = "snappy",
+        index: bool = True,
+        schema: Optional["pa.Schema"] = None,
+        show_progress: bool = False,
+    ) -> None:
+        """
+        Write OpenSearch data to a Parquet file. Requires pyarrow.
+
+        Each page of search results is written out as row groups as soon as it
+        arrives, so only about one page is held in memory however large the
+        index is.
+
+        Parameters
+        ----------
+        path: str or file-like object
+            File path or writable binary file-like object
+        row_group_size: int, optional
+            Maximum number of rows in a row group. Every batch of results is
+            written as one or more row groups.
+        compression: str, default 'snappy'
+            Parquet compression codec e.g. 'snappy', 'gzip', 'zstd' or None
+        index: bool, default True
+            Write the index as a column
+        schema: pyarrow.Schema, optional
+            Fields overriding the column types derived from the mappings.
+            Numeric, boolean and date fields keep their types and any other
+            field is written as a string, with objects and multi-valued
+            fields as JSON. Use list types e.g. ``pa.list_(pa.float64())``
+            for multi-valued numeric fields.
+        show_progress: bool, default False
+            Output progress of option to stdout
+
+        See Also
+        --------
+        :pandas_api_docs:`pandas.DataFrame.to_parquet`
+        """
+        self._query_compiler.to_parquet(
+            path,
+            row_group_size=row_group_size,
+            compression=compression,
+            index=index,
+            schema=schema,
+            show_progress=show_progress,
+        )
+
+    def to_arrow(
+        self,
+        index: bool = True,
+        schema: Optional["pa.Schema"] = None,
+        show_progress: bool = False,
+    ) -> "pa.Table":
+        """
+        Utility method to convert opensearch_py_ml.Dataframe to pyarrow.Table.
+        Requires pyarrow.
+
+        The whole table is held in memory, use :meth:`DataFrame.to_parquet`
+        for results that don't fit. Pages of results are converted to record
+        batches directly, without building a pandas.DataFrame of the whole
+        result first.
+
+        Parameters
+        ----------
+        index: bool, default True
+            Include the index as a column
+        schema: pyarrow.Schema, optional
+            Fields overriding the column types derived from the mappings,
+            see :meth:`DataFrame.to_parquet`
+        show_progress: bool, default False
+            Output progress of option to stdout
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        return self._query_compiler.to_arrow(
+            index=index, schema=schema, show_progress=show_progress
+        )
+
+    def to_pandas(
+        self,
+        show_progress: bool = False,
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
+    ) -> pd.DataFrame:
         """
         Utility method to convert opensearch_py_ml.Dataframe to pandas.Dataframe
 
+        Parameters
+        ----------
+        show_progress: bool, default False
+            Output progress of option to stdout
+        parallelism: int, default 1
+            Number of slices to split the scan into. Slices are fetched
+            concurrently on a thread pool and the results are merged.
+            Row order isn't preserved when parallelism > 1, and it is ignored
+            for DataFrames limited by head(), tail() or a sort.
+        use_docvalue_fields: bool, default False
+            Read numeric, boolean, date and keyword columns from doc values
+            rather than '_source'. This reduces the work on the cluster and
+            the size of responses, but values are returned as indexed: float
+            fields have float precision, keyword normalizers are applied,
+            multiple values are sorted and de-duplicated and dates are UTC.
+            Keyword fields that set 'ignore_above' are still read from
+            '_source', as longer values have no doc values.
+        prefetch: int, default 0
+            Number of result pages requested on a background thread while
+            earlier pages are flattened into the DataFrame, so the search
+            requests and the conversion overlap.
+        adaptive_page_size: bool, default False
+            Size each search request from the size of the documents returned
+            so far rather than a fixed number of documents, aiming for a fixed
+            response size in bytes within 'index.max_result_window'. Narrow
+            documents then take fewer round trips to load.
+
         Returns
         -------
         pandas.DataFrame
         """
-        return self._query_compiler.to_pandas(show_progress=show_progress)
+        return self._query_compiler.to_pandas(
+            show_progress=show_progress,
+            parallelism=parallelism,
+            use_docvalue_fields=use_docvalue_fields,
+            prefetch=prefetch,
+            adaptive_page_size=adaptive_page_size,
+        )
 
     def _empty_pd_df(self) -> pd.DataFrame:
         return self._query_compiler._empty_pd_ef()
@@ -1477,7 +1622,10 @@ class DataFrame(NDFrame):
         return self.columns
 
     def iterrows(
-        self, sort_index: Optional["str"] = "_doc"
+        self,
+        sort_index: Optional["str"] = "_doc",
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
     ) -> Iterable[Tuple[Union[str, Tuple[str, ...]], pd.Series]]:
         """
         Iterate over opensearch_py_ml.DataFrame rows as (index, pandas.Series) pairs.
@@ -1486,6 +1634,16 @@ class DataFrame(NDFrame):
         ----------
         sort_index: str, default '_doc'
             What field to sort the OpenSearch data by.
+        prefetch: int, default 0
+            Number of result pages requested ahead on a background thread
+            while the loop body works through the rows of the current page.
+            Helps most when handling each page takes about as long as
+            fetching one.
+        adaptive_page_size: bool, default False
+            Let the number of documents per search request grow for narrow
+            documents and shrink for wide ones, within
+            'index.max_result_window'. Rows are yielded one at a time either
+            way, only the number of requests changes.
 
         Yields
         ------
@@ -1532,7 +1690,9 @@ class DataFrame(NDFrame):
         Name: 4, dtype: object
         """
         for df in self._query_compiler.search_yield_pandas_dataframes(
-            sort_index=sort_index
+            sort_index=sort_index,
+            prefetch=prefetch,
+            adaptive_page_size=adaptive_page_size,
         ):
             yield from df.iterrows()
 
@@ -1541,6 +1701,8 @@ class DataFrame(NDFrame):
         index: bool = True,
         name: Union[str, None] = "opensearch_py_ml",
         sort_index: Optional[str] = "_doc",
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
     ) -> Iterable[Tuple[Any, ...]]:
         """
         Iterate over opensearch_py_ml.DataFrame rows as namedtuples.
@@ -1553,6 +1715,14 @@ class DataFrame(NDFrame):
             The name of the returned namedtuples or None to return regular tuples.
         sort_index: str, default '_doc'
             What field to sort the OpenSearch data by.
+        prefetch: int, default 0
+            Number of result pages buffered ahead on a background thread
+            while the tuples of the current page are consumed. Up to this
+            many extra pages are held in memory.
+        adaptive_page_size: bool, default False
+            Choose the number of documents per search request from the size
+            of the documents seen so far, within 'index.max_result_window',
+            instead of a fixed page size.
 
         Returns
         -------
@@ -1609,10 +1779,64 @@ class DataFrame(NDFrame):
         Flight(Index='4', AvgTicketPrice=730.041778346198, Cancelled=False)
         """
         for df in self._query_compiler.search_yield_pandas_dataframes(
-            sort_index=sort_index
+            sort_index=sort_index,
+            prefetch=prefetch,
+            adaptive_page_size=adaptive_page_size,
         ):
             yield from df.itertuples(index=index, name=name)
 
+    def aiter_batches(
+        self,
+        os_client: "AsyncOpenSearch",
+        sort_index: Optional[str] = "_doc",
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+    ) -> AsyncGenerator[pd.DataFrame, None]:
+        """
+        Asynchronously iterate over the opensearch_py_ml.DataFrame as a series of
+        pandas.DataFrames, one per page of search results.
+
+        The searches are sent with an ``AsyncOpenSearch`` client connected to the same
+        cluster, so many DataFrames can be read concurrently from one event loop.
+        Requires ``opensearch-py[async]``.
+
+        Parameters
+        ----------
+        os_client: AsyncOpenSearch
+            Async client used to send the searches.
+        sort_index: str, default '_doc'
+            What field to sort the OpenSearch data by.
+        parallelism: int, default 1
+            Number of slices of the index searched concurrently. Only used when the
+            DataFrame isn't sorted or limited by head() or tail(), batches are then
+            yielded in the order their searches complete.
+        use_docvalue_fields: bool, default False
+            Read fields that have doc values from 'docvalue_fields' rather than
+            '_source', see opensearch_py_ml.DataFrame.to_pandas.
+
+        Yields
+        ------
+        pandas.DataFrame
+            The rows of a page of search results.
+
+        See Also
+        --------
+        opensearch_py_ml.DataFrame.to_pandas: Read the whole DataFrame into a pandas.DataFrame.
+
+        Examples
+        --------
+        >>> from opensearchpy import AsyncOpenSearch  # doctest: +SKIP
+        >>> async def read_flights(os_client):  # doctest: +SKIP
+        ...     df = oml.DataFrame(OPENSEARCH_TEST_CLIENT, 'flights')
+        ...     return [batch async for batch in df.aiter_batches(os_client)]
+        """
+        return self._query_compiler.search_yield_pandas_dataframes_async(
+            os_client,
+            sort_index=sort_index,
+            parallelism=parallelism,
+            use_docvalue_fields=use_docvalue_fields,
+        )
+
     def aggregate(
         self,
         func: Union[str, List[str]],
@@ -23,17 +23,43 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import asyncio
 import csv
+import os
+import sys
+import threading
+import time
 from collections import deque
-from typing import Any, Dict, Generator, List, Mapping, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd  # type: ignore
 from opensearchpy import OpenSearch
-from opensearchpy.helpers import parallel_bulk
+from opensearchpy.exceptions import TransportError
+from opensearchpy.helpers import BulkIndexError
 
 from opensearch_py_ml import DataFrame
 from opensearch_py_ml.common import DEFAULT_CHUNK_SIZE, PANDAS_VERSION
 from opensearch_py_ml.field_mappings import FieldMappings, verify_mapping_compatibility
+from opensearch_py_ml.utils import yield_from_threads
+
+if TYPE_CHECKING:
+    from opensearchpy import AsyncOpenSearch
 
 try:
     from pandas.io.parsers import _c_parser_defaults  # type: ignore
@@ -42,6 +68,12 @@ except ImportError:
 
 _DEFAULT_LOW_MEMORY: bool = _c_parser_defaults["low_memory"]
 
+# Statuses of bulk requests and items that are retried, the cluster is overloaded
+_BULK_RETRY_STATUSES = (429, 503)
+
+# Index settings for bulk indexing with os_bulk_tuning, restored afterwards
+_BULK_TUNING_SETTINGS = {"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+
 
 def pandas_to_opensearch(
     pd_df: pd.DataFrame,
@@ -55,6 +87,13 @@ def pandas_to_opensearch(
     thread_count: int = 4,
     chunksize: Optional[int] = None,
     use_pandas_index_for_os_ids: bool = True,
+    max_chunk_bytes: Optional[int] = None,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]] = None,
+    os_bulk_tuning: bool = False,
+    os_force_merge: bool = False,
 ) -> DataFrame:
     """
     Append a pandas DataFrame to an OpenSearch index.
@@ -89,6 +128,27 @@ def pandas_to_opensearch(
     use_pandas_index_for_os_ids: bool, default 'True'
         * True: pandas.DataFrame.index fields will be used to populate OpenSearch '_id' fields.
         * False: Ignore pandas.DataFrame.index when indexing into OpenSearch
+    max_chunk_bytes: int, default None
+        Maximum size in bytes of each bulk request. If set, bulk requests are filled
+        up to this size whatever the number of rows, rather than with chunksize / thread_count rows
+    max_retries: int, default 0
+        Number of times documents rejected with a 429 or 503 status are retried.
+        Only the rejected documents are sent again
+    initial_backoff: float, default 2
+        Seconds to wait before the first retry, doubled for every later retry
+    max_backoff: float, default 600
+        Maximum number of seconds to wait before a retry
+    dead_letter: list or path, default None
+        Where documents that failed to index are written once retries are exhausted.
+        A list is appended the error of each document, a path is appended one JSON
+        line per document. If None a BulkIndexError is raised for failed documents
+    os_bulk_tuning: bool, default 'False'
+        * True: Disable refreshes and replicas of os_dest_index while indexing and restore
+          its settings afterwards, also if indexing fails. Speeds up large loads, but the
+          index has no replicas and new documents aren't searchable until it's done
+        * False: Index with the current settings of os_dest_index
+    os_force_merge: bool, default 'False'
+        Force merge os_dest_index once indexing succeeded
 
     Returns
     -------
@@ -168,82 +228,683 @@ def pandas_to_opensearch(
     if chunksize is None:
         chunksize = DEFAULT_CHUNK_SIZE
 
-    mapping = FieldMappings._generate_os_mappings(pd_df, os_type_overrides)
+    try:
+        _setup_os_index(
+            pd_df,
+            os_client,  # type: ignore
+            os_dest_index,
+            os_if_exists,
+            os_type_overrides,
+            os_verify_mapping_compatibility,
+        )
 
-    # If table exists, check if_exists parameter
-    if os_client.indices.exists(index=os_dest_index):  # type: ignore
-        if os_if_exists == "fail":
-            raise ValueError(
-                f"Could not create the index [{os_dest_index}] because it "
-                f"already exists. "
-                f"Change the 'os_if_exists' parameter to "
-                f"'append' or 'replace' data."
+        with _bulk_tuning(
+            os_client, os_dest_index, os_bulk_tuning, os_force_merge  # type: ignore
+        ):
+            _bulk_index(
+                [pd_df],
+                os_client,  # type: ignore
+                os_dest_index,
+                os_dropna=os_dropna,
+                use_pandas_index_for_os_ids=use_pandas_index_for_os_ids,
+                thread_count=thread_count,
+                chunksize=chunksize,
+                max_chunk_bytes=max_chunk_bytes,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+                dead_letter=dead_letter,
             )
 
-        elif os_if_exists == "replace":
-            os_client.indices.delete(index=os_dest_index)  # type: ignore
-            os_client.indices.create(  # type: ignore
-                index=os_dest_index, body={"mappings": mapping["mappings"]}
-            )
+        if os_refresh:
+            os_client.indices.refresh(index=os_dest_index)  # type: ignore
+    finally:
+        # The mappings of the index may have changed
+        FieldMappings.cache.invalidate(os_client)  # type: ignore
+
+    return DataFrame(os_client, os_dest_index)
 
-        elif os_if_exists == "append" and os_verify_mapping_compatibility:
-            dest_mapping = os_client.indices.get_mapping(index=os_dest_index)[  # type: ignore
-                os_dest_index
-            ]
-            verify_mapping_compatibility(
-                oml_mapping=mapping,
-                os_mapping=dest_mapping,
-                os_type_overrides=os_type_overrides,
+
+async def pandas_to_opensearch_async(
+    pd_df: pd.DataFrame,
+    os_client: "AsyncOpenSearch",
+    os_dest_index: str,
+    os_if_exists: str = "fail",
+    os_refresh: bool = False,
+    os_dropna: bool = False,
+    os_type_overrides: Optional[Mapping[str, str]] = None,
+    os_verify_mapping_compatibility: bool = True,
+    concurrency: int = 4,
+    chunksize: Optional[int] = None,
+    use_pandas_index_for_os_ids: bool = True,
+    max_chunk_bytes: Optional[int] = None,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]] = None,
+    os_bulk_tuning: bool = False,
+    os_force_merge: bool = False,
+) -> None:
+    """
+    Append a pandas DataFrame to an OpenSearch index with an ``AsyncOpenSearch`` client.
+    Bulk requests are sent concurrently from the running event loop rather than from threads.
+    Requires ``opensearch-py[async]``.
+    Modifies the OpenSearch destination index
+
+    Parameters
+    ----------
+    os_client: AsyncOpenSearch client
+    os_dest_index: str
+        Name of OpenSearch index to be appended to
+    os_if_exists : {'fail', 'replace', 'append'}, default 'fail'
+        How to behave if the index already exists, see pandas_to_opensearch
+    os_refresh: bool, default 'False'
+        Refresh os_dest_index after bulk index
+    os_dropna: bool, default 'False'
+        * True: Remove missing values (see pandas.Series.dropna)
+        * False: Include missing values - may cause bulk to fail
+    os_type_overrides: dict, default None
+        Dict of field_name: es_data_type that overrides default os data types
+    os_verify_mapping_compatibility: bool, default 'True'
+        * True: Verify that the dataframe schema matches the OpenSearch index schema
+        * False: Do not verify schema
+    concurrency: int, default 4
+        Number of bulk requests sent at the same time
+    chunksize: int, default None
+        Number of pandas.DataFrame rows to read before bulk index into OpenSearch
+    use_pandas_index_for_os_ids: bool, default 'True'
+        * True: pandas.DataFrame.index fields will be used to populate OpenSearch '_id' fields.
+        * False: Ignore pandas.DataFrame.index when indexing into OpenSearch
+    max_chunk_bytes: int, default None
+        Maximum size in bytes of each bulk request, see pandas_to_opensearch
+    max_retries: int, default 0
+        Number of times documents rejected with a 429 or 503 status are retried
+    initial_backoff: float, default 2
+        Seconds to wait before the first retry, doubled for every later retry
+    max_backoff: float, default 600
+        Maximum number of seconds to wait before a retry
+    dead_letter: list or path, default None
+        Where documents that failed to index are written, see pandas_to_opensearch
+    os_bulk_tuning: bool, default 'False'
+        Disable refreshes and replicas of os_dest_index while indexing, see pandas_to_opensearch
+    os_force_merge: bool, default 'False'
+        Force merge os_dest_index once indexing succeeded
+
+    Returns
+    -------
+    None
+        Unlike pandas_to_opensearch no opensearch_py_ml.DataFrame is returned, as it
+        queries OpenSearch with a synchronous client. Create one with
+        opensearch_py_ml.DataFrame(client, os_dest_index) from an OpenSearch client.
+
+    Examples
+    --------
+    >>> from opensearchpy import AsyncOpenSearch  # doctest: +SKIP
+    >>> async def index(pd_df):  # doctest: +SKIP
+    ...     async with AsyncOpenSearch("https://localhost:9200") as os_client:
+    ...         await oml.pandas_to_opensearch_async(pd_df, os_client, 'pandas_to_opensearch', os_if_exists="replace")
+
+    See Also
+    --------
+    opensearch_py_ml.pandas_to_opensearch: Append a pandas DataFrame to an OpenSearch index
+    opensearch_py_ml.DataFrame.aiter_batches: Asynchronously read an opensearch_py_ml.DataFrame
+    """
+    if chunksize is None:
+        chunksize = DEFAULT_CHUNK_SIZE
+
+    try:
+        await _setup_os_index_async(
+            pd_df,
+            os_client,
+            os_dest_index,
+            os_if_exists,
+            os_type_overrides,
+            os_verify_mapping_compatibility,
+        )
+
+        async with _bulk_tuning_async(
+            os_client, os_dest_index, os_bulk_tuning, os_force_merge
+        ):
+            await _bulk_index_async(
+                [pd_df],
+                os_client,
+                os_dest_index,
+                os_dropna=os_dropna,
+                use_pandas_index_for_os_ids=use_pandas_index_for_os_ids,
+                concurrency=concurrency,
+                chunksize=chunksize,
+                max_chunk_bytes=max_chunk_bytes,
+                max_retries=max_retries,
+                initial_backoff=initial_backoff,
+                max_backoff=max_backoff,
+                dead_letter=dead_letter,
             )
+
+        if os_refresh:
+            await os_client.indices.refresh(index=os_dest_index)
+    finally:
+        # The mappings of the index may have changed
+        FieldMappings.cache.invalidate(os_client)  # type: ignore
+
+
+def _os_index_setup_action(
+    os_dest_index: str,
+    os_if_exists: str,
+    os_verify_mapping_compatibility: bool,
+    exists: bool,
+) -> str:
+    """
+    Decides how _setup_os_index and _setup_os_index_async set up os_dest_index
+    according to os_if_exists, given whether the index exists.
+
+    Returns
+    -------
+    'create' to create the index, 'replace' to delete and create it, 'verify'
+    to check the mapping of the existing index or 'append' to use it as is.
+    """
+    if not exists:
+        return "create"
+    if os_if_exists == "fail":
+        raise ValueError(
+            f"Could not create the index [{os_dest_index}] because it "
+            f"already exists. "
+            f"Change the 'os_if_exists' parameter to "
+            f"'append' or 'replace' data."
+        )
+    elif os_if_exists == "replace":
+        return "replace"
+    elif os_if_exists == "append" and os_verify_mapping_compatibility:
+        return "verify"
+    return "append"
+
+
+def _setup_os_index(
+    pd_df: pd.DataFrame,
+    os_client: OpenSearch,
+    os_dest_index: str,
+    os_if_exists: str,
+    os_type_overrides: Optional[Mapping[str, str]],
+    os_verify_mapping_compatibility: bool,
+) -> Optional[Dict[str, Any]]:
+    """
+    Creates, replaces or checks os_dest_index for the columns of pd_df
+    according to os_if_exists.
+
+    Returns
+    -------
+    The mapping of os_dest_index that more data must be compatible with,
+    or None if compatibility isn't verified.
+    """
+    mapping = FieldMappings._generate_os_mappings(pd_df, os_type_overrides)
+    action = _os_index_setup_action(
+        os_dest_index,
+        os_if_exists,
+        os_verify_mapping_compatibility,
+        os_client.indices.exists(index=os_dest_index),
+    )
+
+    if action == "replace":
+        os_client.indices.delete(index=os_dest_index)
+    if action in ("create", "replace"):
+        os_client.indices.create(
+            index=os_dest_index, body={"mappings": mapping["mappings"]}
+        )
+    elif action == "verify":
+        dest_mapping = os_client.indices.get_mapping(index=os_dest_index)[os_dest_index]
+        verify_mapping_compatibility(
+            oml_mapping=mapping,
+            os_mapping=dest_mapping,
+            os_type_overrides=os_type_overrides,
+        )
+        return dest_mapping  # type: ignore
     else:
-        os_client.indices.create(  # type: ignore
+        return None
+
+    return mapping if os_verify_mapping_compatibility else None
+
+
+async def _setup_os_index_async(
+    pd_df: pd.DataFrame,
+    os_client: "AsyncOpenSearch",
+    os_dest_index: str,
+    os_if_exists: str,
+    os_type_overrides: Optional[Mapping[str, str]],
+    os_verify_mapping_compatibility: bool,
+) -> Optional[Dict[str, Any]]:
+    """
+    Async version of _setup_os_index.
+    """
+    mapping = FieldMappings._generate_os_mappings(pd_df, os_type_overrides)
+    action = _os_index_setup_action(
+        os_dest_index,
+        os_if_exists,
+        os_verify_mapping_compatibility,
+        await os_client.indices.exists(index=os_dest_index),
+    )
+
+    if action == "replace":
+        await os_client.indices.delete(index=os_dest_index)
+    if action in ("create", "replace"):
+        await os_client.indices.create(
             index=os_dest_index, body={"mappings": mapping["mappings"]}
         )
+    elif action == "verify":
+        dest_mapping = (await os_client.indices.get_mapping(index=os_dest_index))[
+            os_dest_index
+        ]
+        verify_mapping_compatibility(
+            oml_mapping=mapping,
+            os_mapping=dest_mapping,
+            os_type_overrides=os_type_overrides,
+        )
+        return dest_mapping  # type: ignore
+    else:
+        return None
 
-    def action_generator(
-        pd_df: pd.DataFrame,
-        os_dropna: bool,
-        use_pandas_index_for_os_ids: bool,
-        os_dest_index: str,
-    ) -> Generator[Dict[str, Any], None, None]:
-        for row in pd_df.iterrows():
-            if os_dropna:
-                values = row[1].dropna().to_dict()
-            else:
-                values = row[1].to_dict()
+    return mapping if os_verify_mapping_compatibility else None
 
-            if use_pandas_index_for_os_ids:
-                # Use index as _id
-                id = row[0]
 
-                action = {"_index": os_dest_index, "_source": values, "_id": str(id)}
-            else:
-                action = {"_index": os_dest_index, "_source": values}
-
-            yield action
-
-    # parallel_bulk is lazy generator so use deque to consume them immediately
-    # maxlen = 0 because don't need results of parallel_bulk
-    deque(
-        parallel_bulk(
-            client=os_client,  # type: ignore
-            actions=action_generator(
-                pd_df, os_dropna, use_pandas_index_for_os_ids, os_dest_index
-            ),
-            thread_count=thread_count,
-            chunk_size=int(chunksize / thread_count),
+def _bulk_tuning_previous_settings(resp: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the values of _BULK_TUNING_SETTINGS in the flat get_settings()
+    response of an index, to restore them once bulk indexing is done.
+    """
+    settings = next(iter(resp.values()))["settings"]
+    # Settings that weren't set are restored with None, which resets them
+    return {key: settings.get(key) for key in _BULK_TUNING_SETTINGS}
+
+
+@contextmanager
+def _bulk_tuning(
+    os_client: OpenSearch, os_dest_index: str, bulk_tuning: bool, force_merge: bool
+) -> Generator[None, None, None]:
+    """
+    Applies _BULK_TUNING_SETTINGS to os_dest_index while bulk indexing into
+    it if bulk_tuning, then restores the previous settings even if indexing
+    failed. Force merges os_dest_index once indexing succeeded if force_merge.
+    """
+    if bulk_tuning:
+        previous_settings = _bulk_tuning_previous_settings(
+            os_client.indices.get_settings(index=os_dest_index, flat_settings=True)
+        )
+        os_client.indices.put_settings(index=os_dest_index, body=_BULK_TUNING_SETTINGS)
+
+    try:
+        yield
+        if force_merge:
+            os_client.indices.forcemerge(index=os_dest_index)
+    finally:
+        if bulk_tuning:
+            os_client.indices.put_settings(index=os_dest_index, body=previous_settings)
+
+
+@asynccontextmanager
+async def _bulk_tuning_async(
+    os_client: "AsyncOpenSearch",
+    os_dest_index: str,
+    bulk_tuning: bool,
+    force_merge: bool,
+) -> AsyncGenerator[None, None]:
+    """
+    Async version of _bulk_tuning.
+    """
+    if bulk_tuning:
+        previous_settings = _bulk_tuning_previous_settings(
+            await os_client.indices.get_settings(
+                index=os_dest_index, flat_settings=True
+            )
+        )
+        await os_client.indices.put_settings(
+            index=os_dest_index, body=_BULK_TUNING_SETTINGS
+        )
+
+    try:
+        yield
+        if force_merge:
+            await os_client.indices.forcemerge(index=os_dest_index)
+    finally:
+        if bulk_tuning:
+            await os_client.indices.put_settings(
+                index=os_dest_index, body=previous_settings
+            )
+
+
+def _bulk_index(
+    pd_dfs: Iterable[pd.DataFrame],
+    os_client: OpenSearch,
+    os_dest_index: str,
+    os_dropna: bool,
+    use_pandas_index_for_os_ids: bool,
+    thread_count: int,
+    chunksize: int,
+    max_chunk_bytes: Optional[int] = None,
+    queue_size: int = 4,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]] = None,
+) -> None:
+    """
+    Indexes the rows of every DataFrame in pd_dfs into os_dest_index, filling
+    bulk requests across DataFrames. Requests are sent by thread_count threads
+    while the next ones are serialized, with at most queue_size requests
+    waiting for a thread.
+
+    Documents rejected with a status in _BULK_RETRY_STATUSES, or all the
+    documents of a request rejected with one, are sent again up to
+    max_retries times with exponential backoff. Documents that still fail
+    are written to dead_letter, or raise a BulkIndexError if it's None.
+    """
+    serializer = os_client.transport.serializer
+    dead_letter_lock = threading.Lock()
+
+    def send(actions: List[Tuple[bytes, bytes]]) -> None:
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(_bulk_backoff(attempt, initial_backoff, max_backoff))
+
+            resp, error = None, None
+            try:
+                resp = os_client.bulk(body=_bulk_body(actions))
+            except TransportError as e:
+                if e.status_code not in _BULK_RETRY_STATUSES or (
+                    attempt == max_retries and dead_letter is None
+                ):
+                    raise
+                error = e
+
+            actions, errors = _bulk_failures(
+                actions,
+                resp,
+                error,
+                retry=attempt < max_retries,
+                serializer=serializer,
+            )
+            if errors:
+                with dead_letter_lock:
+                    _write_dead_letter(dead_letter, errors, serializer)
+            if not actions:
+                return
+
+    chunks = _chunk_bulk_actions(
+        _bulk_actions(
+            pd_dfs,
+            serializer,
+            os_dest_index,
+            os_dropna,
+            use_pandas_index_for_os_ids,
+            chunksize,
         ),
-        maxlen=0,
+        chunksize,
+        thread_count,
+        max_chunk_bytes,
     )
 
-    if os_refresh:
-        os_client.indices.refresh(index=os_dest_index)  # type: ignore
+    pending: Deque["Future[None]"] = deque()
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        try:
+            for actions in chunks:
+                pending.append(executor.submit(send, actions))
+                # Wait for the oldest request so no more than queue_size wait for a thread
+                while len(pending) > thread_count + queue_size:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def _bulk_index_async(
+    pd_dfs: Iterable[pd.DataFrame],
+    os_client: "AsyncOpenSearch",
+    os_dest_index: str,
+    os_dropna: bool,
+    use_pandas_index_for_os_ids: bool,
+    concurrency: int,
+    chunksize: int,
+    max_chunk_bytes: Optional[int] = None,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]] = None,
+) -> None:
+    """
+    Async version of _bulk_index with at most concurrency bulk requests
+    in flight at once.
+    """
+    serializer = os_client.transport.serializer
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def send(actions: List[Tuple[bytes, bytes]]) -> None:
+        try:
+            for attempt in range(max_retries + 1):
+                if attempt:
+                    await asyncio.sleep(
+                        _bulk_backoff(attempt, initial_backoff, max_backoff)
+                    )
+
+                resp, error = None, None
+                try:
+                    resp = await os_client.bulk(body=_bulk_body(actions))
+                except TransportError as e:
+                    if e.status_code not in _BULK_RETRY_STATUSES or (
+                        attempt == max_retries and dead_letter is None
+                    ):
+                        raise
+                    error = e
+
+                actions, errors = _bulk_failures(
+                    actions,
+                    resp,
+                    error,
+                    retry=attempt < max_retries,
+                    serializer=serializer,
+                )
+                if errors:
+                    _write_dead_letter(dead_letter, errors, serializer)
+                if not actions:
+                    return
+        finally:
+            in_flight.release()
+
+    chunks = _chunk_bulk_actions(
+        _bulk_actions(
+            pd_dfs,
+            serializer,
+            os_dest_index,
+            os_dropna,
+            use_pandas_index_for_os_ids,
+            chunksize,
+        ),
+        chunksize,
+        concurrency,
+        max_chunk_bytes,
+    )
+
+    tasks: List["asyncio.Future[None]"] = []
+    try:
+        for actions in chunks:
+            await in_flight.acquire()
+            # Raise the error of a failed request rather than sending more
+            for task in tasks:
+                if task.done():
+                    task.result()
+            tasks = [task for task in tasks if not task.done()]
+            tasks.append(asyncio.ensure_future(send(actions)))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _bulk_actions(
+    pd_dfs: Iterable[pd.DataFrame],
+    serializer: Any,
+    os_dest_index: str,
+    os_dropna: bool,
+    use_pandas_index_for_os_ids: bool,
+    chunksize: int,
+) -> Generator[Tuple[bytes, bytes], None, None]:
+    """
+    Yields the serialized and UTF-8 encoded bulk action and source of every
+    row of pd_dfs.
+    """
+    # Actions are serialized and encoded once here, then sized and joined
+    # as is into bulk bodies
+    action = serializer.dumps({"index": {"_index": os_dest_index}}).encode("utf-8")
+    for pd_df in pd_dfs:
+        for values, id in _pandas_to_sources(pd_df, os_dropna, chunksize):
+            if use_pandas_index_for_os_ids:
+                # Use index as _id
+                action = serializer.dumps(
+                    {"index": {"_index": os_dest_index, "_id": id}}
+                ).encode("utf-8")
+
+            yield action, serializer.dumps(values).encode("utf-8")
+
+
+def _bulk_body(actions: List[Tuple[bytes, bytes]]) -> bytes:
+    return b"\n".join(chain(*actions)) + b"\n"
+
+
+def _bulk_backoff(attempt: int, initial_backoff: float, max_backoff: float) -> float:
+    """Seconds to wait before the given retry, starting from 1"""
+    return float(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
+
+
+def _bulk_failures(
+    actions: List[Tuple[bytes, bytes]],
+    resp: Optional[Dict[str, Any]],
+    error: Optional[TransportError],
+    retry: bool,
+    serializer: Any,
+) -> Tuple[List[Tuple[bytes, bytes]], List[Dict[str, Any]]]:
+    """
+    Returns the actions of a bulk request to send again and the errors of
+    the documents that failed for good, from the response of the request or
+    the error it was rejected with.
+    """
+    items: Iterable[Tuple[str, Dict[str, Any]]]
+    if resp is not None:
+        items = (next(iter(item.items())) for item in resp["items"])
+    else:
+        # The whole request was rejected, so was every document in it
+        info = {"status": error.status_code, "error": str(error)}  # type: ignore
+        items = [("index", info)] * len(actions)
+
+    to_retry: List[Tuple[bytes, bytes]] = []
+    errors: List[Dict[str, Any]] = []
+    for (action, source), (op_type, info) in zip(actions, items):
+        status = info.get("status", 500)
+        if 200 <= status < 300:
+            continue
+        if retry and status in _BULK_RETRY_STATUSES:
+            to_retry.append((action, source))
+        else:
+            # Include the original document like parallel_bulk does
+            errors.append(
+                {op_type: {**info, "data": serializer.loads(source.decode("utf-8"))}}
+            )
+    return to_retry, errors
+
+
+def _write_dead_letter(
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]],
+    errors: List[Dict[str, Any]],
+    serializer: Any,
+) -> None:
+    """
+    Appends the errors of documents that failed to index to dead_letter,
+    or raises them in a BulkIndexError if there is no dead_letter.
+    """
+    if dead_letter is None:
+        raise BulkIndexError(f"{len(errors)} document(s) failed to index.", errors)
+    if isinstance(dead_letter, list):
+        dead_letter.extend(errors)
+    else:
+        with open(dead_letter, "a", encoding="utf-8") as f:
+            f.writelines(serializer.dumps(error) + "\n" for error in errors)
 
-    return DataFrame(os_client, os_dest_index)
+
+def _chunk_bulk_actions(
+    actions: Iterable[Tuple[bytes, bytes]],
+    chunksize: int,
+    thread_count: int,
+    max_chunk_bytes: Optional[int],
+) -> Generator[List[Tuple[bytes, bytes]], None, None]:
+    """
+    Groups encoded (action, source) pairs into bulk requests. Requests
+    have chunksize / thread_count documents and at most 100MiB like
+    parallel_bulk, or are only limited to max_chunk_bytes bytes if set.
+    """
+    if max_chunk_bytes is None:
+        chunk_size = max(1, int(chunksize / thread_count))
+        max_chunk_bytes = 100 * 1024 * 1024
+    else:
+        chunk_size = sys.maxsize
+
+    chunk: List[Tuple[bytes, bytes]] = []
+    chunk_bytes = 0
+    for action, source in actions:
+        # +2 for the new line after both the action and the source
+        size = len(action) + len(source) + 2
+        if chunk and (len(chunk) == chunk_size or chunk_bytes + size > max_chunk_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append((action, source))
+        chunk_bytes += size
+    if chunk:
+        yield chunk
+
+
+def _pandas_to_sources(
+    pd_df: pd.DataFrame, dropna: bool, block_size: int
+) -> Generator[Tuple[Dict[str, Any], str], None, None]:
+    """
+    Yields the '_source' of each row of pd_df with its index as a string.
+
+    Rows are converted a block of block_size rows at a time with each
+    column converted to a list of Python values at once, rather than
+    creating a pandas.Series per row. Missing values are found for the
+    whole block when dropping them.
+    """
+    columns = list(pd_df.columns)
+    for start in range(0, len(pd_df), block_size):
+        block = pd_df.iloc[start : start + block_size]
+        ids = [str(id) for id in block.index]
+        rows: Iterable[Tuple[Any, ...]] = (
+            zip(*(block.iloc[:, i].tolist() for i in range(len(columns))))
+            if columns
+            else [()] * len(block)
+        )
+
+        if not dropna:
+            for id, row in zip(ids, rows):
+                yield dict(zip(columns, row)), id
+            continue
+
+        notna = block.notna().to_numpy()
+        complete = notna.all(axis=1).tolist()
+        for id, row, row_complete, row_notna in zip(ids, rows, complete, notna):
+            if row_complete:
+                yield dict(zip(columns, row)), id
+            else:
+                yield {
+                    column: value
+                    for column, value, keep in zip(columns, row, row_notna)
+                    if keep
+                }, id
 
 
 def opensearch_to_pandas(
-    oml_df: DataFrame, show_progress: bool = False
+    oml_df: DataFrame,
+    show_progress: bool = False,
+    parallelism: int = 1,
+    use_docvalue_fields: bool = False,
+    prefetch: int = 0,
+    adaptive_page_size: bool = False,
 ) -> pd.DataFrame:
     """
     Convert an opensearch_py_ml.Dataframe to a pandas.DataFrame
@@ -257,6 +918,14 @@ def opensearch_to_pandas(
         The source opensearch_py_ml.Dataframe referencing the OpenSearch index
     show_progress: bool
         Output progress of option to stdout? By default, False.
+    parallelism: int
+        Number of slices to scan the index with concurrently. By default, 1.
+    use_docvalue_fields: bool
+        Read numeric, boolean, date and keyword columns from doc values rather than '_source'? By default, False.
+    prefetch: int
+        Number of pages of results to fetch in the background while the current one is converted. By default, 0.
+    adaptive_page_size: bool
+        Size each page of results from the size of the documents rather than using a fixed page size? By default, False.
 
     Returns
     -------
@@ -305,7 +974,13 @@ def opensearch_to_pandas(
     --------
     opensearch_py_ml.pandas_to_opensearch: Create an opensearch_py_ml.Dataframe from pandas.DataFrame
     """
-    return oml_df.to_pandas(show_progress=show_progress)
+    return oml_df.to_pandas(
+        show_progress=show_progress,
+        parallelism=parallelism,
+        use_docvalue_fields=use_docvalue_fields,
+        prefetch=prefetch,
+        adaptive_page_size=adaptive_page_size,
+    )
 
 
 def csv_to_opensearch(  # type: ignore
@@ -371,6 +1046,17 @@ def csv_to_opensearch(  # type: ignore
     low_memory: bool = _DEFAULT_LOW_MEMORY,
     memory_map=False,
     float_precision=None,
+    # OpenSearch bulk indexing
+    thread_count: int = 4,
+    queue_size: int = 4,
+    max_chunk_bytes: Optional[int] = None,
+    max_retries: int = 0,
+    initial_backoff: float = 2,
+    max_backoff: float = 600,
+    dead_letter: Optional[Union[List[Dict[str, Any]], str, "os.PathLike[str]"]] = None,
+    os_bulk_tuning: bool = False,
+    os_force_merge: bool = False,
+    os_verify_mapping_compatibility: bool = True,
 ) -> "DataFrame":
     """
     Read a comma-separated values (csv) file into opensearch_py_ml.DataFrame (i.e. an OpenSearch index).
@@ -397,6 +1083,29 @@ def csv_to_opensearch(  # type: ignore
         Dict of columns: es_type to override default os datatype mappings
     chunksize
         number of csv rows to read before bulk index into OpenSearch
+    thread_count: int, default 4
+        Number of threads sending bulk requests
+    queue_size: int, default 4
+        Number of parsed chunks and of bulk requests that can wait to be indexed.
+        Chunks are parsed on a separate thread while earlier ones are indexed, so this
+        bounds the memory used when parsing is faster than indexing
+    max_chunk_bytes: int, default None
+        Maximum size in bytes of each bulk request, see pandas_to_opensearch
+    max_retries: int, default 0
+        Number of times documents rejected with a 429 or 503 status are retried
+    initial_backoff: float, default 2
+        Seconds to wait before the first retry, doubled for every later retry
+    max_backoff: float, default 600
+        Maximum number of seconds to wait before a retry
+    dead_letter: list or path, default None
+        Where documents that failed to index are written, see pandas_to_opensearch
+    os_bulk_tuning: bool, default 'False'
+        Disable refreshes and replicas of os_dest_index while indexing, see pandas_to_opensearch
+    os_force_merge: bool, default 'False'
+        Force merge os_dest_index once indexing succeeded
+    os_verify_mapping_compatibility: bool, default 'True'
+        * True: Verify that the schema of every chunk matches the OpenSearch index schema
+        * False: Do not verify schema
 
     Other Parameters
     ----------------
@@ -538,20 +1247,65 @@ def csv_to_opensearch(  # type: ignore
     # read csv in chunks to pandas DataFrame and dump to opensearch_py_ml DataFrame (and OpenSearch)
     reader = pd.read_csv(filepath_or_buffer, **kwargs)
 
-    first_write = True
-    for chunk in reader:
-        pandas_to_opensearch(
-            chunk,
-            os_client,
-            os_dest_index,
-            chunksize=chunksize,
-            os_refresh=os_refresh,
-            os_dropna=os_dropna,
-            os_type_overrides=os_type_overrides,
-            # es_if_exists should be 'append' except on the first call to pandas_to_opensearch()
-            os_if_exists=(os_if_exists if first_write else "append"),
-        )
-        first_write = False
+    # Chunks are parsed on their own thread while earlier chunks are serialized
+    # and indexed. The index is set up from the first chunk, then every chunk
+    # is fed to one bulk
+    chunks = yield_from_threads([reader], max_queue_size=queue_size)
+    try:
+        first_chunk = next(chunks, None)
+        if first_chunk is not None:
+            os_mapping = _setup_os_index(
+                first_chunk,
+                os_client,  # type: ignore
+                os_dest_index,
+                os_if_exists,
+                os_type_overrides,
+                os_verify_mapping_compatibility,
+            )
+
+            def verified_chunks() -> Generator[pd.DataFrame, None, None]:
+                yield first_chunk
+                for chunk in chunks:
+                    # Chunks may infer different dtypes, check them without a request
+                    if os_mapping is not None:
+                        verify_mapping_compatibility(
+                            oml_mapping=FieldMappings._generate_os_mappings(
+                                chunk, os_type_overrides
+                            ),
+                            os_mapping=os_mapping,
+                            os_type_overrides=os_type_overrides,
+                        )
+                    yield chunk
+
+            with _bulk_tuning(
+                os_client,  # type: ignore
+                os_dest_index,
+                os_bulk_tuning,
+                os_force_merge,
+            ):
+                _bulk_index(
+                    verified_chunks(),
+                    os_client,  # type: ignore
+                    os_dest_index,
+                    os_dropna=os_dropna,
+                    use_pandas_index_for_os_ids=True,
+                    thread_count=thread_count,
+                    chunksize=kwargs["chunksize"],
+                    max_chunk_bytes=max_chunk_bytes,
+                    queue_size=queue_size,
+                    max_retries=max_retries,
+                    initial_backoff=initial_backoff,
+                    max_backoff=max_backoff,
+                    dead_letter=dead_letter,
+                )
+
+            if os_refresh:
+                os_client.indices.refresh(index=os_dest_index)  # type: ignore
+    finally:
+        # Stops the parsing thread if indexing failed part way through
+        chunks.close()
+        # The mappings of the index may have changed
+        FieldMappings.cache.invalidate(os_client)  # type: ignore
 
     # Now create an opensearch_py_ml.DataFrame that references the new index
     return DataFrame(os_client, os_index_pattern=os_dest_index)
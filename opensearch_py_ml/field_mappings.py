@@ -23,7 +23,11 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import hashlib
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -50,6 +54,11 @@ from pandas.core.dtypes.common import (
 )
 from pandas.core.dtypes.inference import is_list_like
 
+from opensearch_py_ml.common import (
+    DEFAULT_FIELD_MAPPINGS_CACHE_SIZE,
+    DEFAULT_FIELD_MAPPINGS_CACHE_TTL,
+)
+
 if TYPE_CHECKING:
     from numpy.typing import DTypeLike
     from opensearchpy import OpenSearch
@@ -84,6 +93,7 @@ class Field(NamedTuple):
     is_aggregatable: bool
     is_scripted: bool
     aggregatable_os_field_name: str
+    os_ignore_above: Optional[int] = None
 
     @property
     def is_numeric(self) -> bool:
@@ -135,6 +145,147 @@ class Field(NamedTuple):
         return np.float64(np.NaN)
 
 
+class _CacheEntry(NamedTuple):
+    added: float
+    capabilities: pd.DataFrame
+
+
+class FieldMappingsCache:
+    """
+    Process-wide cache of the capability matrix of FieldMappings, keyed by
+    the cluster, the credentials of the client and the index pattern.
+    Creating many DataFrames on the same indices, with any client connected
+    to the same hosts with the same credentials, then only requests and
+    processes their mappings once.
+
+    The cache is disabled by default, set 'ttl' to enable it. It's opt-in
+    because mappings changed by other processes, e.g. a new field, would
+    only be seen once entries expire, whereas without the cache every new
+    DataFrame sees the current mappings. Entries expire 'ttl' seconds after
+    they're added and the least recently used entries are evicted beyond
+    'max_size'. Clients with different credentials never see each other's
+    mappings. Every entry of a cluster, whatever the credentials, is
+    invalidated when opensearch_py_ml writes to it, other changes to mappings
+    are seen once entries expire or are invalidated explicitly.
+
+    Examples
+    --------
+    >>> from opensearch_py_ml.field_mappings import FieldMappings
+    >>> FieldMappings.cache.ttl = 300
+    >>> FieldMappings.cache.invalidate()
+    >>> FieldMappings.cache.ttl = 0
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_FIELD_MAPPINGS_CACHE_TTL,
+        max_size: int = DEFAULT_FIELD_MAPPINGS_CACHE_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        # Entries are keyed by (cluster, credentials, index pattern)
+        self._entries: "OrderedDict[Tuple[str, str, str], _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cluster_key(client: "OpenSearch") -> str:
+        """Identity of the cluster of client, from the hosts it connects to"""
+        transport = getattr(client, "transport", None)
+        return repr(getattr(transport, "hosts", id(client)))
+
+    @staticmethod
+    def _credentials_key(client: "OpenSearch") -> str:
+        """
+        Identity of the credentials of client, a digest of the options its
+        connections were created with (http_auth, api_key, headers, client
+        certificates...) so the credentials themselves aren't kept as keys.
+        """
+        transport = getattr(client, "transport", None)
+        options = getattr(transport, "kwargs", {})
+        connection_class = getattr(transport, "connection_class", None)
+        description = FieldMappingsCache._describe((connection_class, options))
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _describe(value: Any, depth: int = 0) -> str:
+        # Objects like auth signers are described by their attributes rather
+        # than their id, which a later object could reuse
+        if isinstance(value, (str, bytes, int, float, bool, type, type(None))):
+            return repr(value)
+        if depth >= 4:
+            return type(value).__qualname__
+        if isinstance(value, Mapping):
+            items = sorted(
+                (repr(key), FieldMappingsCache._describe(item, depth + 1))
+                for key, item in value.items()
+            )
+            return f"{{{', '.join(f'{key}: {item}' for key, item in items)}}}"
+        if isinstance(value, (list, tuple, set, frozenset)):
+            parts = [FieldMappingsCache._describe(item, depth + 1) for item in value]
+            if isinstance(value, (set, frozenset)):
+                parts.sort()
+            return f"{type(value).__qualname__}({', '.join(parts)})"
+        attributes = getattr(value, "__dict__", None)
+        if attributes is None:
+            return repr(value)
+        return f"{type(value).__qualname__}{FieldMappingsCache._describe(attributes, depth + 1)}"
+
+    @staticmethod
+    def _key(client: "OpenSearch", index_pattern: str) -> Tuple[str, str, str]:
+        return (
+            FieldMappingsCache._cluster_key(client),
+            FieldMappingsCache._credentials_key(client),
+            index_pattern,
+        )
+
+    def get(self, client: "OpenSearch", index_pattern: str) -> Optional[pd.DataFrame]:
+        """Returns the cached capability matrix, or None if it's missing or expired"""
+        if self.ttl <= 0:
+            return None
+        key = FieldMappingsCache._key(client, index_pattern)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.added >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.capabilities
+
+    def put(
+        self, client: "OpenSearch", index_pattern: str, capabilities: pd.DataFrame
+    ) -> None:
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        key = FieldMappingsCache._key(client, index_pattern)
+        entry = _CacheEntry(added=time.monotonic(), capabilities=capabilities)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        client: Optional["OpenSearch"] = None,
+        index_pattern: Optional[str] = None,
+    ) -> None:
+        """
+        Removes the entries of index_pattern on the cluster of client, for
+        any credentials, every entry of the cluster if index_pattern is None,
+        or every entry if client is None.
+        """
+        with self._lock:
+            if client is None:
+                self._entries.clear()
+                return
+            cluster_key = FieldMappingsCache._cluster_key(client)
+            for key in list(self._entries):
+                if key[0] == cluster_key and index_pattern in (None, key[2]):
+                    del self._entries[key]
+
+
 class FieldMappings:
     """
     General purpose to manage OpenSearch to/from pandas mappings
@@ -157,8 +308,20 @@ class FieldMappings:
         is_scripted                 - is the field a scripted_field?
         aggregatable_os_field_name  - either os_field_name (if aggregatable),
                                       or os_field_name.keyword (if exists) or None
+        os_ignore_above             - OpenSearch ignore_above of keyword fields (or None)
+
+    cache: FieldMappingsCache
+        Capability matrices of recently created FieldMappings, disabled
+        unless its 'ttl' is set
+
+    The rows of _mappings_capabilities are also kept as Field records indexed by
+    display name and by OpenSearch field name, so per-field lookups don't go
+    through the DataFrame. The records are rebuilt lazily whenever
+    _mappings_capabilities is replaced.
     """
 
+    cache = FieldMappingsCache()
+
     OS_DTYPE_TO_PD_DTYPE: Dict[str, str] = {
         "text": "object",
         "keyword": "object",
@@ -187,6 +350,7 @@ class FieldMappings:
         "is_aggregatable",
         "is_scripted",
         "aggregatable_os_field_name",
+        "os_ignore_above",
     ]
 
     def __init__(
@@ -211,33 +375,81 @@ class FieldMappings:
                 f"or index_pattern {client} {index_pattern}",
             )
 
-        get_mapping = client.indices.get_mapping(index=index_pattern)
-        if not get_mapping:  # dict is empty
-            raise ValueError(
-                f"Can not get mapping for {index_pattern} "
-                f"check indexes exist and client has permission to get mapping."
+        capabilities = FieldMappings.cache.get(client, index_pattern)
+        if capabilities is None:
+            get_mapping = client.indices.get_mapping(index=index_pattern)
+            if not get_mapping:  # dict is empty
+                raise ValueError(
+                    f"Can not get mapping for {index_pattern} "
+                    f"check indexes exist and client has permission to get mapping."
+                )
+
+            # Get all fields (including all nested) and then all field_caps
+            ignore_above: Dict[str, int] = {}
+            all_fields = FieldMappings._extract_fields_from_mapping(
+                get_mapping, ignore_above=ignore_above
             )
+            all_fields_caps = client.field_caps(index=index_pattern, fields="*")
 
-        # Get all fields (including all nested) and then all field_caps
-        all_fields = FieldMappings._extract_fields_from_mapping(get_mapping)
-        all_fields_caps = client.field_caps(index=index_pattern, fields="*")
+            # Get top level (not sub-field multifield) mappings
+            source_fields = FieldMappings._extract_fields_from_mapping(
+                get_mapping, source_only=True
+            )
 
-        # Get top level (not sub-field multifield) mappings
-        source_fields = FieldMappings._extract_fields_from_mapping(
-            get_mapping, source_only=True
-        )
+            # Populate capability matrix of fields
+            capabilities = FieldMappings._create_capability_matrix(
+                all_fields, source_fields, all_fields_caps, ignore_above
+            )
+            FieldMappings.cache.put(client, index_pattern, capabilities)
 
-        # Populate capability matrix of fields
-        self._mappings_capabilities = FieldMappings._create_capability_matrix(
-            all_fields, source_fields, all_fields_caps
-        )
+        # Cached matrices are shared, so each instance works on its own copy
+        self._mappings_capabilities = capabilities.copy()
 
         if display_names is not None:
             self.display_names = display_names
 
+    @property
+    def _mappings_capabilities(self) -> pd.DataFrame:
+        return self._capability_matrix
+
+    @_mappings_capabilities.setter
+    def _mappings_capabilities(self, capability_matrix: pd.DataFrame) -> None:
+        self._capability_matrix = capability_matrix
+        self._fields: Optional[List[Field]] = None
+        self._fields_by_display_name: Dict[str, Field] = {}
+        self._fields_by_os_field_name: Dict[str, Field] = {}
+
+    def _field_records(self) -> List[Field]:
+        """
+        Returns
+        -------
+        A list of Field records, one per row of the capability matrix in display
+        name order. The lookup dicts by display name and OpenSearch field name are
+        filled in at the same time.
+        """
+        if self._fields is None:
+            capability_matrix = self._capability_matrix
+            fields = [
+                Field(*row)
+                for row in zip(
+                    capability_matrix.index,
+                    *(
+                        capability_matrix[label].tolist()
+                        for label in FieldMappings.column_labels
+                    ),
+                )
+            ]
+            for field in fields:
+                self._fields_by_display_name.setdefault(field.column, field)
+                self._fields_by_os_field_name.setdefault(field.os_field_name, field)
+            self._fields = fields
+        return self._fields
+
     @staticmethod
     def _extract_fields_from_mapping(
-        mappings: Dict[str, Any], source_only: bool = False
+        mappings: Dict[str, Any],
+        source_only: bool = False,
+        ignore_above: Optional[Dict[str, int]] = None,
     ) -> Dict[str, str]:
         """
         Extract all field names and types from a mapping.
@@ -298,6 +510,8 @@ class FieldMappings:
         ----------
         mappings: dict
             Return from get_mapping
+        ignore_above: dict, optional
+            Filled in with the 'ignore_above' setting of the fields that have one
 
         Returns
         -------
@@ -333,6 +547,8 @@ class FieldMappings:
                             )
                         else:
                             fields[field_name] = (field_type, date_format)
+                        if ignore_above is not None and "ignore_above" in x:
+                            ignore_above.setdefault(field_name, x["ignore_above"])
                     elif a == "properties" or (not source_only and a == "fields"):
                         flatten(x[a], name)
                     elif not (
@@ -359,7 +575,9 @@ class FieldMappings:
         return fields
 
     @staticmethod
-    def _create_capability_matrix(all_fields, source_fields, all_fields_caps):
+    def _create_capability_matrix(
+        all_fields, source_fields, all_fields_caps, ignore_above=None
+    ):
         """
         {
           "fields": {
@@ -389,7 +607,7 @@ class FieldMappings:
         """
         all_fields_caps_fields = all_fields_caps["fields"]
 
-        capability_matrix = {}
+        capability_matrix: Dict[str, Dict[str, Any]] = {}
 
         for field, field_caps in all_fields_caps_fields.items():
             if field in all_fields:
@@ -405,17 +623,18 @@ class FieldMappings:
                     scripted = False
                     aggregatable_os_field_name = None  # this is populated later
 
-                    caps = [
-                        os_field_name,
-                        _source,
-                        os_dtype,
-                        os_date_format,
-                        pd_dtype,
-                        is_searchable,
-                        is_aggregatable,
-                        scripted,
-                        aggregatable_os_field_name,
-                    ]
+                    caps = {
+                        "os_field_name": os_field_name,
+                        "is_source": _source,
+                        "os_dtype": os_dtype,
+                        "os_date_format": os_date_format,
+                        "pd_dtype": pd_dtype,
+                        "is_searchable": is_searchable,
+                        "is_aggregatable": is_aggregatable,
+                        "is_scripted": scripted,
+                        "aggregatable_os_field_name": aggregatable_os_field_name,
+                        "os_ignore_above": (ignore_above or {}).get(field),
+                    }
 
                     capability_matrix[field] = caps
 
@@ -432,38 +651,32 @@ class FieldMappings:
                             UserWarning,
                         )
 
-        capability_matrix_df = pd.DataFrame.from_dict(
-            capability_matrix, orient="index", columns=FieldMappings.column_labels
-        )
-
-        def find_aggregatable(row, df):
-            # convert series to dict so we can add 'aggregatable_os_field_name'
-            row_as_dict = row.to_dict()
-            if not row_as_dict["is_aggregatable"]:
-                # if not aggregatable, then try field.keyword
-                os_field_name_keyword = row.os_field_name + ".keyword"
-                try:
-                    series = df.loc[df.os_field_name == os_field_name_keyword]
-                    if not series.empty and series.is_aggregatable.squeeze():
-                        row_as_dict["aggregatable_os_field_name"] = (
-                            os_field_name_keyword
-                        )
-                    else:
-                        row_as_dict["aggregatable_os_field_name"] = None
-                except KeyError:
-                    row_as_dict["aggregatable_os_field_name"] = None
+        # Only source fields are displayed, so only they need an aggregatable field name.
+        source_capabilities = {
+            field: caps
+            for field, caps in capability_matrix.items()
+            if caps["is_source"]
+        }
+        for field, caps in source_capabilities.items():
+            if caps["is_aggregatable"]:
+                caps["aggregatable_os_field_name"] = field
             else:
-                row_as_dict["aggregatable_os_field_name"] = row_as_dict["os_field_name"]
-
-            return pd.Series(data=row_as_dict)
-
-        # add aggregatable_os_field_name column by applying action to each row
-        capability_matrix_df = capability_matrix_df.apply(
-            find_aggregatable, args=(capability_matrix_df,), axis="columns"
+                # if not aggregatable, then try field.keyword
+                keyword_caps = capability_matrix.get(field + ".keyword")
+                if keyword_caps is not None and keyword_caps["is_aggregatable"]:
+                    caps["aggregatable_os_field_name"] = field + ".keyword"
+
+        # Build the matrix a column at a time rather than from rows
+        fields = sorted(source_capabilities)
+        columns: Dict[str, Any] = {
+            label: [source_capabilities[field][label] for field in fields]
+            for label in FieldMappings.column_labels
+        }
+        # Keep ignore_above as int or None rather than float with NaN
+        columns["os_ignore_above"] = pd.Series(
+            columns["os_ignore_above"], index=fields, dtype=object
         )
-
-        # return just source fields (as these are the only ones we display)
-        return capability_matrix_df[capability_matrix_df.is_source].sort_index()
+        return pd.DataFrame(columns, index=fields)
 
     @classmethod
     def _os_dtype_to_pd_dtype(cls, os_dtype):
@@ -594,19 +807,17 @@ class FieldMappings:
 
         raise KeyError if the field_name doesn't exist in the mapping, or isn't aggregatable
         """
-        mapping: Optional[pd.Series] = None
-
-        try:
-            mapping = self._mappings_capabilities.loc[display_name]
-        except KeyError:
+        self._field_records()
+        field = self._fields_by_display_name.get(display_name)
+        if field is None:
             raise KeyError(
                 f"Can not get aggregatable field name for invalid display name {display_name}"
-            ) from None
+            )
 
-        if mapping is not None and mapping.aggregatable_os_field_name is None:
+        if field.aggregatable_os_field_name is None:
             warnings.warn(f"Aggregations not supported for '{display_name}'")
 
-        return mapping.aggregatable_os_field_name
+        return field.aggregatable_os_field_name
 
     def aggregatable_field_names(self) -> Dict[str, str]:
         """
@@ -654,11 +865,12 @@ class FieldMappings:
         Returns
         -------
         str
-            A string (for date fields) containing the date format for the field
+            A string (for date fields) containing the date format for the field,
+            or None if the field has no date format or does not exist
         """
-        return self._mappings_capabilities.loc[
-            self._mappings_capabilities.os_field_name == os_field_name
-        ].os_date_format.squeeze()
+        self._field_records()
+        field = self._fields_by_os_field_name.get(os_field_name)
+        return None if field is None else field.os_date_format
 
     def field_name_pd_dtype(self, os_field_name: str) -> str:
         """
@@ -676,13 +888,12 @@ class FieldMappings:
         KeyError
             If os_field_name does not exist in mapping
         """
-        if os_field_name not in self._mappings_capabilities.os_field_name:
+        self._field_records()
+        field = self._fields_by_os_field_name.get(os_field_name)
+        if field is None:
             raise KeyError(f"os_field_name {os_field_name} does not exist")
 
-        pd_dtype = self._mappings_capabilities.loc[
-            self._mappings_capabilities.os_field_name == os_field_name
-        ].pd_dtype.squeeze()
-        return pd_dtype
+        return field.pd_dtype
 
     def add_scripted_field(
         self, scripted_field_name: str, display_name: str, pd_dtype: str
@@ -694,7 +905,7 @@ class FieldMappings:
             )
 
         # ['os_field_name', 'is_source', 'os_dtype', 'os_date_format', 'pd_dtype', 'is_searchable',
-        # 'is_aggregatable', 'is_scripted', 'aggregatable_os_field_name']
+        # 'is_aggregatable', 'is_scripted', 'aggregatable_os_field_name', 'os_ignore_above']
 
         capabilities = {
             display_name: [
@@ -707,6 +918,7 @@ class FieldMappings:
                 True,
                 True,
                 scripted_field_name,
+                None,
             ]
         }
 
@@ -731,12 +943,34 @@ class FieldMappings:
         A list of Field Mappings
 
         """
-        source_fields: List[Field] = []
-        for column, row in self._mappings_capabilities.iterrows():
-            row = row.to_dict()
-            row["column"] = column
-            source_fields.append(Field(**row))
-        return source_fields
+        return list(self._field_records())
+
+    def docvalue_fields(self) -> List[Field]:
+        """
+        This method returns the Field Mappings for fields that can be read from
+        doc values rather than '_source' i.e. numeric, boolean, date and keyword
+        fields that have doc values of their own (not scripted fields or text
+        fields aggregated via a keyword sub-field). Keyword fields that set
+        'ignore_above' are left out, longer values have no doc values.
+
+        Returns
+        -------
+        A list of Field Mappings
+
+        """
+        return [
+            field
+            for field in self.all_source_fields()
+            if not field.is_scripted
+            and field.is_aggregatable
+            and field.aggregatable_os_field_name == field.os_field_name
+            and (
+                field.is_numeric
+                or field.is_bool
+                or field.is_timestamp
+                or (field.os_dtype == "keyword" and field.os_ignore_above is None)
+            )
+        ]
 
     def groupby_source_fields(self, by: List[str]) -> Tuple[List[Field], List[Field]]:
         """
@@ -754,13 +988,11 @@ class FieldMappings:
         """
         groupby_fields: Dict[str, Field] = {}
         aggregatable_fields: List[Field] = []
-        for column, row in self._mappings_capabilities.iterrows():
-            row = row.to_dict()
-            row["column"] = column
-            if column not in by:
-                aggregatable_fields.append(Field(**row))
+        for field in self._field_records():
+            if field.column not in by:
+                aggregatable_fields.append(field)
             else:
-                groupby_fields[column] = Field(**row)
+                groupby_fields[field.column] = field
 
         # Maintain groupby order as given input
         return [groupby_fields[column] for column in by], aggregatable_fields
@@ -777,16 +1009,14 @@ class FieldMappings:
             List of source fields where pd_dtype == (int64 or float64 or bool or timestamp)
         os_date_formats: list of str (can be None)
             List of os date formats for os_field
-
-        TODO - not very efficient, but unless called per row, this should be ok
         """
         pd_dtypes = []
         os_field_names = []
         os_date_formats = []
-        for index, row in self._mappings_capabilities.iterrows():
-            pd_dtype = row["pd_dtype"]
-            os_field_name = row["os_field_name"]
-            os_date_format = row["os_date_format"]
+        for field in self._field_records():
+            pd_dtype = field.pd_dtype
+            os_field_name = field.os_field_name
+            os_date_format = field.os_date_format
 
             if is_integer_dtype(pd_dtype) or is_float_dtype(pd_dtype):
                 pd_dtypes.append(np.dtype(pd_dtype))
@@ -807,12 +1037,11 @@ class FieldMappings:
         return pd_dtypes, os_field_names, os_date_formats
 
     def get_field_names(self, include_scripted_fields: bool = True) -> List[str]:
-        if include_scripted_fields:
-            return self._mappings_capabilities.os_field_name.to_list()
-
-        return self._mappings_capabilities[  # noqa: E712
-            self._mappings_capabilities.is_scripted == False
-        ].os_field_name.to_list()
+        return [
+            field.os_field_name
+            for field in self._field_records()
+            if include_scripted_fields or not field.is_scripted
+        ]
 
     def _get_display_names(self):
         return self._mappings_capabilities.index.to_list()
@@ -836,13 +1065,12 @@ class FieldMappings:
             Index: Display name
             Values: pd_dtype as np.dtype
         """
-        pd_dtypes = self._mappings_capabilities["pd_dtype"]
-
-        # Set name of the returned series as None
-        pd_dtypes.name = None
-
-        # Convert return from 'str' to 'np.dtype'
-        return pd_dtypes.apply(lambda x: np.dtype(x))
+        # Convert from 'str' to 'np.dtype'
+        return pd.Series(
+            [field.np_dtype for field in self._field_records()],
+            index=self._mappings_capabilities.index,
+            dtype=object,
+        )
 
     def os_dtypes(self):
         """
@@ -883,15 +1111,12 @@ class FieldMappings:
         )
 
     def get_renames(self):
-        # return dict of renames { old_name: new_name, ... } (inefficient)
-        renames = {}
-
-        for display_name in self.display_names:
-            field_name = self._mappings_capabilities.loc[display_name].os_field_name
-            if field_name != display_name:
-                renames[field_name] = display_name
-
-        return renames
+        # return dict of renames { old_name: new_name, ... }
+        return {
+            field.os_field_name: field.column
+            for field in self._field_records()
+            if field.os_field_name != field.column
+        }
 
 
 def verify_mapping_compatibility(
@@ -609,7 +609,11 @@ class DataFrameGroupBy(GroupBy):
 
         """
         return self._query_compiler.aggs_groupby(
-            by=self._by, pd_aggs=["quantile"], quantiles=q, numeric_only=True
+            by=self._by,
+            pd_aggs=["quantile"],
+            dropna=self._dropna,
+            quantiles=q,
+            numeric_only=True,
         )
 
     def aggregate(
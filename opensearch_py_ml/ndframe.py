@@ -636,8 +636,10 @@ class NDFrame(ABC):
         """
         return self._query_compiler.mad(numeric_only=numeric_only)
 
-    def _hist(self, num_bins: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        return self._query_compiler._hist(num_bins)
+    def _hist(
+        self, num_bins: int, single_pass: bool = False
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        return self._query_compiler._hist(num_bins, single_pass=single_pass)
 
     def describe(self) -> pd.DataFrame:
         """
@@ -677,7 +679,14 @@ class NDFrame(ABC):
         return self._query_compiler.describe()
 
     @abstractmethod
-    def to_pandas(self, show_progress: bool = False) -> pd.DataFrame:
+    def to_pandas(
+        self,
+        show_progress: bool = False,
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
+    ) -> pd.DataFrame:
         raise NotImplementedError
 
     @abstractmethod
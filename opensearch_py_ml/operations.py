@@ -24,15 +24,23 @@
 #  under the License.
 
 import copy
+import json
+import threading
+import time
 import warnings
-from collections import defaultdict
 from datetime import datetime
+from io import StringIO
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
     Dict,
     Generator,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     TextIO,
@@ -42,13 +50,26 @@ from typing import (
 
 import numpy as np
 import pandas as pd  # type: ignore
+from opensearchpy.exceptions import TransportError
+from pandas.compat._optional import import_optional_dependency  # type: ignore
+from pandas.io.common import get_handle  # type: ignore
 
 from opensearch_py_ml.actions import PostProcessingAction
 from opensearch_py_ml.common import (
+    DEFAULT_HIST_BUCKETS_PER_BIN,
+    DEFAULT_MAX_RESULT_WINDOW,
     DEFAULT_PAGINATION_SIZE,
+    DEFAULT_PIT_KEEP_ALIVE,
     DEFAULT_PROGRESS_REPORTING_NUM_ROWS,
+    DEFAULT_SCROLL_KEEP_ALIVE,
     DEFAULT_SEARCH_SIZE,
+    DEFAULT_SEARCH_TARGET_BYTES,
+    DEFAULT_SEARCH_TARGET_SECONDS,
+    MIN_SEARCH_SIZE,
+    PIT_MIN_OS_VERSION,
     SortOrder,
+    _cluster_version,
+    _cluster_version_async,
     build_pd_series,
     opensearch_date_to_pandas_date,
 )
@@ -65,10 +86,18 @@ from opensearch_py_ml.tasks import (
     SizeTask,
     TailTask,
 )
-from opensearch_py_ml.utils import MEAN_ABSOLUTE_DEVIATION, STANDARD_DEVIATION, VARIANCE
+from opensearch_py_ml.utils import (
+    MEAN_ABSOLUTE_DEVIATION,
+    STANDARD_DEVIATION,
+    VARIANCE,
+    yield_from_tasks,
+    yield_from_threads,
+)
 
 if TYPE_CHECKING:
+    import pyarrow as pa  # type: ignore
     from numpy.typing import DTypeLike
+    from opensearchpy import AsyncOpenSearch, OpenSearch
 
     from opensearch_py_ml.arithmetics import ArithmeticSeries
     from opensearch_py_ml.field_mappings import Field
@@ -161,9 +190,9 @@ class Operations:
     def count(self, query_compiler: "QueryCompiler") -> pd.Series:
         query_params, post_processing = self._resolve_tasks(query_compiler)
 
-        # Opensearch _count is very efficient and so used to return results here. This means that
-        # data frames that have restricted size or sort params will not return valid results
-        # (_count doesn't support size).
+        # Counts are the doc_count of an 'exists' filter agg per field, all in a single
+        # size=0 search. This means that data frames that have restricted size or sort
+        # params will not return valid results (aggs are computed over every hit).
         # Longer term we may fall back to pandas, but this may result in loading all index into memory.
         if self._size(query_params, post_processing) is not None:
             raise NotImplementedError(
@@ -173,17 +202,62 @@ class Operations:
 
         # Only return requested field_names
         fields = query_compiler.get_field_names(include_scripted_fields=False)
+        if not fields:
+            return build_pd_series(data={}, index=fields)
 
-        counts = {}
-        for field in fields:
-            body = Query(query_params.query)
-            body.exists(field, must=True)
+        response = query_compiler._client.search(
+            index=query_compiler._index_pattern,
+            size=0,
+            body=self._count_body(query_params.query, fields),
+        )
+        return self._count_series(response, fields)
+
+    def index_count_and_count(
+        self, query_compiler: "QueryCompiler", field: str
+    ) -> Tuple[int, Optional[pd.Series]]:
+        """
+        Returns index_count(field) and count() with both searches sent in a
+        single _msearch. The counts are None when count() isn't supported,
+        i.e. when the size is restricted.
+        """
+        query_params, post_processing = self._resolve_tasks(query_compiler)
+
+        size = self._size(query_params, post_processing)
+        if size is not None:
+            return size, None
+
+        fields = query_compiler.get_field_names(include_scripted_fields=False)
+        if not fields:
+            return self.index_count(query_compiler, field), build_pd_series(
+                data={}, index=fields
+            )
+
+        index_body = Query(query_params.query)
+        index_body.exists(field, must=True)
+        index_response, count_response = self._msearch(
+            query_compiler,
+            [
+                {**index_body.to_search_body(), "track_total_hits": True},
+                self._count_body(query_params.query, fields),
+            ],
+        )
+        index_count: int = index_response["hits"]["total"]["value"]
+        return index_count, self._count_series(count_response, fields)
 
-            field_exists_count = query_compiler._client.count(
-                index=query_compiler._index_pattern, body=body.to_count_body()
-            )["count"]
-            counts[field] = field_exists_count
+    @staticmethod
+    def _count_body(query: Query, fields: List[str]) -> Dict[str, Any]:
+        # Counts are the doc_count of an 'exists' filter agg per field
+        body = Query(query)
+        for field in fields:
+            body.exists_agg(name=f"count_{field}", field=field)
+        return body.to_search_body()
 
+    @staticmethod
+    def _count_series(response: Dict[str, Any], fields: List[str]) -> pd.Series:
+        counts = {
+            field: response["aggregations"][f"count_{field}"]["doc_count"]
+            for field in fields
+        }
         return build_pd_series(data=counts, index=fields)
 
     def _metric_agg_series(
@@ -213,8 +287,10 @@ class Operations:
         return self._terms_aggs(query_compiler, "terms", os_size)
 
     def hist(
-        self, query_compiler: "QueryCompiler", bins: int
+        self, query_compiler: "QueryCompiler", bins: int, single_pass: bool = False
     ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        if single_pass:
+            return self._variable_width_hist_aggs(query_compiler, bins)
         return self._hist_aggs(query_compiler, bins)
 
     def idx(
@@ -332,6 +408,40 @@ class Operations:
         Used to calculate metric aggregations
         https://opensearch.org/docs/latest/opensearch/metric-agg/
 
+        See _metric_aggs_request for the parameters.
+
+        Returns
+        -------
+            A dictionary which contains all aggregations calculated.
+        """
+        body, unpack_response = self._metric_aggs_request(
+            query_compiler,
+            pd_aggs,
+            numeric_only=numeric_only,
+            is_dataframe_agg=is_dataframe_agg,
+            os_mode_size=os_mode_size,
+            dropna=dropna,
+            percentiles=percentiles,
+        )
+        response = query_compiler._client.search(
+            index=query_compiler._index_pattern, size=0, body=body
+        )
+        return unpack_response(response)
+
+    def _metric_aggs_request(
+        self,
+        query_compiler: "QueryCompiler",
+        pd_aggs: List[str],
+        numeric_only: Optional[bool] = None,
+        is_dataframe_agg: bool = False,
+        os_mode_size: Optional[int] = None,
+        dropna: bool = True,
+        percentiles: Optional[List[float]] = None,
+    ) -> Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Builds the search body of a metric aggregation, so it can be sent on its own
+        or batched with other searches by _msearch
+
         Parameters
         ----------
         query_compiler:
@@ -351,7 +461,11 @@ class Operations:
 
         Returns
         -------
-            A dictionary which contains all aggregations calculated.
+        body: dict
+            The size=0 search body
+        unpack_response: callable
+            Turns the search response into a dictionary which contains all
+            aggregations calculated.
         """
         query_params, post_processing = self._resolve_tasks(query_compiler)
 
@@ -408,10 +522,6 @@ class Operations:
                         field=field.aggregatable_os_field_name,
                     )
 
-        response = query_compiler._client.search(
-            index=query_compiler._index_pattern, size=0, body=body.to_search_body()
-        )
-
         """
         Results are like (for 'sum', 'min')
 
@@ -420,15 +530,50 @@ class Operations:
         min    1.000205e+02        0.000000e+00   0.000000e+00               0
         """
 
-        return self._unpack_metric_aggs(
-            fields=fields,
-            os_aggs=os_aggs,
-            pd_aggs=pd_aggs,
-            response=response,
-            numeric_only=numeric_only,
-            is_dataframe_agg=is_dataframe_agg,
-            percentiles=percentiles,
-        )
+        def unpack_response(response: Dict[str, Any]) -> Dict[str, Any]:
+            return self._unpack_metric_aggs(
+                fields=fields,
+                os_aggs=os_aggs,
+                pd_aggs=pd_aggs,
+                response=response,
+                numeric_only=numeric_only,
+                is_dataframe_agg=is_dataframe_agg,
+                percentiles=percentiles,
+            )
+
+        return body.to_search_body(), unpack_response
+
+    @staticmethod
+    def _msearch(
+        query_compiler: "QueryCompiler", bodies: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Sends independent size=0 search bodies against the index pattern in one
+        _msearch round trip and returns their responses in the same order. A
+        single body is better sent as a plain search.
+
+        Raises
+        ------
+        TransportError
+            If any of the searches failed
+        """
+        searches: List[Dict[str, Any]] = []
+        for body in bodies:
+            searches.extend(({}, {**body, "size": 0}))
+
+        responses: List[Dict[str, Any]] = query_compiler._client.msearch(
+            index=query_compiler._index_pattern, body=searches
+        )["responses"]
+        for response in responses:
+            # _msearch reports failures per search rather than failing the request
+            if "error" in response:
+                error = response["error"]
+                raise TransportError(
+                    response.get("status", 500),
+                    error.get("type") if isinstance(error, dict) else error,
+                    error,
+                )
+        return responses
 
     def _terms_aggs(
         self, query_compiler: "QueryCompiler", func: str, os_size: int
@@ -571,6 +716,86 @@ class Operations:
         df_weights = pd.DataFrame(data=weights)
         return df_bins, df_weights
 
+    def _variable_width_hist_aggs(
+        self, query_compiler: "QueryCompiler", num_bins: int
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Single search alternative to _hist_aggs, which needs a min/max search to
+        size the histogram intervals before it can run the histogram search.
+
+        A variable_width_histogram agg clusters the values of each field into many
+        more buckets than num_bins, and reports the exact min and max of each cluster.
+        The equal width bins are then laid out between the overall min and max, and
+        each cluster's doc_count is split between the bins it overlaps as if its
+        values were spread evenly. Bin edges are exact, weights are approximate for
+        clusters that straddle a bin edge.
+        """
+        query_params, post_processing = self._resolve_tasks(query_compiler)
+
+        size = self._size(query_params, post_processing)
+        if size is not None:
+            raise NotImplementedError(
+                f"Can not count field matches if size is set {size}"
+            )
+
+        numeric_source_fields = query_compiler._mappings.numeric_source_fields()
+
+        body = Query(query_params.query)
+        for field in numeric_source_fields:
+            body.variable_width_hist_aggs(
+                field, field, num_bins * DEFAULT_HIST_BUCKETS_PER_BIN
+            )
+
+        response = query_compiler._client.search(
+            index=query_compiler._index_pattern, size=0, body=body.to_search_body()
+        )
+
+        bins: Dict[str, "np.ndarray[Any, np.dtype[Any]]"] = {}
+        weights: Dict[str, "np.ndarray[Any, np.dtype[Any]]"] = {}
+
+        for field in numeric_source_fields:
+            # in case of series let plotting.oml_hist_series thrown an exception
+            if not response.get("aggregations"):
+                continue
+
+            buckets = response["aggregations"][field]["buckets"]
+            mins = np.array([bucket["min"] for bucket in buckets], dtype=np.float64)
+            maxs = np.array([bucket["max"] for bucket in buckets], dtype=np.float64)
+            counts = np.array(
+                [bucket["doc_count"] for bucket in buckets], dtype=np.float64
+            )
+
+            # in case of dataframe, throw warning that field is excluded
+            if not buckets or mins.min() == maxs.max():
+                warnings.warn(
+                    f"{field} has no meaningful histogram interval and will be excluded. "
+                    f"All values 0.",
+                    UserWarning,
+                )
+                continue
+
+            edges = np.linspace(mins.min(), maxs.max(), num_bins + 1)
+
+            # Number of values below each edge, with clusters spread evenly between
+            # their min and max (single valued clusters are a step at their value)
+            widths = maxs - mins
+            spread = np.divide(
+                edges[:, None] - mins,
+                widths,
+                out=(edges[:, None] > mins).astype(np.float64),
+                where=widths > 0,
+            )
+            below = (np.clip(spread, 0.0, 1.0) * counts).sum(axis=1)
+            # the last bin is closed, as with numpy.histogram
+            below[-1] = counts.sum()
+
+            bins[field] = edges
+            weights[field] = np.diff(below)
+
+        df_bins = pd.DataFrame(data=bins)
+        df_weights = pd.DataFrame(data=weights)
+        return df_bins, df_weights
+
     def _unpack_metric_aggs(
         self,
         fields: List["Field"],
@@ -609,165 +834,335 @@ class Operations:
         -------
             a dictionary on which agg caluculations are done.
         """
-        results: Dict[str, Any] = {}
-        percentile_values: List[float] = []
-        agg_value: Any
+        return self._metric_aggs_unpacker(
+            fields=fields,
+            os_aggs=os_aggs,
+            pd_aggs=pd_aggs,
+            numeric_only=numeric_only,
+            percentiles=percentiles,
+            is_dataframe_agg=is_dataframe_agg,
+            is_groupby=is_groupby,
+        )(response.get("aggregations", {}))
 
+    @staticmethod
+    def _metric_aggs_plan(
+        fields: List["Field"],
+        os_aggs: Sequence[Union[str, Tuple[str, Union[str, List[float]]]]],
+        pd_aggs: List[str],
+        numeric_only: Optional[bool],
+        is_dataframe_agg: bool = False,
+    ) -> List[Tuple["Field", List["_MetricAggStep"]]]:
+        """
+        Works out once which aggregation results to read for each field and how to
+        convert them, see _metric_aggs_unpacker.
+        """
+        plan: List[Tuple["Field", List[_MetricAggStep]]] = []
         for field in fields:
-            values = []
+            steps = []
             for os_agg, pd_agg in zip(os_aggs, pd_aggs):
                 # is_dataframe_agg is used to differentiate agg() and an aggregation called through .mean()
                 # If the field and agg aren't compatible we add a NaN/NaT for agg
                 # If the field and agg aren't compatible we don't add NaN/NaT for an aggregation called through .mean()
+                # Explicit condition for mad to add NaN because it doesn't support bool
                 if not field.is_os_agg_compatible(os_agg):
-                    if is_dataframe_agg and not numeric_only:
-                        values.append(field.nan_value)
-                    elif not is_dataframe_agg and numeric_only is False:
-                        values.append(field.nan_value)
-                    # Explicit condition for mad to add NaN because it doesn't support bool
-                    elif is_dataframe_agg and numeric_only:
-                        if pd_agg == MEAN_ABSOLUTE_DEVIATION:
-                            values.append(field.nan_value)
+                    if (
+                        (is_dataframe_agg and not numeric_only)
+                        or (not is_dataframe_agg and numeric_only is False)
+                        or (
+                            is_dataframe_agg
+                            and numeric_only
+                            and pd_agg == MEAN_ABSOLUTE_DEVIATION
+                        )
+                    ):
+                        steps.append(
+                            _MetricAggStep(
+                                os_agg,
+                                pd_agg,
+                                None,
+                                field.nan_value,
+                                False,
+                                False,
+                                None,
+                            )
+                        )
                     continue
 
-                if isinstance(os_agg, tuple):
-                    agg_value = response["aggregations"][
-                        f"{os_agg[0]}_{field.os_field_name}"
-                    ]
+                agg_name = (
+                    f"{os_agg[0]}_{field.os_field_name}"
+                    if isinstance(os_agg, tuple)
+                    else f"{os_agg}_{field.os_field_name}"
+                )
+                steps.append(
+                    _MetricAggStep(
+                        os_agg,
+                        pd_agg,
+                        agg_name,
+                        field.nan_value,
+                        field.is_timestamp,
+                        field.is_bool or field.is_numeric,
+                        field.np_dtype.type,
+                    )
+                )
+            plan.append((field, steps))
+        return plan
 
-                    # Pull multiple values from 'percentiles' result.
-                    if os_agg[0] == "percentiles":
-                        agg_value = agg_value["values"]  # Returns dictionary
-                        if pd_agg == "median":
-                            agg_value = agg_value["50.0"]
-                        # Currently Pandas does the same
-                        # If we call quantile it returns the same result as of median.
-                        elif (
-                            pd_agg == "quantile" and is_dataframe_agg and not is_groupby
-                        ):
-                            agg_value = agg_value["50.0"]
-                        else:
-                            # Maintain order of percentiles
-                            if percentiles:
-                                percentile_values = [
-                                    agg_value[str(i)] for i in percentiles
-                                ]
-
-                    if not percentile_values and pd_agg not in ("quantile", "median"):
-                        agg_value = agg_value[os_agg[1]]
-                    # Need to convert 'Population' stddev and variance
-                    # from Opensearch into 'Sample' stddev and variance
-                    # which is what pandas uses.
-                    if os_agg[1] in ("std_deviation", "variance"):
-                        # Neither transformation works with count <=1
-                        count = response["aggregations"][
-                            f"{os_agg[0]}_{field.os_field_name}"
-                        ]["count"]
-
-                        # All of the below calculations result in NaN if count<=1
-                        if count <= 1:
-                            agg_value = np.NaN
+    @classmethod
+    def _metric_aggs_unpacker(
+        cls,
+        fields: List["Field"],
+        os_aggs: Sequence[Union[str, Tuple[str, Union[str, List[float]]]]],
+        pd_aggs: List[str],
+        numeric_only: Optional[bool],
+        percentiles: Optional[Sequence[float]] = None,
+        is_dataframe_agg: bool = False,
+        is_groupby: bool = False,
+        plan: Optional[List[Tuple["Field", List["_MetricAggStep"]]]] = None,
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Returns a function that unpacks the "aggregations" of a response, or a
+        composite aggregation bucket, into the dictionary described in
+        _unpack_metric_aggs. The per field and per agg checks are made once by
+        _metric_aggs_plan, unless a plan is given, rather than in loops over many
+        composite buckets.
+        """
+        metric_plan = (
+            cls._metric_aggs_plan(
+                fields, os_aggs, pd_aggs, numeric_only, is_dataframe_agg
+            )
+            if plan is None
+            else plan
+        )
 
-                        elif os_agg[1] == "std_deviation":
-                            agg_value *= count / (count - 1.0)
+        percentile_keys = [str(i) for i in percentiles] if percentiles else None
+
+        def unpack(aggregations: Dict[str, Any]) -> Dict[str, Any]:
+            results: Dict[str, Any] = {}
+            percentile_values: List[float] = []
+            agg_value: Any
+
+            for field, steps in metric_plan:
+                values = []
+                for (
+                    os_agg,
+                    pd_agg,
+                    agg_name,
+                    nan_value,
+                    is_timestamp,
+                    is_bool_or_numeric,
+                    np_type,
+                ) in steps:
+                    if agg_name is None:
+                        values.append(nan_value)
+                        continue
 
-                        else:  # os_agg[1] == "variance"
-                            # sample_std=\sqrt{\frac{1}{N-1}\sum_{i=1}^N(x_i-\bar{x})^2}
-                            # population_std=\sqrt{\frac{1}{N}\sum_{i=1}^N(x_i-\bar{x})^2}
-                            # sample_std=\sqrt{\frac{N}{N-1}population_std}
-                            agg_value = np.sqrt(
-                                (count / (count - 1.0)) * agg_value * agg_value
-                            )
-                elif os_agg == "mode":
-                    # For terms aggregation buckets are returned
-                    # agg_value will be of type list
-                    agg_value = response["aggregations"][
-                        f"{os_agg}_{field.os_field_name}"
-                    ]["buckets"]
-                else:
-                    agg_value = response["aggregations"][
-                        f"{os_agg}_{field.os_field_name}"
-                    ]["value"]
-
-                if isinstance(agg_value, list):
-                    # include top-terms in the result.
-                    if not agg_value:
-                        # If the all the documents for a field are empty
-                        agg_value = [field.nan_value]
+                    if isinstance(os_agg, tuple):
+                        agg_value = aggregations[agg_name]
+
+                        # Pull multiple values from 'percentiles' result.
+                        if os_agg[0] == "percentiles":
+                            agg_value = agg_value["values"]  # Returns dictionary
+                            if pd_agg == "median":
+                                agg_value = agg_value["50.0"]
+                            # Currently Pandas does the same
+                            # If we call quantile it returns the same result as of median.
+                            elif (
+                                pd_agg == "quantile"
+                                and is_dataframe_agg
+                                and not is_groupby
+                            ):
+                                agg_value = agg_value["50.0"]
+                            else:
+                                # Maintain order of percentiles
+                                if percentile_keys:
+                                    percentile_values = [
+                                        agg_value[key] for key in percentile_keys
+                                    ]
+
+                        if not percentile_values and pd_agg not in (
+                            "quantile",
+                            "median",
+                        ):
+                            agg_value = agg_value[os_agg[1]]
+                        # Need to convert 'Population' stddev and variance
+                        # from Opensearch into 'Sample' stddev and variance
+                        # which is what pandas uses.
+                        if os_agg[1] in ("std_deviation", "variance"):
+                            # Neither transformation works with count <=1
+                            count = aggregations[agg_name]["count"]
+
+                            # All of the below calculations result in NaN if count<=1
+                            if count <= 1:
+                                agg_value = np.NaN
+
+                            elif os_agg[1] == "std_deviation":
+                                agg_value *= count / (count - 1.0)
+
+                            else:  # os_agg[1] == "variance"
+                                # sample_std=\sqrt{\frac{1}{N-1}\sum_{i=1}^N(x_i-\bar{x})^2}
+                                # population_std=\sqrt{\frac{1}{N}\sum_{i=1}^N(x_i-\bar{x})^2}
+                                # sample_std=\sqrt{\frac{N}{N-1}population_std}
+                                agg_value = np.sqrt(
+                                    (count / (count - 1.0)) * agg_value * agg_value
+                                )
+                    elif os_agg == "mode":
+                        # For terms aggregation buckets are returned
+                        # agg_value will be of type list
+                        agg_value = aggregations[agg_name]["buckets"]
                     else:
-                        max_doc_count = agg_value[0]["doc_count"]
-                        # We need only keys which are equal to max_doc_count
-                        # lesser values are ignored
-                        agg_value = [
-                            item["key"]
-                            for item in agg_value
-                            if item["doc_count"] == max_doc_count
-                        ]
-
-                        # Maintain datatype by default because pandas does the same
-                        # text are returned as-is
-                        if field.is_bool or field.is_numeric:
+                        agg_value = aggregations[agg_name]["value"]
+
+                    if isinstance(agg_value, list):
+                        # include top-terms in the result.
+                        if not agg_value:
+                            # If the all the documents for a field are empty
+                            agg_value = [nan_value]
+                        else:
+                            max_doc_count = agg_value[0]["doc_count"]
+                            # We need only keys which are equal to max_doc_count
+                            # lesser values are ignored
                             agg_value = [
-                                field.np_dtype.type(value) for value in agg_value
+                                item["key"]
+                                for item in agg_value
+                                if item["doc_count"] == max_doc_count
                             ]
 
-                # Null usually means there were no results.
-                if not isinstance(agg_value, (list, dict)) and (
-                    agg_value is None or np.isnan(agg_value)
-                ):
-                    if is_dataframe_agg and not numeric_only:
-                        agg_value = np.NaN
-                    elif not is_dataframe_agg and numeric_only is False:
-                        agg_value = np.NaN
-
-                # Cardinality is always either NaN or integer.
-                elif pd_agg in ("nunique", "count"):
-                    agg_value = (
-                        int(agg_value)
-                        if isinstance(agg_value, (int, float))
-                        else np.NaN
-                    )
+                            # Maintain datatype by default because pandas does the same
+                            # text are returned as-is
+                            if is_bool_or_numeric:
+                                agg_value = [np_type(value) for value in agg_value]
 
-                # If this is a non-null timestamp field convert to a pd.Timestamp()
-                elif field.is_timestamp:
-                    if isinstance(agg_value, list):
-                        # convert to timestamp results for mode
-                        agg_value = [
-                            opensearch_date_to_pandas_date(value, field.os_date_format)
-                            for value in agg_value
-                        ]
-                    elif percentile_values:
-                        percentile_values = [
-                            opensearch_date_to_pandas_date(value, field.os_date_format)
-                            for value in percentile_values
-                        ]
-                    else:
-                        assert not isinstance(agg_value, dict)
-                        agg_value = opensearch_date_to_pandas_date(
-                            agg_value, field.os_date_format
+                    # Null usually means there were no results.
+                    if not isinstance(agg_value, (list, dict)) and (
+                        agg_value is None or np.isnan(agg_value)
+                    ):
+                        if is_dataframe_agg and not numeric_only:
+                            agg_value = np.NaN
+                        elif not is_dataframe_agg and numeric_only is False:
+                            agg_value = np.NaN
+
+                    # Cardinality is always either NaN or integer.
+                    elif pd_agg in ("nunique", "count"):
+                        agg_value = (
+                            int(agg_value)
+                            if isinstance(agg_value, (int, float))
+                            else np.NaN
                         )
-                # If numeric_only is False | None then maintain column datatype
-                elif not numeric_only and pd_agg != "quantile":
-                    # we're only converting to bool for lossless aggs like min, max, and median.
-                    if pd_agg in {"max", "min", "median", "sum", "mode"}:
-                        # 'sum' isn't representable with bool, use int64
-                        if pd_agg == "sum" and field.is_bool:
-                            agg_value = np.int64(agg_value)  # type: ignore
-                        else:
-                            agg_value = field.np_dtype.type(agg_value)
 
-                if not percentile_values:
-                    values.append(agg_value)
+                    # If this is a non-null timestamp field convert to a pd.Timestamp()
+                    elif is_timestamp:
+                        if isinstance(agg_value, list):
+                            # convert to timestamp results for mode
+                            agg_value = [
+                                opensearch_date_to_pandas_date(
+                                    value, field.os_date_format
+                                )
+                                for value in agg_value
+                            ]
+                        elif percentile_values:
+                            percentile_values = [
+                                opensearch_date_to_pandas_date(
+                                    value, field.os_date_format
+                                )
+                                for value in percentile_values
+                            ]
+                        else:
+                            assert not isinstance(agg_value, dict)
+                            agg_value = opensearch_date_to_pandas_date(
+                                agg_value, field.os_date_format
+                            )
+                    # If numeric_only is False | None then maintain column datatype
+                    elif not numeric_only and pd_agg != "quantile":
+                        # we're only converting to bool for lossless aggs like min, max, and median.
+                        if pd_agg in {"max", "min", "median", "sum", "mode"}:
+                            # 'sum' isn't representable with bool, use int64
+                            if pd_agg == "sum" and field.is_bool:
+                                agg_value = np.int64(agg_value)  # type: ignore
+                            else:
+                                agg_value = np_type(agg_value)
+
+                    if not percentile_values:
+                        values.append(agg_value)
+
+                # If numeric_only is True and We only have a NaN type field then we check for empty.
+                if values:
+                    results[field.column] = values if len(values) > 1 else values[0]
+                # This only runs when df.quantile() or series.quantile() or
+                # quantile from groupby is called
+                if percentile_values:
+                    results[f"{field.column}"] = percentile_values
+
+            return results
+
+        return unpack
 
-            # If numeric_only is True and We only have a NaN type field then we check for empty.
-            if values:
-                results[field.column] = values if len(values) > 1 else values[0]
-            # This only runs when df.quantile() or series.quantile() or
-            # quantile from groupby is called
-            if percentile_values:
-                results[f"{field.column}"] = percentile_values
+    @staticmethod
+    def _is_single_value_step(step: "_MetricAggStep") -> bool:
+        """
+        Whether step reads a single number from each bucket that isn't converted
+        to a timestamp, so _metric_agg_column can read it for a page of buckets.
+        """
+        if step.agg_name is None or step.os_agg == "mode":
+            return False
+        if isinstance(step.os_agg, tuple) and step.os_agg[0] != "extended_stats":
+            return False
+        return not step.is_timestamp or step.pd_agg in ("nunique", "count")
 
-        return results
+    @staticmethod
+    def _metric_agg_column(
+        buckets: Sequence[Dict[str, Any]],
+        step: "_MetricAggStep",
+        numeric_only: Optional[bool],
+    ) -> "np.ndarray[Any, np.dtype[Any]]":
+        """
+        Reads the value of a single value step, see _is_single_value_step, from
+        every bucket into an array converted the same way as _metric_aggs_unpacker
+        converts each value in 'dataframe' mode.
+        """
+        assert step.agg_name is not None
+        agg_name = step.agg_name
+        os_agg = step.os_agg
+        result = os_agg[1] if isinstance(os_agg, tuple) else "value"
+
+        # None results, when there were no values, are read as NaN
+        values: "np.ndarray[Any, np.dtype[Any]]" = np.empty(len(buckets))
+        values[:] = [bucket[agg_name][result] for bucket in buckets]
+
+        # Convert 'Population' stddev and variance into 'Sample' ones,
+        # see _metric_aggs_unpacker
+        if result in ("std_deviation", "variance"):
+            counts = np.empty(len(buckets))
+            counts[:] = [bucket[agg_name]["count"] for bucket in buckets]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = counts / (counts - 1.0)
+            if result == "std_deviation":
+                values *= ratios
+            else:
+                values = np.sqrt(ratios * values * values)
+            values[counts <= 1] = np.NaN
+
+        is_nan = np.isnan(values)
+        if step.pd_agg in ("nunique", "count"):
+            np_type: Any = np.int64
+        elif not numeric_only and step.pd_agg in ("max", "min", "sum"):
+            np_type = (
+                np.int64
+                if step.pd_agg == "sum" and step.np_type is np.bool_
+                else step.np_type
+            )
+        else:
+            return values
+
+        # Like a list of numbers and NaN, the column stays float unless
+        # booleans are mixed with NaN
+        if not is_nan.any():
+            return values.astype(np_type)
+        if np.issubdtype(np_type, np.integer):
+            values = np.trunc(values)
+        if np.issubdtype(np_type, np.number):
+            return values
+        column = values.astype(object)
+        column[~is_nan] = values[~is_nan].astype(np_type)
+        return column
 
     def quantile(
         self,
@@ -806,6 +1201,39 @@ class Operations:
             return df if is_dataframe else df.transpose().iloc[0]
 
     def unique(self, query_compiler: "QueryCompiler") -> pd.Series:
+        # Pages are copied into a buffer that doubles in size when it is full, so
+        # collecting them stays linear in the number of unique values
+        values: Optional["np.ndarray[Any, np.dtype[Any]]"] = None
+        num_values = 0
+        for page in self._unique_pages(query_compiler):
+            if values is None:
+                values = np.empty(max(len(page), DEFAULT_PAGINATION_SIZE), page.dtype)
+            elif num_values + len(page) > len(values):
+                grown = np.empty(
+                    max(2 * len(values), num_values + len(page)), values.dtype
+                )
+                grown[:num_values] = values[:num_values]
+                values = grown
+            values[num_values : num_values + len(page)] = page
+            num_values += len(page)
+
+        assert values is not None  # the last page is always yielded
+        return values[:num_values].copy()
+
+    def iter_unique(
+        self, query_compiler: "QueryCompiler"
+    ) -> Generator[Any, None, None]:
+        for page in self._unique_pages(query_compiler):
+            yield from page
+
+    def _unique_pages(
+        self, query_compiler: "QueryCompiler"
+    ) -> Generator["np.ndarray[Any, np.dtype[Any]]", None, None]:
+        """
+        Yields the unique values of a Series one composite aggregation page at a
+        time, as arrays of the field's pd_dtype. The last page is always yielded,
+        even if it is empty.
+        """
         query_params, _ = self._resolve_tasks(query_compiler)
         body = Query(query_params.query)
 
@@ -822,14 +1250,13 @@ class Operations:
         # Composite aggregation
         body.composite_agg_start(size=DEFAULT_PAGINATION_SIZE, name="unique_buckets")
 
-        unique_buckets: List[Any] = sum(
-            self.bucket_generator(query_compiler, body, agg_name="unique_buckets"), []  # type: ignore
-        )
-
-        return np.array(
-            [bucket["key"][bucket_key] for bucket in unique_buckets],
-            dtype=field.pd_dtype,
-        )
+        for buckets in self._bucket_pages(
+            query_compiler, body, agg_name="unique_buckets"
+        ):
+            yield np.array(
+                [bucket["key"][bucket_key] for bucket in buckets],
+                dtype=field.pd_dtype,
+            )
 
     def aggs_groupby(
         self,
@@ -876,9 +1303,6 @@ class Operations:
 
         by_fields, agg_fields = query_compiler._mappings.groupby_source_fields(by=by)
 
-        # Used defaultdict to avoid initialization of columns with lists
-        results: Dict[Any, List[Any]] = defaultdict(list)
-
         if numeric_only:
             agg_fields = [
                 field for field in agg_fields if (field.is_numeric or field.is_bool)
@@ -951,60 +1375,139 @@ class Operations:
             size=DEFAULT_PAGINATION_SIZE, name="groupby_buckets", dropna=dropna
         )
 
-        for buckets in self.bucket_generator(
+        # Work out once how to read each bucket. Aggs reading a single number
+        # are filled into typed arrays a page of buckets at a time, the others
+        # are unpacked bucket by bucket.
+        plan = self._metric_aggs_plan(
+            fields=agg_fields,
+            os_aggs=os_aggs,
+            pd_aggs=pd_aggs,
+            numeric_only=numeric_only,
+            # We set 'True' here because we want the value
+            # unpacking to always be in 'dataframe' mode.
+            is_dataframe_agg=True,
+        )
+        # quantiles with several percentiles get a row per percentile in each group
+        rows_per_bucket = (
+            len_percentiles if pd_aggs == ["quantile"] and len_percentiles > 1 else 1
+        )
+        column_plan = [
+            (
+                field,
+                steps,
+                rows_per_bucket == 1 and all(map(self._is_single_value_step, steps)),
+            )
+            for field, steps in plan
+        ]
+        unpacked_plan = [
+            (field, steps) for field, steps, is_single in column_plan if not is_single
+        ]
+        unpack_bucket = self._metric_aggs_unpacker(
+            fields=[field for field, _ in unpacked_plan],
+            os_aggs=os_aggs,
+            pd_aggs=pd_aggs,
+            numeric_only=numeric_only,
+            percentiles=percentiles,
+            is_dataframe_agg=True,
+            is_groupby=True,
+            plan=unpacked_plan,
+        )
+        by_keys = [
+            (by_field.column, f"groupby_{by_field.column}") for by_field in by_fields
+        ]
+
+        # The dtype of keys, which may be missing, is left to pandas to infer
+        keys: Dict[Any, List[Any]] = {column: [] for column, _ in by_keys}
+        # The pages of each step of the fields read a page at a time
+        pages: Dict[str, List[List["np.ndarray[Any, np.dtype[Any]]"]]] = {
+            field.column: [[] for _ in steps]
+            for field, steps, is_single in column_plan
+            if is_single
+        }
+        unpacked: Dict[str, List[Any]] = {}
+        agg_columns: Dict[str, List[str]] = {}
+        for buckets in self._bucket_pages(
             query_compiler, body, agg_name="groupby_buckets"
         ):
-            # We recieve response row-wise
-            for bucket in buckets:
-                # groupby columns are added to result same way they are returned
-                for by_field in by_fields:
-                    bucket_key = bucket["key"][f"groupby_{by_field.column}"]
-
-                    # Datetimes always come back as integers, convert to pd.Timestamp()
-                    if by_field.is_timestamp and isinstance(bucket_key, int):
-                        bucket_key = pd.to_datetime(bucket_key, unit="ms")
-
-                    if pd_aggs == ["quantile"] and len_percentiles > 1:
-                        bucket_key = [bucket_key] * len_percentiles
-
-                    results[by_field.column].extend(
-                        bucket_key if isinstance(bucket_key, list) else [bucket_key]
-                    )
+            # groupby columns are added to result same way they are returned
+            for column, key_name in by_keys:
+                page_keys = [bucket["key"][key_name] for bucket in buckets]
+                if rows_per_bucket > 1:
+                    page_keys = [
+                        key for key in page_keys for _ in range(rows_per_bucket)
+                    ]
+                keys[column].extend(page_keys)
 
-                agg_calculation = self._unpack_metric_aggs(
-                    fields=agg_fields,
-                    os_aggs=os_aggs,
-                    pd_aggs=pd_aggs,
-                    response={"aggregations": bucket},
-                    numeric_only=numeric_only,
-                    percentiles=percentiles,
-                    # We set 'True' here because we want the value
-                    # unpacking to always be in 'dataframe' mode.
-                    is_dataframe_agg=True,
-                    is_groupby=True,
+            # to construct index with quantiles
+            if rows_per_bucket > 1:
+                assert percentiles is not None
+                keys.setdefault(None, []).extend(
+                    [i / 100 for i in percentiles] * len(buckets)
                 )
 
-                # to construct index with quantiles
-                if pd_aggs == ["quantile"] and percentiles and len_percentiles > 1:
-                    results[None].extend([i / 100 for i in percentiles])
+            for field, steps, is_single in column_plan:
+                if is_single:
+                    for step, step_pages in zip(steps, pages[field.column]):
+                        step_pages.append(
+                            self._metric_agg_column(buckets, step, numeric_only)
+                        )
 
-                # Process the calculated agg values to response
+            if not unpacked_plan:
+                continue
+
+            # Process the calculated agg values to response
+            for agg_calculation in map(unpack_bucket, buckets):
                 for key, value in agg_calculation.items():
                     if not isinstance(value, list):
-                        results[key].append(value)
+                        unpacked.setdefault(key, []).append(value)
                         continue
-                    elif isinstance(value, list) and pd_aggs == ["quantile"]:
-                        results[f"{key}_{pd_aggs[0]}"].extend(value)
+
+                    if key not in agg_columns:
+                        agg_columns[key] = (
+                            [f"{key}_{pd_aggs[0]}"]
+                            if pd_aggs == ["quantile"]
+                            else [f"{key}_{pd_agg}" for pd_agg in pd_aggs]
+                        )
+                    if pd_aggs == ["quantile"]:
+                        unpacked.setdefault(agg_columns[key][0], []).extend(value)
                     else:
-                        for pd_agg, val in zip(pd_aggs, value):
-                            results[f"{key}_{pd_agg}"].append(val)
+                        for agg_column, val in zip(agg_columns[key], value):
+                            unpacked.setdefault(agg_column, []).append(val)
 
+        results: Dict[Any, Any] = dict(keys)
+        # Datetimes always come back as integers, convert to pd.Timestamp()
+        for by_field in by_fields:
+            if by_field.is_timestamp:
+                results[by_field.column] = pd.to_datetime(
+                    np.asarray(keys[by_field.column], dtype=object), unit="ms"
+                )
+
+        # Agg columns are added in the order of fields, as headers expects, and
+        # named by their position until then
+        agg_values: List[Any] = []
+        for field, _, is_single in column_plan:
+            if is_single:
+                agg_values.extend(map(np.concatenate, pages[field.column]))
+            else:
+                agg_values.extend(
+                    unpacked[name]
+                    for name in agg_columns.get(field.column, [field.column])
+                    if name in unpacked
+                )
+        results.update(enumerate(agg_values))
+
+        by_levels = list(by)
         if pd_aggs == ["quantile"] and len_percentiles > 1:
             # by never holds None by default, we make an exception
             # here to maintain output same as pandas, also mypy complains
             by = by + [None]  # type: ignore
 
-        agg_df = pd.DataFrame(results).set_index(by).sort_index()
+        agg_df = pd.DataFrame(results).set_index(by)
+        # Composite buckets come back sorted by their keys, and quantiles within a
+        # group stay in the order they were requested in, as with pandas. Only
+        # missing keys need moving, composite puts them first and pandas last.
+        if not dropna:
+            agg_df = agg_df.sort_index(level=by_levels, sort_remaining=False)
 
         if is_dataframe_agg:
             # Convert header columns to MultiIndex
@@ -1015,6 +1518,17 @@ class Operations:
 
         return agg_df
 
+    @classmethod
+    def _bucket_pages(
+        cls, query_compiler: "QueryCompiler", body: "Query", agg_name: str
+    ) -> Generator[Sequence[Dict[str, Any]], None, None]:
+        """
+        Yields every page of composite aggregation buckets from bucket_generator,
+        including the last one which bucket_generator returns rather than yields.
+        """
+        last_page = yield from cls.bucket_generator(query_compiler, body, agg_name)
+        yield last_page
+
     @staticmethod
     def bucket_generator(
         query_compiler: "QueryCompiler", body: "Query", agg_name: str
@@ -1216,21 +1730,31 @@ class Operations:
                 f"Can not count field matches if size is set {size}"
             )
 
-        df1 = self.aggs(
-            query_compiler=query_compiler,
-            pd_aggs=["count", "mean", "min", "max", STANDARD_DEVIATION],
-            numeric_only=True,
+        # The metric and the percentiles aggregations are independent, so both
+        # searches are sent in a single _msearch
+        pd_aggs = ["count", "mean", "min", "max", STANDARD_DEVIATION]
+        aggs_body, unpack_aggs = self._metric_aggs_request(
+            query_compiler, pd_aggs, numeric_only=True, is_dataframe_agg=True
         )
-        df2 = self.quantile(
-            query_compiler=query_compiler,
-            pd_aggs=["quantile"],
-            quantiles=[0.25, 0.5, 0.75],
-            is_dataframe=True,
+        quantile_body, unpack_quantile = self._metric_aggs_request(
+            query_compiler,
+            ["quantile"],
             numeric_only=True,
+            percentiles=[quantile_to_percentile(x) for x in (0.25, 0.5, 0.75)],
+        )
+        aggs_response, quantile_response = self._msearch(
+            query_compiler, [aggs_body, quantile_body]
         )
 
-        # Convert [.25,.5,.75] to ["25%", "50%", "75%"]
-        df2 = df2.set_index([["25%", "50%", "75%"]])
+        df1 = pd.DataFrame(unpack_aggs(aggs_response), index=pd_aggs, dtype=np.float64)
+        quantile_results = unpack_quantile(quantile_response)
+        # Label the rows ["25%", "50%", "75%"] rather than [.25,.5,.75]
+        df2 = pd.DataFrame(
+            quantile_results,
+            index=["25%", "50%", "75%"],
+            columns=quantile_results.keys(),
+            dtype=np.float64,
+        )
 
         df = pd.concat([df1, df2])
 
@@ -1265,11 +1789,23 @@ class Operations:
             )
 
     def to_pandas(
-        self, query_compiler: "QueryCompiler", show_progress: bool = False
+        self,
+        query_compiler: "QueryCompiler",
+        show_progress: bool = False,
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
     ) -> pd.DataFrame:
         df_list: List[pd.DataFrame] = []
         i = 0
-        for df in self.search_yield_pandas_dataframes(query_compiler=query_compiler):
+        for df in self.search_yield_pandas_dataframes(
+            query_compiler=query_compiler,
+            parallelism=parallelism,
+            use_docvalue_fields=use_docvalue_fields,
+            prefetch=prefetch,
+            adaptive_page_size=adaptive_page_size,
+        ):
             if show_progress:
                 i = i + df.shape[0]
                 if i % DEFAULT_PROGRESS_REPORTING_NUM_ROWS == 0:
@@ -1291,13 +1827,395 @@ class Operations:
         show_progress: bool = False,
         **kwargs: Union[bool, str],
     ) -> Optional[str]:
-        return self.to_pandas(  # type: ignore[no-any-return]
-            query_compiler=query_compiler, show_progress=show_progress
-        ).to_csv(**kwargs)
+        """
+        Writes the results of the search as CSV a batch at a time, so only one
+        batch is held in memory rather than the whole result. The header is
+        written with the first batch and the following batches are appended.
+
+        Parameters
+        ----------
+        query_compiler:
+            An instance of query_compiler
+        show_progress:
+            Output progress to stdout
+        kwargs:
+            pandas.DataFrame.to_csv arguments. The file is opened once using
+            path_or_buf, mode, encoding and compression (e.g. 'gzip' or 'zstd',
+            inferred from the file extension by default)
+
+        Returns
+        -------
+        If path_or_buf is None, returns the resulting csv format as a string. Otherwise returns None.
+        """
+        path_or_buf = kwargs.pop("path_or_buf", None)
+        mode = kwargs.pop("mode", "w")
+        encoding = kwargs.pop("encoding", None)
+        compression = kwargs.pop("compression", "infer")
+        header = kwargs.pop("header", True)
+
+        buf = StringIO() if path_or_buf is None else path_or_buf
+        with get_handle(
+            buf, mode, encoding=encoding, compression=compression
+        ) as handles:
+            i = 0
+            for df in self.search_yield_pandas_dataframes(
+                query_compiler=query_compiler
+            ):
+                df.to_csv(handles.handle, header=header if i == 0 else False, **kwargs)
+
+                i = i + df.shape[0]
+                if show_progress and i % DEFAULT_PROGRESS_REPORTING_NUM_ROWS == 0:
+                    print(f"{datetime.now()}: read {i} rows")
+
+            # Write the header of an empty result
+            if i == 0:
+                query_compiler._empty_pd_ef().to_csv(
+                    handles.handle, header=header, **kwargs
+                )
+
+        if show_progress:
+            print(f"{datetime.now()}: read {i} rows")
+
+        if path_or_buf is None:
+            return buf.getvalue()  # type: ignore[union-attr]
+        return None
+
+    def to_arrow(
+        self,
+        query_compiler: "QueryCompiler",
+        index: bool = True,
+        schema: Optional["pa.Schema"] = None,
+        show_progress: bool = False,
+    ) -> "pa.Table":
+        """
+        Reads the results of the search into a pyarrow.Table. Each batch of
+        hits is converted to a RecordBatch as it arrives, so the results are
+        only held once, in Arrow memory.
+
+        Parameters
+        ----------
+        query_compiler:
+            An instance of query_compiler
+        index:
+            Include the index as a column
+        schema:
+            Fields overriding the types derived from the mappings
+        show_progress:
+            Output progress to stdout
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        pa = import_optional_dependency("pyarrow")
+
+        arrow_schema = self._arrow_schema(query_compiler, index, schema)
+        batches = list(
+            self._arrow_record_batches(
+                query_compiler, arrow_schema, index, show_progress
+            )
+        )
+        return pa.Table.from_batches(batches, schema=arrow_schema)
+
+    def to_parquet(
+        self,
+        query_compiler: "QueryCompiler",
+        path: str,
+        row_group_size: Optional[int] = None,
+        compression: Optional[str] = "snappy",
+        index: bool = True,
+        schema: Optional["pa.Schema"] = None,
+        show_progress: bool = False,
+    ) -> None:
+        """
+        Writes the results of the search to a Parquet file a batch at a time,
+        so only one batch is held in memory rather than the whole result.
+
+        Parameters
+        ----------
+        query_compiler:
+            An instance of query_compiler
+        path:
+            File path or writable file-like object
+        row_group_size:
+            Maximum number of rows in a row group. Every batch of hits is
+            written as one or more row groups.
+        compression:
+            Parquet compression codec e.g. 'snappy', 'gzip', 'zstd' or None
+        index:
+            Include the index as a column
+        schema:
+            Fields overriding the types derived from the mappings
+        show_progress:
+            Output progress to stdout
+        """
+        import_optional_dependency("pyarrow")
+        from pyarrow import parquet
+
+        arrow_schema = self._arrow_schema(query_compiler, index, schema)
+        with parquet.ParquetWriter(
+            path, arrow_schema, compression=compression
+        ) as writer:
+            for batch in self._arrow_record_batches(
+                query_compiler, arrow_schema, index, show_progress
+            ):
+                writer.write_batch(batch, row_group_size=row_group_size)
+
+    @staticmethod
+    def _arrow_schema(
+        query_compiler: "QueryCompiler",
+        index: bool,
+        schema: Optional["pa.Schema"] = None,
+    ) -> "pa.Schema":
+        """
+        Derives the Arrow schema of the results from the mapped dtypes.
+
+        Numeric, boolean and date fields keep their types. Any other field,
+        e.g. keyword, text or geo_point, is a string. Fields in schema
+        override these, for example with list types for multi-valued fields.
+        """
+        pa = import_optional_dependency("pyarrow")
+
+        df = query_compiler._empty_pd_ef()
+        index_dtype = "object"
+        if (
+            query_compiler._index.is_source_field
+            and query_compiler._index.os_index_field in query_compiler.dtypes
+        ):
+            index_dtype = query_compiler.dtypes[query_compiler._index.os_index_field]
+        df.index = pd.Index([], dtype=index_dtype)
+
+        arrow_schema = pa.Schema.from_pandas(df, preserve_index=index)
+        for i, field in enumerate(arrow_schema):
+            if pa.types.is_null(field.type):
+                arrow_schema = arrow_schema.set(i, field.with_type(pa.string()))
+
+        for field in schema or []:
+            i = arrow_schema.get_field_index(field.name)
+            if i == -1:
+                raise KeyError(f"Schema field [{field.name}] is not in the DataFrame.")
+            arrow_schema = arrow_schema.set(i, field)
+        return arrow_schema
+
+    def _arrow_record_batches(
+        self,
+        query_compiler: "QueryCompiler",
+        arrow_schema: "pa.Schema",
+        index: bool,
+        show_progress: bool = False,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        pa = import_optional_dependency("pyarrow")
+
+        # Multi-valued fields are lists for some documents only, so cells are
+        # wrapped into lists for list fields and stored as JSON in strings.
+        list_fields = [
+            field.name
+            for field in arrow_schema
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type)
+        ]
+        string_fields = [
+            field.name
+            for field in arrow_schema
+            if pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+        ]
+
+        i = 0
+        for df in self.search_yield_pandas_dataframes(query_compiler=query_compiler):
+            for name in list_fields:
+                if name in df:
+                    df[name] = df[name].map(_arrow_list_value)
+            for name in string_fields:
+                if name in df:
+                    df[name] = df[name].map(_arrow_string_value)
+
+            yield pa.RecordBatch.from_pandas(
+                df, schema=arrow_schema, preserve_index=index
+            )
+
+            i = i + df.shape[0]
+            if show_progress and i % DEFAULT_PROGRESS_REPORTING_NUM_ROWS == 0:
+                print(f"{datetime.now()}: read {i} rows")
+
+        if show_progress:
+            print(f"{datetime.now()}: read {i} rows")
 
     def search_yield_pandas_dataframes(
-        self, query_compiler: "QueryCompiler", sort_index: Optional["str"] = "_doc"
+        self,
+        query_compiler: "QueryCompiler",
+        sort_index: Optional["str"] = "_doc",
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
     ) -> Generator["pd.DataFrame", None, None]:
+        """
+        Yields the results of the search as a series of pandas.DataFrames.
+
+        Parameters
+        ----------
+        query_compiler:
+            An instance of query_compiler
+        sort_index:
+            Field to sort the documents by when paginating
+        parallelism:
+            Number of independent slices the scan is split into. Each slice
+            is fetched and converted on its own thread and the DataFrames
+            are yielded in the order they complete. Only used for unbounded
+            and unsorted searches (i.e. not after head(), tail() or sort)
+            as slices can't honour a global order or size limit.
+        use_docvalue_fields:
+            Read the fields that have doc values from 'docvalue_fields' rather
+            than '_source', see FieldMappings.docvalue_fields
+        prefetch:
+            Number of pages fetched ahead on a background thread, so the next
+            page is requested while the current one is being converted. Pages
+            are still yielded in order. 0 fetches each page only when it's
+            needed. Not used with parallelism > 1 as each slice is already
+            fetched on its own thread.
+        adaptive_page_size:
+            Resize each page of hits towards a target response size in bytes
+            from the size of the previous page, within the
+            'index.max_result_window' of the indices. Not used with
+            parallelism > 1 as a scroll keeps the size of its first page.
+        """
+        if parallelism < 1:
+            raise ValueError(
+                f"parallelism must be a positive integer, got {parallelism}"
+            )
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be a non-negative integer, got {prefetch}")
+
+        body, result_size, sort_params, hits_to_dataframe = self._search_body(
+            query_compiler, use_docvalue_fields
+        )
+
+        def hits_to_dataframes(
+            hits_generator: Iterator[List[Dict[str, Any]]],
+        ) -> Generator["pd.DataFrame", None, None]:
+            for hits in hits_generator:
+                yield hits_to_dataframe(hits)
+
+        if self._sliced_search(parallelism, result_size, sort_params):
+            yield from yield_from_threads(
+                [
+                    hits_to_dataframes(
+                        _search_yield_sliced_hits(
+                            query_compiler=query_compiler,
+                            body=body,
+                            slice_id=slice_id,
+                            max_slices=parallelism,
+                        )
+                    )
+                    for slice_id in range(parallelism)
+                ],
+                max_queue_size=parallelism,
+            )
+            return
+
+        hits_generator: Iterator[List[Dict[str, Any]]] = _search_yield_hits(
+            query_compiler=query_compiler,
+            body=body,
+            max_number_of_hits=result_size,
+            sort_index=sort_index,
+            adaptive_page_size=adaptive_page_size,
+        )
+        if prefetch > 0:
+            # A single worker keeps the pages in order
+            hits_generator = yield_from_threads(
+                [hits_generator], max_queue_size=prefetch
+            )
+        yield from hits_to_dataframes(hits_generator)
+
+    @staticmethod
+    def _sliced_search(
+        parallelism: int,
+        result_size: Optional[int],
+        sort_params: Optional[Dict[str, str]],
+    ) -> bool:
+        """
+        Whether a search is split into 'parallelism' slices, warns if
+        parallelism > 1 is ignored as the search is sized or sorted.
+        """
+        if parallelism == 1:
+            return False
+        if result_size is not None or sort_params is not None:
+            warnings.warn(
+                f"parallelism={parallelism} is ignored as the DataFrame is limited "
+                f"by head() or tail() or sorted, its results are read in a single "
+                f"search.",
+                UserWarning,
+            )
+            return False
+        return True
+
+    async def search_yield_pandas_dataframes_async(
+        self,
+        query_compiler: "QueryCompiler",
+        os_client: "AsyncOpenSearch",
+        sort_index: Optional["str"] = "_doc",
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+    ) -> AsyncGenerator["pd.DataFrame", None]:
+        """
+        Yields the results of the search as a series of pandas.DataFrames
+        like search_yield_pandas_dataframes, sending the searches with an
+        AsyncOpenSearch client. With parallelism > 1 the slices are searched
+        concurrently on the event loop rather than on threads.
+        """
+        if parallelism < 1:
+            raise ValueError(
+                f"parallelism must be a positive integer, got {parallelism}"
+            )
+
+        body, result_size, sort_params, hits_to_dataframe = self._search_body(
+            query_compiler, use_docvalue_fields
+        )
+
+        hits_generator: AsyncIterator[List[Dict[str, Any]]]
+        if self._sliced_search(parallelism, result_size, sort_params):
+            hits_generator = yield_from_tasks(
+                [
+                    _search_yield_sliced_hits_async(
+                        os_client=os_client,
+                        index_pattern=query_compiler._index_pattern,
+                        body=body,
+                        slice_id=slice_id,
+                        max_slices=parallelism,
+                    )
+                    for slice_id in range(parallelism)
+                ],
+                max_queue_size=parallelism,
+            )
+        else:
+            hits_generator = _search_yield_hits_async(
+                os_client=os_client,
+                index_pattern=query_compiler._index_pattern,
+                body=body,
+                max_number_of_hits=result_size,
+                sort_index=sort_index,
+            )
+
+        try:
+            async for hits in hits_generator:
+                yield hits_to_dataframe(hits)
+        finally:
+            # Async generators aren't closed when they're dropped, so close the
+            # searches (and their PIT or scroll contexts) along with this one
+            await hits_generator.aclose()
+
+    def _search_body(
+        self, query_compiler: "QueryCompiler", use_docvalue_fields: bool
+    ) -> Tuple[
+        Dict[str, Any],
+        Optional[int],
+        Optional[Dict[str, str]],
+        Callable[[List[Dict[str, Any]]], "pd.DataFrame"],
+    ]:
+        """
+        Returns the search body for the documents of query_compiler, the
+        number of documents to return and the sort if they're limited or
+        sorted, and a function converting a page of hits to a pandas.DataFrame.
+        """
         query_params, post_processing = self._resolve_tasks(query_compiler)
 
         result_size, sort_params = Operations._query_params_to_size_and_sort(
@@ -1313,22 +2231,47 @@ class Operations:
 
         # Only return requested field_names and add them to body
         _source = query_compiler.get_field_names(include_scripted_fields=False)
+
+        docvalue_field_names: List[str] = []
+        if use_docvalue_fields:
+            # The index is always read from '_source'
+            docvalue_fields = [
+                field
+                for field in query_compiler._mappings.docvalue_fields()
+                if not (
+                    query_compiler.index.is_source_field
+                    and field.os_field_name == query_compiler.index.os_index_field
+                )
+            ]
+            # Dates are returned in a fixed format whatever their mapping
+            body["docvalue_fields"] = [
+                (
+                    {"field": field.os_field_name, "format": "epoch_millis"}
+                    if field.is_timestamp
+                    else field.os_field_name
+                )
+                for field in docvalue_fields
+            ]
+            docvalue_field_names = [field.os_field_name for field in docvalue_fields]
+            _source = [
+                field_name
+                for field_name in _source
+                if field_name not in docvalue_field_names
+            ]
+
         body["_source"] = _source if _source else False
 
         if sort_params:
             body["sort"] = [sort_params]
 
-        # i = 1
-        for hits in _search_yield_hits(
-            query_compiler=query_compiler,
-            body=body,
-            max_number_of_hits=result_size,
-            sort_index=sort_index,
-        ):
-            df = query_compiler._os_results_to_pandas(hits)
-            df = self._apply_df_post_processing(df, post_processing)
-            # i += 1
-            yield df
+        # Look up how to flatten hits once rather than per page
+        flattening_plan = query_compiler._flattening_plan(docvalue_field_names)
+
+        def hits_to_dataframe(hits: List[Dict[str, Any]]) -> "pd.DataFrame":
+            df = query_compiler._os_results_to_pandas(hits, flattening_plan)
+            return self._apply_df_post_processing(df, post_processing)
+
+        return body, result_size, sort_params, hits_to_dataframe
 
     def index_count(self, query_compiler: "QueryCompiler", field: str) -> int:
         # field is the index field so count values
@@ -1531,11 +2474,44 @@ def quantile_to_percentile(quantile: Union[int, float]) -> float:
     return float(min(100, max(0, quantile * 100)))
 
 
+class _MetricAggStep(NamedTuple):
+    """How to read one aggregation of one field, see _metric_aggs_unpacker"""
+
+    os_agg: Union[str, Tuple[str, Union[str, List[float]]]]
+    pd_agg: str
+    # None if the field doesn't support the agg and nan_value is used instead
+    agg_name: Optional[str]
+    nan_value: Any
+    is_timestamp: bool
+    is_bool_or_numeric: bool
+    np_type: Any
+
+
+def _arrow_list_value(value: Any) -> Any:
+    if isinstance(value, list) or value is None:
+        return value
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return [value]
+
+
+def _arrow_string_value(value: Any) -> Any:
+    if isinstance(value, str) or value is None:
+        return value
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
 def _search_yield_hits(
     query_compiler: "QueryCompiler",
     body: Dict[str, Any],
     max_number_of_hits: Optional[int],
     sort_index: Optional[str] = "_doc",
+    use_pit: Optional[bool] = None,
+    adaptive_page_size: bool = False,
 ) -> Generator[List[Dict[str, Any]], None, None]:
     """
     This is a generator used to initialize point in time API and query the
@@ -1543,6 +2519,11 @@ def _search_yield_hits(
     come in. No empty batches will be yielded, if there are no hits then
     no batches will be yielded instead.
 
+    When a point in time (PIT) is used every page is searched against the
+    same snapshot of the index, so results stay consistent while the index
+    is being written to. The PIT is deleted once the generator is exhausted
+    or closed.
+
     Parameters
     ----------
     query_compiler:
@@ -1552,6 +2533,14 @@ def _search_yield_hits(
     max_number_of_hits: Optional[int]
         Maximum number of documents to yield, set to 'None' to
         yield all documents.
+    sort_index: Optional[str]
+        Field to sort by for 'search_after' pagination
+    use_pit: Optional[bool]
+        Paginate within a point in time. By default, a point in time is
+        used when the OpenSearch cluster supports it.
+    adaptive_page_size: bool
+        Resize each page from the size and latency of the previous one,
+        see _AdaptivePageSize. Only used when 'body' has no 'size'.
 
     Examples
     --------
@@ -1566,12 +2555,20 @@ def _search_yield_hits(
     # Make a copy of 'body' to avoid mutating it outside this function.
     body = body.copy()
 
-    # Use the default search size
-    body.setdefault("size", DEFAULT_SEARCH_SIZE)
-
     client = query_compiler._client
     hits_yielded = 0  # Track the total number of hits yielded.
 
+    # Start from the default search size, adapting it per page if asked to
+    page_size: Optional[_AdaptivePageSize] = None
+    response_size: Optional[_ResponseSizeRecorder] = None
+    if adaptive_page_size and "size" not in body:
+        page_size = _AdaptivePageSize(
+            size=DEFAULT_SEARCH_SIZE,
+            max_size=_max_result_window(query_compiler),
+        )
+        response_size = _ResponseSizeRecorder.of(client)
+    body.setdefault("size", DEFAULT_SEARCH_SIZE)
+
     # Pagination with 'search_after' must have a 'sort' setting.
     # Using '_doc:asc' is the most efficient as reads documents
     # in the order that they're written on disk in Lucene.
@@ -1581,28 +2578,352 @@ def _search_yield_hits(
     # care about the hit itself for these queries.
     body.setdefault("track_total_hits", False)
 
-    # TODO: re-implement point in time search after supporting in OpenSearch 2.3
-    while max_number_of_hits is None or hits_yielded < max_number_of_hits:
-        resp = client.search(body=body, index=query_compiler._index_pattern)
-        hits: List[Dict[str, Any]] = resp["hits"]["hits"]
+    # Point in time API is available from OpenSearch 2.4
+    if use_pit is None:
+        use_pit = _cluster_version(client) >= PIT_MIN_OS_VERSION
+
+    pit_id: Optional[str] = None
+    if use_pit:
+        pit_id = client.create_pit(
+            index=query_compiler._index_pattern, keep_alive=DEFAULT_PIT_KEEP_ALIVE
+        )["pit_id"]
+
+    try:
+        while max_number_of_hits is None or hits_yielded < max_number_of_hits:
+            if page_size is not None:
+                body["size"] = page_size.size
+                if max_number_of_hits is not None:
+                    body["size"] = min(body["size"], max_number_of_hits - hits_yielded)
+
+            if response_size is not None:
+                response_size.pop_size()
+            if pit_id is not None:
+                # The PIT already targets the index pattern so 'index' must not be set
+                body["pit"] = {"id": pit_id, "keep_alive": DEFAULT_PIT_KEEP_ALIVE}
+                start = time.perf_counter()
+                resp = client.search(body=body)
+                seconds = time.perf_counter() - start
+
+                # The PIT id can change between requests, always use the latest
+                pit_id = resp.get("pit_id", pit_id)
+            else:
+                start = time.perf_counter()
+                resp = client.search(body=body, index=query_compiler._index_pattern)
+                seconds = time.perf_counter() - start
+            hits: List[Dict[str, Any]] = resp["hits"]["hits"]
+
+            # If we didn't receive any hits it means we've reached the end.
+            if not hits:
+                break
+
+            if page_size is not None and len(hits) == body["size"]:
+                page_size.update(
+                    hits,
+                    seconds,
+                    response_size.pop_size() if response_size is not None else None,
+                )
+
+            # Calculate which hits should be yielded from this batch
+            if max_number_of_hits is None:
+                hits_to_yield = len(hits)
+            else:
+                hits_to_yield = min(len(hits), max_number_of_hits - hits_yielded)
 
-        # If we didn't receive any hits it means we've reached the end.
-        if not hits:
-            break
+            # Yield the hits we need to and then track the total number.
+            # Never yield an empty list as that makes things simpler for
+            # downstream consumers.
+            if hits and hits_to_yield > 0:
+                yield hits[:hits_to_yield]
+                hits_yielded += hits_to_yield
 
-        # Calculate which hits should be yielded from this batch
-        if max_number_of_hits is None:
-            hits_to_yield = len(hits)
+            # Set the 'search_after' for the next request
+            # to be the last sort value for this set of hits.
+            body["search_after"] = hits[-1]["sort"]
+    finally:
+        # Runs on exhaustion and on GeneratorExit when the consumer stops early
+        if pit_id is not None:
+            client.delete_pit(body={"pit_id": [pit_id]}, ignore=(404,))
+
+
+class _AdaptivePageSize:
+    """
+    Chooses the 'size' of each search_after page so that responses are close
+    to 'target_bytes'. The bytes per hit are the size of the raw response of
+    each full page divided by its hits, or estimated from a sample of the hits
+    when the response size isn't known. The size is reduced further when a
+    page takes longer than 'target_seconds'. The size at most doubles from one
+    page to the next and stays within [MIN_SEARCH_SIZE, max_size].
+    """
+
+    SAMPLE_SIZE = 10
+
+    def __init__(
+        self,
+        size: int,
+        max_size: int,
+        target_bytes: int = DEFAULT_SEARCH_TARGET_BYTES,
+        target_seconds: float = DEFAULT_SEARCH_TARGET_SECONDS,
+    ):
+        self.max_size = max(max_size, MIN_SEARCH_SIZE)
+        self.size = min(size, self.max_size)
+        self.target_bytes = target_bytes
+        self.target_seconds = target_seconds
+
+    def update(
+        self,
+        hits: List[Dict[str, Any]],
+        seconds: float,
+        response_bytes: Optional[int] = None,
+    ) -> int:
+        if response_bytes is not None:
+            hit_bytes = response_bytes / len(hits)
         else:
-            hits_to_yield = min(len(hits), max_number_of_hits - hits_yielded)
-
-        # Yield the hits we need to and then track the total number.
-        # Never yield an empty list as that makes things simpler for
-        # downstream consumers.
-        if hits and hits_to_yield > 0:
-            yield hits[:hits_to_yield]
-            hits_yielded += hits_to_yield
-
-        # Set the 'search_after' for the next request
-        # to be the last sort value for this set of hits.
-        body["search_after"] = hits[-1]["sort"]
+            sample = hits[:: max(1, len(hits) // self.SAMPLE_SIZE)]
+            hit_bytes = sum(len(json.dumps(hit, default=str)) for hit in sample) / len(
+                sample
+            )
+
+        size = self.target_bytes / max(hit_bytes, 1.0)
+        if seconds > self.target_seconds:
+            size = min(size, len(hits) * self.target_seconds / seconds)
+
+        self.size = int(max(MIN_SEARCH_SIZE, min(size, 2 * len(hits), self.max_size)))
+        return self.size
+
+
+class _ResponseSizeRecorder:
+    """
+    Wraps the deserializer of an opensearch-py transport to record the size
+    of the raw body of the last response decoded on each thread, so that
+    _AdaptivePageSize doesn't have to encode hits again to estimate it.
+    """
+
+    def __init__(self, deserializer: Any) -> None:
+        self.deserializer = deserializer
+        self._local = threading.local()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.deserializer, name)
+
+    def loads(self, s: Any, mimetype: Optional[str] = None) -> Any:
+        self._local.size = len(s)
+        return self.deserializer.loads(s, mimetype)
+
+    def pop_size(self) -> Optional[int]:
+        """
+        Returns the size of the last response body decoded on this thread
+        since the previous call, None if there wasn't any.
+        """
+        size: Optional[int] = getattr(self._local, "size", None)
+        self._local.size = None
+        return size
+
+    @classmethod
+    def of(cls, client: "OpenSearch") -> Optional["_ResponseSizeRecorder"]:
+        """
+        Returns the recorder of the client's transport, wrapping its
+        deserializer the first time. None if the transport has none.
+        """
+        transport = getattr(client, "transport", None)
+        deserializer = getattr(transport, "deserializer", None)
+        if deserializer is None:
+            return None
+        if not isinstance(deserializer, cls):
+            deserializer = transport.deserializer = cls(deserializer)  # type: ignore
+        return deserializer
+
+
+def _max_result_window(query_compiler: "QueryCompiler") -> int:
+    """
+    Returns the smallest 'index.max_result_window' of the searched indices,
+    which is the largest 'size' a search can request. Falls back to the
+    OpenSearch default if the settings can't be read.
+    """
+    setting = "index.max_result_window"
+    try:
+        resp = query_compiler._client.indices.get_settings(
+            index=query_compiler._index_pattern,
+            name=setting,
+            include_defaults=True,
+            flat_settings=True,
+        )
+    except TransportError:
+        return DEFAULT_MAX_RESULT_WINDOW
+
+    return min(
+        (
+            int(
+                index_settings.get("settings", {}).get(setting)
+                or index_settings.get("defaults", {}).get(setting)
+                or DEFAULT_MAX_RESULT_WINDOW
+            )
+            for index_settings in resp.values()
+        ),
+        default=DEFAULT_MAX_RESULT_WINDOW,
+    )
+
+
+def _search_yield_sliced_hits(
+    query_compiler: "QueryCompiler",
+    body: Dict[str, Any],
+    slice_id: int,
+    max_slices: int,
+) -> Generator[List[Dict[str, Any]], None, None]:
+    """
+    This is a generator that scrolls over a single slice of a sliced scroll
+    and yields batches of hits as they come in. Running one of these per slice
+    splits a scan of the whole index into 'max_slices' independent request
+    streams. No empty batches will be yielded. The scroll context is cleared
+    once the generator is exhausted or closed.
+
+    Parameters
+    ----------
+    query_compiler:
+        An instance of query_compiler
+    body:
+        body for search API
+    slice_id:
+        The slice this generator scrolls over, 0 <= slice_id < max_slices
+    max_slices:
+        Total number of slices the search is split into
+    """
+    # Make a copy of 'body' to avoid mutating it outside this function.
+    body = body.copy()
+    body.setdefault("size", DEFAULT_SEARCH_SIZE)
+
+    # Scrolling in '_doc' order is the most efficient way to read every document.
+    body.setdefault("sort", ["_doc"])
+    body["slice"] = {"id": slice_id, "max": max_slices}
+
+    client = query_compiler._client
+    scroll_id: Optional[str] = None
+    # Every scroll id returned, a scroll request may return a new one
+    scroll_ids: List[str] = []
+    try:
+        resp = client.search(
+            body=body,
+            index=query_compiler._index_pattern,
+            scroll=DEFAULT_SCROLL_KEEP_ALIVE,
+        )
+        while True:
+            scroll_id = resp.get("_scroll_id", scroll_id)
+            if scroll_id is not None and scroll_id not in scroll_ids:
+                scroll_ids.append(scroll_id)
+            hits: List[Dict[str, Any]] = resp["hits"]["hits"]
+
+            # If we didn't receive any hits it means we've reached the end.
+            if not hits:
+                break
+            yield hits
+
+            resp = client.scroll(scroll_id=scroll_id, scroll=DEFAULT_SCROLL_KEEP_ALIVE)
+    finally:
+        if scroll_ids:
+            client.clear_scroll(body={"scroll_id": scroll_ids}, ignore=(404,))
+
+
+async def _search_yield_hits_async(
+    os_client: "AsyncOpenSearch",
+    index_pattern: str,
+    body: Dict[str, Any],
+    max_number_of_hits: Optional[int],
+    sort_index: Optional[str] = "_doc",
+    use_pit: Optional[bool] = None,
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Async version of _search_yield_hits searching with an AsyncOpenSearch
+    client. Yields batches of hits paginated with 'search_after', within a
+    point in time if use_pit. The PIT is deleted once the generator is
+    exhausted or closed.
+    """
+    # No documents, no reason to send a search.
+    if max_number_of_hits == 0:
+        return
+
+    # Make a copy of 'body' to avoid mutating it outside this function.
+    body = body.copy()
+    body.setdefault("size", DEFAULT_SEARCH_SIZE)
+    body.setdefault("sort", [{sort_index: "asc"}])
+    body.setdefault("track_total_hits", False)
+
+    hits_yielded = 0
+
+    # Point in time API is available from OpenSearch 2.4
+    if use_pit is None:
+        use_pit = await _cluster_version_async(os_client) >= PIT_MIN_OS_VERSION
+
+    pit_id: Optional[str] = None
+    if use_pit:
+        pit_id = (
+            await os_client.create_pit(
+                index=index_pattern, keep_alive=DEFAULT_PIT_KEEP_ALIVE
+            )
+        )["pit_id"]
+
+    try:
+        while max_number_of_hits is None or hits_yielded < max_number_of_hits:
+            if pit_id is not None:
+                body["pit"] = {"id": pit_id, "keep_alive": DEFAULT_PIT_KEEP_ALIVE}
+                resp = await os_client.search(body=body)
+                pit_id = resp.get("pit_id", pit_id)
+            else:
+                resp = await os_client.search(body=body, index=index_pattern)
+            hits: List[Dict[str, Any]] = resp["hits"]["hits"]
+
+            if not hits:
+                break
+
+            if max_number_of_hits is None:
+                hits_to_yield = len(hits)
+            else:
+                hits_to_yield = min(len(hits), max_number_of_hits - hits_yielded)
+
+            if hits_to_yield > 0:
+                yield hits[:hits_to_yield]
+                hits_yielded += hits_to_yield
+
+            body["search_after"] = hits[-1]["sort"]
+    finally:
+        if pit_id is not None:
+            await os_client.delete_pit(body={"pit_id": [pit_id]}, ignore=(404,))
+
+
+async def _search_yield_sliced_hits_async(
+    os_client: "AsyncOpenSearch",
+    index_pattern: str,
+    body: Dict[str, Any],
+    slice_id: int,
+    max_slices: int,
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    """
+    Async version of _search_yield_sliced_hits scrolling over a single slice
+    with an AsyncOpenSearch client. The scroll context is cleared once the
+    generator is exhausted or closed.
+    """
+    body = body.copy()
+    body.setdefault("size", DEFAULT_SEARCH_SIZE)
+    body.setdefault("sort", ["_doc"])
+    body["slice"] = {"id": slice_id, "max": max_slices}
+
+    scroll_id: Optional[str] = None
+    scroll_ids: List[str] = []
+    try:
+        resp = await os_client.search(
+            body=body, index=index_pattern, scroll=DEFAULT_SCROLL_KEEP_ALIVE
+        )
+        while True:
+            scroll_id = resp.get("_scroll_id", scroll_id)
+            if scroll_id is not None and scroll_id not in scroll_ids:
+                scroll_ids.append(scroll_id)
+            hits: List[Dict[str, Any]] = resp["hits"]["hits"]
+
+            if not hits:
+                break
+            yield hits
+
+            resp = await os_client.scroll(
+                scroll_id=scroll_id, scroll=DEFAULT_SCROLL_KEEP_ALIVE
+            )
+    finally:
+        if scroll_ids:
+            await os_client.clear_scroll(body={"scroll_id": scroll_ids}, ignore=(404,))
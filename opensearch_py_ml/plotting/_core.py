@@ -37,6 +37,7 @@ def oml_hist_series(
     yrot=None,
     figsize=None,
     bins=10,
+    os_single_pass=False,
     **kwds,
 ):
     """
@@ -44,6 +45,13 @@ def oml_hist_series(
 
     See :pandas_api_docs:`pandas.Series.hist` for usage.
 
+    Parameters
+    ----------
+    os_single_pass: bool, default False
+        Compute the histogram with a single search, using a variable_width_histogram
+        aggregation rebinned client-side, instead of a min/max search followed by a
+        histogram search. Bin edges are exact but weights are approximate.
+
     Notes
     -----
     Derived from ``pandas.plotting._core.hist_frame 0.25.3``
@@ -69,6 +77,7 @@ def oml_hist_series(
         yrot=yrot,
         figsize=figsize,
         bins=bins,
+        os_single_pass=os_single_pass,
         **kwds,
     )
 
@@ -88,6 +97,7 @@ def oml_hist_frame(
     figsize=None,
     layout=None,
     bins=10,
+    os_single_pass=False,
     **kwds,
 ):
     """
@@ -95,6 +105,13 @@ def oml_hist_frame(
 
     See :pandas_api_docs:`pandas.DataFrame.hist` for usage.
 
+    Parameters
+    ----------
+    os_single_pass: bool, default False
+        Compute the histograms with a single search, using variable_width_histogram
+        aggregations rebinned client-side, instead of a min/max search followed by a
+        histogram search. Bin edges are exact but weights are approximate.
+
     Notes
     -----
     Derived from ``pandas.plotting._core.hist_frame 0.25.3``
@@ -138,5 +155,6 @@ def oml_hist_frame(
         figsize=figsize,
         layout=layout,
         bins=bins,
+        os_single_pass=os_single_pass,
         **kwds,
     )
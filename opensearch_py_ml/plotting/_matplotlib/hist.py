@@ -55,6 +55,7 @@ def hist_series(
     yrot=None,
     figsize=None,
     bins=10,
+    os_single_pass=False,
     **kwds,
 ) -> "ArrayLike":
     import matplotlib.pyplot as plt  # type: ignore
@@ -75,7 +76,7 @@ def hist_series(
         elif ax.get_figure() != fig:
             raise AssertionError("passed axis not bound to passed figure")
 
-        self_bins, self_weights = self._hist(num_bins=bins)
+        self_bins, self_weights = self._hist(num_bins=bins, single_pass=os_single_pass)
         # As this is a series, squeeze Series to arrays
         self_bins = self_bins.squeeze()
         self_weights = self_weights.squeeze()
@@ -112,10 +113,11 @@ def hist_frame(
     figsize=None,
     layout=None,
     bins=10,
+    os_single_pass=False,
     **kwds,
 ):
     # Start with empty pandas data frame derived from
-    oml_df_bins, oml_df_weights = data._hist(num_bins=bins)
+    oml_df_bins, oml_df_weights = data._hist(num_bins=bins, single_pass=os_single_pass)
 
     converter._WARN = False  # no warning for pandas plots
     if by is not None:
@@ -159,6 +159,23 @@ class Query:
         agg = {func: {"field": field}}
         self._aggs[name] = agg
 
+    def exists_agg(self, name: str, field: str) -> None:
+        """
+        Add filter agg counting the documents where the field exists e.g
+
+        "aggs": {
+            "name": {
+                "filter": {
+                    "exists": {
+                        "field": "AvgTicketPrice"
+                    }
+                }
+            }
+        }
+        """
+        agg = {"filter": NotNull(field).build()}
+        self._aggs[name] = agg
+
     def percentile_agg(self, name: str, field: str, percents: List[float]) -> None:
         """
 
@@ -327,6 +344,21 @@ class Query:
             }
             self._aggs[name] = agg
 
+    def variable_width_hist_aggs(self, name: str, field: str, num_buckets: int) -> None:
+        """
+        Add variable_width_histogram agg e.g.
+        "aggs": {
+            "name": {
+                "variable_width_histogram": {
+                    "field": "AvgTicketPrice"
+                    "buckets": 200
+                }
+            }
+        }
+        """
+        agg = {"variable_width_histogram": {"field": field, "buckets": num_buckets}}
+        self._aggs[name] = agg
+
     def to_search_body(self) -> Dict[str, Any]:
         body = {}
         if self._aggs:
@@ -27,11 +27,14 @@ import copy
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Collection,
     Dict,
     Generator,
     List,
     Optional,
     Sequence,
+    Set,
     TextIO,
     Tuple,
     Union,
@@ -40,7 +43,7 @@ from typing import (
 import numpy as np
 import pandas as pd  # type: ignore
 
-from opensearch_py_ml.common import opensearch_date_to_pandas_date
+from opensearch_py_ml.common import opensearch_dates_to_pandas_dates
 from opensearch_py_ml.field_mappings import FieldMappings
 from opensearch_py_ml.filter import BooleanFilter, QueryFilter
 from opensearch_py_ml.index import Index
@@ -48,7 +51,8 @@ from opensearch_py_ml.operations import Operations
 from opensearch_py_ml.utils import MEAN_ABSOLUTE_DEVIATION, STANDARD_DEVIATION, VARIANCE
 
 if TYPE_CHECKING:
-    from opensearchpy import OpenSearch
+    import pyarrow as pa  # type: ignore
+    from opensearchpy import AsyncOpenSearch, OpenSearch
 
     from opensearch_py_ml.arithmetics import ArithmeticSeries
 
@@ -151,12 +155,15 @@ class QueryCompiler:
     def _os_results_to_pandas(
         self,
         results: List[Dict[str, Any]],
+        flattening_plan: Optional["FlatteningPlan"] = None,
     ) -> "pd.Dataframe":
         """
         Parameters
         ----------
         results: List[Dict[str, Any]]
             OpenSearch results from self.client.search
+        flattening_plan: FlatteningPlan, optional
+            Plan created by self._flattening_plan(), created per call if not given
 
         Returns
         -------
@@ -240,39 +247,17 @@ class QueryCompiler:
         if not results:
             return self._empty_pd_ef()
 
-        # This is one of the most performance critical areas of opensearch_py_ml, and it repeatedly calls
-        # self._mappings.field_name_pd_dtype and self._mappings.date_field_format
-        # therefore create a simple cache for this data
-        field_mapping_cache = FieldMappingCache(self._mappings)
+        if flattening_plan is None:
+            flattening_plan = self._flattening_plan()
 
-        rows = []
-        index = []
-
-        i = 0
-        for i, hit in enumerate(results, 1):
-            if "_source" in hit:
-                row = hit["_source"]
-            else:
-                row = {}
-
-            # script_fields appear in 'fields'
-            if "fields" in hit:
-                fields = hit["fields"]
-                for key, value in fields.items():
-                    row[key] = value
-
-            # get index value - can be _id or can be field value in source
-            if self._index.is_source_field:
-                index_field = row[self._index.os_index_field]
-            else:
-                index_field = hit[self._index.os_index_field]
-            index.append(index_field)
-
-            # flatten row to map correctly to 2D DataFrame
-            rows.append(self._flatten_dict(row, field_mapping_cache))
+        columns, index = flattening_plan.flatten_hits(
+            results,
+            index_field=self._index.os_index_field,
+            index_is_source_field=self._index.is_source_field,
+        )
 
         # Create pandas DataFrame
-        df = pd.DataFrame(data=rows, index=index)
+        df = pd.DataFrame(data=columns, index=index)
 
         # _source may not contain all field_names in the mapping
         # therefore, fill in missing field_names
@@ -294,64 +279,23 @@ class QueryCompiler:
 
         return df
 
-    def _flatten_dict(self, y, field_mapping_cache: "FieldMappingCache"):
-        out = {}
-
-        def flatten(x, name=""):
-            # We flatten into source fields e.g. if type=geo_point
-            # location: {lat=52.38, lon=4.90}
-            if name == "":
-                is_source_field = False
-                pd_dtype = "object"
-            else:
-                try:
-                    pd_dtype = field_mapping_cache.field_name_pd_dtype(name[:-1])
-                    is_source_field = True
-                except KeyError:
-                    is_source_field = False
-                    pd_dtype = "object"
-
-            if not is_source_field and isinstance(x, dict):
-                for a in x:
-                    flatten(x[a], name + a + ".")
-            elif not is_source_field and isinstance(x, list):
-                for a in x:
-                    flatten(a, name)
-            elif is_source_field:  # only print source fields from mappings
-                # (TODO - not so efficient for large number of fields and filtered mapping)
-                field_name = name[:-1]
-
-                # Coerce types - for now just datetime
-                if pd_dtype == "datetime64[ns]":
-                    x = opensearch_date_to_pandas_date(
-                        x, field_mapping_cache.date_field_format(field_name)
-                    )
-
-                # Elasticsearch can have multiple values for a field. These are represented as lists, so
-                # create lists for this pivot (see notes above)
-                if field_name in out:
-                    if not isinstance(out[field_name], list):
-                        field_as_list = [out[field_name]]
-                        out[field_name] = field_as_list
-                    out[field_name].append(x)
-                else:
-                    out[field_name] = x
-            else:
-                # Script fields end up here
-
-                # Elasticsearch returns 'Infinity' as a string for np.inf values.
-                # Map this to a numeric value to avoid this whole Series being classed as an object
-                # TODO - create a lookup for script fields and dtypes to only map 'Infinity'
-                #        if the field is numeric. This implementation will currently map
-                #        any script field with "Infinity" as a string to np.inf
-                if x == "Infinity":
-                    out[name[:-1]] = np.inf
-                else:
-                    out[name[:-1]] = x
-
-        flatten(y)
+    def _flattening_plan(
+        self, docvalue_field_names: Collection[str] = ()
+    ) -> "FlatteningPlan":
+        """
+        Parameters
+        ----------
+        docvalue_field_names: Collection[str]
+            Fields requested as 'docvalue_fields' rather than from '_source'
 
-        return out
+        Returns
+        -------
+        FlatteningPlan
+            Plan for flattening hits of this query into DataFrame columns.
+            Create it once and pass it to _os_results_to_pandas when
+            converting many pages of results.
+        """
+        return FlatteningPlan(self._mappings, docvalue_field_names)
 
     def _index_count(self) -> int:
         """
@@ -362,6 +306,17 @@ class QueryCompiler:
         """
         return self._operations.index_count(self, self.index.os_index_field)
 
+    def _index_count_and_count(self) -> Tuple[int, Optional[pd.Series]]:
+        """
+        Returns
+        -------
+        index_count: int
+            Count of docs where index_field exists
+        counts: pd.Series
+            The result of count(), None if it isn't supported
+        """
+        return self._operations.index_count_and_count(self, self.index.os_index_field)
+
     def _index_matches_count(self, items: List[Any]) -> int:
         """
         Returns
@@ -501,13 +456,27 @@ class QueryCompiler:
         return self._update_query(QueryFilter(query))
 
     # To/From Pandas
-    def to_pandas(self, show_progress: bool = False):
+    def to_pandas(
+        self,
+        show_progress: bool = False,
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
+    ):
         """Converts Opensearch_py_ml DataFrame to Pandas DataFrame.
 
         Returns:
             Pandas DataFrame
         """
-        return self._operations.to_pandas(self, show_progress)
+        return self._operations.to_pandas(
+            self,
+            show_progress,
+            parallelism,
+            use_docvalue_fields,
+            prefetch,
+            adaptive_page_size,
+        )
 
     # To CSV
     def to_csv(self, **kwargs) -> Optional[str]:
@@ -518,10 +487,50 @@ class QueryCompiler:
         """
         return self._operations.to_csv(self, **kwargs)
 
+    # To Arrow/Parquet
+    def to_arrow(self, **kwargs) -> "pa.Table":
+        """Converts Opensearch_py_ml Dataframe to a pyarrow Table
+
+        Returns:
+            pyarrow Table
+        """
+        return self._operations.to_arrow(self, **kwargs)
+
+    def to_parquet(self, path, **kwargs) -> None:
+        """Serialises Opensearch_py_ml Dataframe to Parquet"""
+        self._operations.to_parquet(self, path, **kwargs)
+
     def search_yield_pandas_dataframes(
-        self, sort_index: Optional["str"] = "_doc"
+        self,
+        sort_index: Optional["str"] = "_doc",
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
     ) -> Generator["pd.DataFrame", None, None]:
-        return self._operations.search_yield_pandas_dataframes(self, sort_index)
+        return self._operations.search_yield_pandas_dataframes(
+            self,
+            sort_index,
+            parallelism,
+            use_docvalue_fields,
+            prefetch,
+            adaptive_page_size,
+        )
+
+    def search_yield_pandas_dataframes_async(
+        self,
+        os_client: "AsyncOpenSearch",
+        sort_index: Optional["str"] = "_doc",
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+    ) -> AsyncGenerator["pd.DataFrame", None]:
+        return self._operations.search_yield_pandas_dataframes_async(
+            self,
+            os_client,
+            sort_index,
+            parallelism,
+            use_docvalue_fields,
+        )
 
     # __getitem__ methods
     def getitem_column_array(self, key, numeric=False):
@@ -629,6 +638,9 @@ class QueryCompiler:
     def unique(self) -> pd.Series:
         return self._operations.unique(self)
 
+    def iter_unique(self) -> Generator[Any, None, None]:
+        return self._operations.iter_unique(self)
+
     def mode(
         self,
         os_size: int,
@@ -709,8 +721,10 @@ class QueryCompiler:
     def describe(self) -> pd.DataFrame:
         return self._operations.describe(self)
 
-    def _hist(self, num_bins: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        return self._operations.hist(self, num_bins)
+    def _hist(
+        self, num_bins: int, single_pass: bool = False
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        return self._operations.hist(self, num_bins, single_pass=single_pass)
 
     def _update_query(self, boolean_filter: "BooleanFilter") -> "QueryCompiler":
         result = self.copy()
@@ -788,36 +802,276 @@ class QueryCompiler:
         return aggregatable_field_name
 
 
-class FieldMappingCache:
+class _FlatColumn:
     """
-    Very simple dict cache for field mappings. This improves performance > 3 times on large datasets as
-    DataFrame access is slower than dict access.
+    Array of the values of one field, one per hit, for FlatteningPlan.
+
+    Numeric and boolean fields start as an array of their mapped dtype and
+    fall back to an object array if a value doesn't have the mapped type, a
+    row has multiple values or (except for float64) a row has no value.
+    float64 arrays also take int values, as OpenSearch returns whole numbers
+    of float fields as they were indexed.
     """
 
-    def __init__(self, mappings: "FieldMappings") -> None:
-        self._mappings = mappings
+    __slots__ = ("values", "value_type", "allows_missing", "last_row")
+
+    # Python type a value must have to be written into an array of the dtype
+    _VALUE_TYPES: Dict[str, type] = {"float64": float, "int64": int, "bool": bool}
+
+    def __init__(self, num_rows: int, pd_dtype: Optional[str] = None) -> None:
+        self.values: "np.ndarray[Any, Any]"
+        # type() of the values while the array is typed, None once it's object
+        self.value_type: Optional[type] = None
+        # Whether rows without a value can be left as NaN while it's typed
+        self.allows_missing = True
+        # Last row a value was set on, rows are set in order
+        self.last_row = -1
+        if pd_dtype is None:
+            self.values = np.full(num_rows, np.nan, dtype=object)
+        elif pd_dtype == "float64":
+            self.values = np.full(num_rows, np.nan, dtype=pd_dtype)
+            self.value_type = float
+        else:
+            # int64 and bool arrays are set row after row while they're typed
+            self.values = np.empty(num_rows, dtype=pd_dtype)
+            self.value_type = self._VALUE_TYPES[pd_dtype]
+            self.allows_missing = False
+
+    def set_value(self, row: int, x: Any) -> None:
+        if self.value_type is not None:
+            if type(x) is self.value_type and (  # bool is a subclass of int
+                self.last_row == row - 1
+                or (self.allows_missing and self.last_row < row)
+            ):
+                try:
+                    self.values[row] = x
+                    self.last_row = row
+                    return
+                except OverflowError:
+                    pass
+            elif (
+                self.value_type is float
+                and type(x) is int  # bool is a subclass of int
+                and self.last_row < row
+            ):
+                try:
+                    self.values[row] = float(x)
+                    self.last_row = row
+                    return
+                except OverflowError:
+                    pass
+            self._to_object()
+
+        # OpenSearch can have multiple values for a field. These are represented as lists, so
+        # create lists for this pivot (see notes above)
+        if self.last_row == row:
+            if not isinstance(self.values[row], list):
+                self.values[row] = [self.values[row]]
+            self.values[row].append(x)
+        else:
+            self.values[row] = x
+            self.last_row = row
 
-        self._field_name_pd_dtype: Dict[str, str] = dict()
-        self._date_field_format: Dict[str, str] = dict()
+    def finish(self) -> "np.ndarray[Any, Any]":
+        # int64 and bool arrays can't hold the missing values of later rows
+        if not self.allows_missing and self.last_row != len(self.values) - 1:
+            self._to_object()
+        return self.values
 
-    def field_name_pd_dtype(self, os_field_name: str) -> str:
-        if os_field_name in self._field_name_pd_dtype:
-            return self._field_name_pd_dtype[os_field_name]
+    def _to_object(self) -> None:
+        values = self.values.astype(object)
+        if not self.allows_missing:
+            values[self.last_row + 1 :] = np.nan
+        self.values = values
+        self.value_type = None
+        self.allows_missing = True
 
-        pd_dtype = self._mappings.field_name_pd_dtype(os_field_name)
 
-        # cache this
-        self._field_name_pd_dtype[os_field_name] = pd_dtype
+class FlatteningPlan:
+    """
+    Plan for flattening OpenSearch hits into pandas.DataFrame columns.
+
+    The source fields are looked up once from the FieldMappings so flattening
+    a hit is a dict lookup per value. Values are written straight into one
+    array per column rather than into a dict per row, which is significantly
+    faster on large results and wide mappings.
+    """
 
-        return pd_dtype
+    def __init__(
+        self, mappings: "FieldMappings", docvalue_field_names: Collection[str] = ()
+    ) -> None:
+        # script_fields are returned under their display name in 'fields' and
+        # are flattened as plain values, so they aren't source fields here.
+        self._source_field_names: Set[str] = set()
+        self._date_field_formats: Dict[str, Optional[str]] = {}
+        self._typed_field_dtypes: Dict[str, str] = {}
+        for field in mappings.all_source_fields():
+            if field.is_scripted:
+                continue
+            self._source_field_names.add(field.os_field_name)
+            if field.pd_dtype == "datetime64[ns]":
+                self._date_field_formats[field.os_field_name] = field.os_date_format
+            elif field.pd_dtype in _FlatColumn._VALUE_TYPES:
+                self._typed_field_dtypes[field.os_field_name] = field.pd_dtype
+
+        # docvalue_fields are also returned in 'fields', dates as epoch_millis
+        self._docvalue_field_names: Set[str] = set(docvalue_field_names)
+        for field_name in self._docvalue_field_names & self._date_field_formats.keys():
+            self._date_field_formats[field_name] = "epoch_millis"
+
+    def flatten_hits(
+        self,
+        hits: List[Dict[str, Any]],
+        index_field: str,
+        index_is_source_field: bool,
+    ) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        Parameters
+        ----------
+        hits: List[Dict[str, Any]]
+            OpenSearch hits from self.client.search
+        index_field: str
+            _id or the source field used as the index
+        index_is_source_field: bool
+            True if index_field is a field of _source
 
-    def date_field_format(self, os_field_name: str) -> str:
-        if os_field_name in self._date_field_format:
-            return self._date_field_format[os_field_name]
+        Returns
+        -------
+        columns: Dict[str, Any]
+            Arrays per flattened field name, in order of first appearance.
+            Date fields are parsed, numeric and boolean fields are arrays of
+            their mapped dtype where possible. Other fields are arrays of the
+            inferred dtype where rows without a value for the field hold NaN.
+        index: List[Any]
+            Index value per hit
+        """
+        num_rows = len(hits)
+        source_field_names = self._source_field_names
+        docvalue_field_names = self._docvalue_field_names
+        date_field_formats = self._date_field_formats
+        typed_field_dtypes = self._typed_field_dtypes
+        flat_columns: Dict[str, _FlatColumn] = {}
+        index: List[Any] = []
+
+        def column(field_name: str) -> _FlatColumn:
+            flat_column = flat_columns.get(field_name)
+            if flat_column is None:
+                flat_column = flat_columns[field_name] = _FlatColumn(
+                    num_rows, typed_field_dtypes.get(field_name)
+                )
+            return flat_column
+
+        def set_value(name: str, row: int, x: Any) -> None:
+            # Inlined _FlatColumn.set_value for the common case of a value of
+            # the mapped type, it's called for every value of every hit
+            flat_column = flat_columns.get(name)
+            if (
+                flat_column is not None
+                and type(x) is flat_column.value_type
+                and (
+                    flat_column.last_row == row - 1
+                    or (flat_column.allows_missing and flat_column.last_row < row)
+                )
+            ):
+                try:
+                    flat_column.values[row] = x
+                    flat_column.last_row = row
+                    return
+                except OverflowError:
+                    pass
+            column(name).set_value(row, x)
+
+        def flatten(x: Any, name: str, row: int) -> None:
+            # We flatten into source fields e.g. if type=geo_point
+            # location: {lat=52.38, lon=4.90}
+            if name in source_field_names:
+                set_value(name, row, x)
+            elif isinstance(x, dict):
+                for key, value in x.items():
+                    flatten(value, f"{name}.{key}" if name else key, row)
+            elif isinstance(x, list):
+                for value in x:
+                    flatten(value, name, row)
+            else:
+                # Script fields end up here
 
-        os_date_field_format = self._mappings.date_field_format(os_field_name)
+                # OpenSearch returns 'Infinity' as a string for np.inf values.
+                # Map this to a numeric value to avoid this whole Series being classed as an object
+                # TODO - create a lookup for script fields and dtypes to only map 'Infinity'
+                #        if the field is numeric. This implementation will currently map
+                #        any script field with "Infinity" as a string to np.inf
+                column(name).values[row] = np.inf if x == "Infinity" else x
 
-        # cache this
-        self._date_field_format[os_field_name] = os_date_field_format
+        for row, hit in enumerate(hits):
+            source = hit.get("_source", {})
 
-        return os_date_field_format
+            # get index value - can be _id or can be field value in source
+            if index_is_source_field:
+                index.append(source[index_field])
+            else:
+                index.append(hit[index_field])
+
+            # script_fields and docvalue_fields appear in 'fields'
+            fields = hit.get("fields")
+            if fields and docvalue_field_names:
+                script_fields = {}
+                for name, values in fields.items():
+                    if name in docvalue_field_names:
+                        # Doc values are always arrays, set multiple values
+                        # one by one as they would be from _source
+                        for value in values:
+                            set_value(name, row, value)
+                    else:
+                        script_fields[name] = values
+                fields = script_fields
+
+            # script_fields take precedence over _source
+            if fields:
+                source = {**source, **fields}
+
+            flatten(source, "", row)
+
+        columns: Dict[str, Any] = {}
+        for name, flat_column in flat_columns.items():
+            values = flat_column.finish()
+            if name in date_field_formats:
+                # Coerce types - for now just datetime. Dates are parsed a column at a time
+                columns[name] = self._to_datetimes(values, date_field_formats[name])
+            elif values.dtype == object:
+                # Infer dtypes as pandas would for the equivalent list of row dicts
+                columns[name] = pd.Series(values, copy=False).infer_objects().array
+            else:
+                columns[name] = values
+
+        return columns, index
+
+    @staticmethod
+    def _to_datetimes(
+        values: "np.ndarray[Any, Any]", date_format: Optional[str]
+    ) -> Any:
+        is_list = np.fromiter(
+            (isinstance(value, list) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+        if not is_list.any():
+            return opensearch_dates_to_pandas_dates(values, date_format).array
+
+        # Fields with multiple values hold lists of dates, parse these together
+        list_rows = np.flatnonzero(is_list)
+        list_lengths = [len(values[row]) for row in list_rows]
+        list_dates = np.asarray(
+            opensearch_dates_to_pandas_dates(
+                [value for row in list_rows for value in values[row]], date_format
+            ).astype(object)
+        )
+        offset = 0
+        for row, length in zip(list_rows, list_lengths):
+            values[row] = list_dates[offset : offset + length].tolist()
+            offset += length
+
+        is_scalar = ~is_list
+        values[is_scalar] = opensearch_dates_to_pandas_dates(
+            values[is_scalar], date_format
+        ).astype(object)
+        return values
@@ -44,7 +44,16 @@ import warnings
 from collections.abc import Collection
 from datetime import datetime
 from io import StringIO
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd  # type: ignore
@@ -56,7 +65,11 @@ from opensearch_py_ml.arithmetics import (
     ArithmeticSeries,
     ArithmeticString,
 )
-from opensearch_py_ml.common import DEFAULT_NUM_ROWS_DISPLAYED, docstring_parameter
+from opensearch_py_ml.common import (
+    DEFAULT_NUM_ROWS_DISPLAYED,
+    PANDAS_VERSION,
+    docstring_parameter,
+)
 from opensearch_py_ml.filter import (
     BooleanFilter,
     Equal,
@@ -459,8 +472,78 @@ class Series(NDFrame):
             result = _buf.getvalue()
             return result
 
-    def to_pandas(self, show_progress: bool = False) -> pd.Series:
-        return self._query_compiler.to_pandas(show_progress=show_progress)[self.name]
+    def to_csv(
+        self,
+        path_or_buf=None,
+        sep=",",
+        na_rep="",
+        float_format=None,
+        header=True,
+        index=True,
+        index_label=None,
+        mode="w",
+        encoding=None,
+        compression="infer",
+        quoting=None,
+        quotechar='"',
+        line_terminator=None,
+        chunksize=None,
+        date_format=None,
+        doublequote=True,
+        escapechar=None,
+        decimal=".",
+    ) -> Optional[str]:
+        """
+        Write OpenSearch data to a comma-separated values (csv) file.
+
+        Each page of search results is formatted and appended to the output
+        as it arrives, so the whole Series is never loaded into memory.
+
+        See Also
+        --------
+        :pandas_api_docs:`pandas.Series.to_csv`
+        """
+        if PANDAS_VERSION[0] < 2:
+            line_terminator_keyword = "line_terminator"
+        else:
+            line_terminator_keyword = "lineterminator"
+        kwargs = {
+            "path_or_buf": path_or_buf,
+            "sep": sep,
+            "na_rep": na_rep,
+            "float_format": float_format,
+            "header": header,
+            "index": index,
+            "index_label": index_label,
+            "mode": mode,
+            "encoding": encoding,
+            "compression": compression,
+            "quoting": quoting,
+            "quotechar": quotechar,
+            line_terminator_keyword: line_terminator,
+            "chunksize": chunksize,
+            "date_format": date_format,
+            "doublequote": doublequote,
+            "escapechar": escapechar,
+            "decimal": decimal,
+        }
+        return self._query_compiler.to_csv(**kwargs)
+
+    def to_pandas(
+        self,
+        show_progress: bool = False,
+        parallelism: int = 1,
+        use_docvalue_fields: bool = False,
+        prefetch: int = 0,
+        adaptive_page_size: bool = False,
+    ) -> pd.Series:
+        return self._query_compiler.to_pandas(
+            show_progress=show_progress,
+            parallelism=parallelism,
+            use_docvalue_fields=use_docvalue_fields,
+            prefetch=prefetch,
+            adaptive_page_size=adaptive_page_size,
+        )[self.name]
 
     @property
     def dtype(self) -> np.dtype:
@@ -1643,6 +1726,36 @@ class Series(NDFrame):
         """
         return self._query_compiler.unique()
 
+    def iter_unique(self) -> Generator[Any, None, None]:
+        """
+        Iterate over the unique values of a Series in sorted order, like
+        :meth:`Series.unique`, without holding all of them in memory. Values are
+        fetched from OpenSearch one composite aggregation page at a time as the
+        generator is consumed.
+
+        Returns
+        -------
+        generator
+            A generator of the unique values of the series.
+
+        See Also
+        --------
+        :pandas_api_docs:`pandas.Series.unique`
+
+        Examples
+        --------
+        >>> from tests import OPENSEARCH_TEST_CLIENT
+
+        >>> s = oml.DataFrame(OPENSEARCH_TEST_CLIENT, 'flights')['Carrier']
+        >>> for carrier in s.iter_unique():
+        ...     print(carrier)
+        ES-Air
+        JetBeats
+        Kibana Airlines
+        Logstash Airways
+        """
+        return self._query_compiler.iter_unique()
+
     def var(self, numeric_only: Optional[bool] = None) -> pd.Series:
         """
         Return variance for a Series
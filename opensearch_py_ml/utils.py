@@ -23,11 +23,30 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import asyncio
 import functools
+import queue
 import re
+import threading
 import warnings
 from collections.abc import Collection as ABCCollection
-from typing import Any, Callable, Collection, Iterable, List, TypeVar, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pandas as pd  # type: ignore
 from pandas.core.dtypes.common import is_list_like  # type: ignore
@@ -107,6 +126,114 @@ def try_sort(iterable: Iterable[str]) -> Iterable[str]:
         return listed
 
 
+_THREAD_ITEM = 0
+_THREAD_ERROR = 1
+_THREAD_DONE = 2
+
+
+def yield_from_threads(
+    generators: Sequence[Iterator[Any]], max_queue_size: int
+) -> Generator[Any, None, None]:
+    """
+    Drains each generator on its own worker thread and yields items in the
+    order they're produced. At most 'max_queue_size' items are buffered so
+    a slow consumer holds back the workers instead of growing memory.
+    An exception raised on a worker is re-raised to the consumer, and
+    closing the returned generator stops and closes all the workers.
+    """
+    results: "queue.Queue[Tuple[int, Any]]" = queue.Queue(maxsize=max_queue_size)
+    stopped = threading.Event()
+
+    def put(item: Tuple[int, Any]) -> bool:
+        # Poll so that a worker blocked on a full queue notices the consumer has gone.
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(generator: Iterator[Any]) -> None:
+        try:
+            for item in generator:
+                if not put((_THREAD_ITEM, item)):
+                    break
+        except BaseException as e:
+            put((_THREAD_ERROR, e))
+        finally:
+            try:
+                # Lets generators release server-side resources (e.g. scroll contexts)
+                if hasattr(generator, "close"):
+                    generator.close()
+            finally:
+                put((_THREAD_DONE, None))
+
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        for generator in generators:
+            executor.submit(drain, generator)
+
+        try:
+            running = len(generators)
+            while running:
+                kind, value = results.get()
+                if kind == _THREAD_DONE:
+                    running -= 1
+                elif kind == _THREAD_ERROR:
+                    raise value
+                else:
+                    yield value
+        finally:
+            stopped.set()
+
+
+async def yield_from_tasks(
+    generators: Sequence[AsyncIterator[Any]], max_queue_size: int
+) -> AsyncGenerator[Any, None]:
+    """
+    Async version of yield_from_threads draining each async generator in
+    its own task on the running event loop. At most 'max_queue_size' items
+    are buffered, an exception raised in a task is re-raised to the consumer
+    and closing the returned generator cancels all the tasks.
+    """
+    results: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue(maxsize=max_queue_size)
+
+    async def drain(generator: AsyncIterator[Any]) -> None:
+        try:
+            async for item in generator:
+                await results.put((_THREAD_ITEM, item))
+        except Exception as e:
+            await results.put((_THREAD_ERROR, e))
+        finally:
+            try:
+                # Lets generators release server-side resources (e.g. scroll contexts)
+                if hasattr(generator, "aclose"):
+                    await generator.aclose()
+            finally:
+                await results.put((_THREAD_DONE, None))
+
+    tasks = [asyncio.ensure_future(drain(generator)) for generator in generators]
+    try:
+        running = len(tasks)
+        while running:
+            kind, value = await results.get()
+            if kind == _THREAD_DONE:
+                running -= 1
+            elif kind == _THREAD_ERROR:
+                raise value
+            else:
+                yield value
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Empty the queue until the tasks finish as they may be blocked on it
+        pending = set(tasks)
+        while pending:
+            _, pending = await asyncio.wait(pending, timeout=0.1)
+            while not results.empty():
+                results.get_nowait()
+
+
 class CustomFunctionDispatcher:
     # Define custom functions in a dictionary
     customFunctionMap = {
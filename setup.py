@@ -60,7 +60,11 @@ with open(path.join(here, "README.md"), "r", "utf-8") as f:
             last_html_index = i + 1
     long_description = "\n".join(lines[last_html_index:])
 
-extras = {}
+extras = {
+    "parquet": ["pyarrow>=10.0.1"],
+    "orjson": ["orjson>=3"],
+    "async": ["opensearch-py[async]>=2.2.0"],
+}
 extras["all"] = list({dep for deps in extras.values() for dep in deps})
 
 setup(
@@ -83,7 +87,7 @@ setup(
         "Issue Tracker": "https://github.com/opensearch-project/opensearch-py-ml/issues",
     },
     install_requires=[
-        "opensearch-py>=2",
+        "opensearch-py>=2.2.0",
         "pandas>=1.5.2,<2.3,!=2.1.0",
         "matplotlib>=3.6.0,<4",
         "numpy>=1.24.0,<2",
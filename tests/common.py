@@ -26,6 +26,7 @@ import os
 from datetime import timedelta
 
 import pandas as pd
+import pytest
 from pandas.testing import assert_frame_equal, assert_series_equal
 
 import opensearch_py_ml as oml
@@ -39,6 +40,9 @@ from tests import (
     FLIGHTS_DF_FILE_NAME,
     FLIGHTS_INDEX_NAME,
     FLIGHTS_SMALL_INDEX_NAME,
+    OPENSEARCH_ADMIN_PASSWORD,
+    OPENSEARCH_ADMIN_USER,
+    OPENSEARCH_HOST,
     OPENSEARCH_TEST_CLIENT,
 )
 
@@ -61,6 +65,18 @@ _pd_ecommerce["customer_birth_date"].astype("datetime64[ns]")
 _oml_ecommerce = oml.DataFrame(OPENSEARCH_TEST_CLIENT, ECOMMERCE_INDEX_NAME)
 
 
+def async_test_client():
+    """AsyncOpenSearch client for the test cluster, skips without opensearch-py[async]"""
+    pytest.importorskip("aiohttp")
+    from opensearchpy import AsyncOpenSearch
+
+    return AsyncOpenSearch(
+        hosts=[OPENSEARCH_HOST],
+        http_auth=(OPENSEARCH_ADMIN_USER, OPENSEARCH_ADMIN_PASSWORD),
+        verify_certs=False,
+    )
+
+
 class TestData:
     client = OPENSEARCH_TEST_CLIENT
 
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from tests.common import (
+    TestData,
+    assert_frame_equal,
+    assert_pandas_opensearch_py_ml_frame_equal,
+    async_test_client,
+)
+
+
+async def collect_batches(oml_df, **kwargs):
+    async with async_test_client() as os_client:
+        return [df async for df in oml_df.aiter_batches(os_client, **kwargs)]
+
+
+class TestDataFrameAiterBatches(TestData):
+    @pytest.mark.parametrize("parallelism", [1, 4])
+    def test_aiter_batches(self, parallelism):
+        oml_flights = self.oml_flights()
+
+        batches = asyncio.run(collect_batches(oml_flights, parallelism=parallelism))
+
+        assert len(batches) > 1
+        # Slices are yielded in the order their searches complete
+        assert_frame_equal(
+            oml_flights.to_pandas().sort_index(), pd.concat(batches).sort_index()
+        )
+
+    def test_aiter_batches_head(self):
+        oml_flights = self.oml_flights().head(1234)
+
+        batches = asyncio.run(collect_batches(oml_flights))
+
+        assert_pandas_opensearch_py_ml_frame_equal(
+            pd.concat(batches), oml_flights, check_exact=False
+        )
@@ -49,3 +49,22 @@ class TestDataFrameCount(TestData):
         oml_count = oml_flights.count()
 
         assert_series_equal(pd_count, oml_count)
+
+    def test_count_flights_query(self):
+        pd_flights = self.pd_flights().filter(self.filter_data)
+        oml_flights = self.oml_flights().filter(self.filter_data)
+
+        pd_count = pd_flights[pd_flights.AvgTicketPrice > 500].count()
+        oml_count = oml_flights[oml_flights.AvgTicketPrice > 500].count()
+
+        assert_series_equal(pd_count, oml_count)
+
+    def test_count_ecommerce(self):
+        pd_ecommerce = self.pd_ecommerce()
+        oml_ecommerce = self.oml_ecommerce()
+
+        # Every field is counted from the same search
+        pd_count = pd_ecommerce.count()
+        oml_count = oml_ecommerce.count()
+
+        assert_series_equal(pd_count, oml_count)
@@ -23,10 +23,12 @@
 #  under the License.
 
 # File called _pytest for PyCharm compatability
+from unittest import mock
+
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
-from tests.common import TestData
+from tests.common import OPENSEARCH_TEST_CLIENT, TestData
 
 PANDAS_MAJOR_VERSION = int(pd.__version__.split(".")[0])
 
@@ -66,3 +68,28 @@ class TestDataFrameDescribe(TestData):
         # nested and so can be treated as a multi-field in ES, but not in pandas
 
         # We can not also run 'describe' on a truncate oml dataframe
+
+    def test_flights_describe_single_msearch(self):
+        oml_flights = self.oml_flights()[["AvgTicketPrice", "FlightDelayMin"]]
+
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "search", wraps=OPENSEARCH_TEST_CLIENT.search
+        ) as mock_search, mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "msearch", wraps=OPENSEARCH_TEST_CLIENT.msearch
+        ) as mock_msearch:
+            oml_describe = oml_flights.describe()
+
+        # The metric and percentile aggregations share one round trip
+        assert mock_search.call_count == 0
+        assert mock_msearch.call_count == 1
+
+        oml_aggs = oml_flights.agg(["count", "mean", "min", "max", "std"])
+        oml_quantile = oml_flights.quantile([0.25, 0.5, 0.75])
+        oml_quantile.index = ["25%", "50%", "75%"]
+
+        assert_frame_equal(
+            pd.concat([oml_aggs, oml_quantile]).reindex(oml_describe.index),
+            oml_describe,
+            check_exact=False,
+            rtol=True,
+        )
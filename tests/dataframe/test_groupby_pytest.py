@@ -23,6 +23,7 @@
 #  under the License.
 
 # File called _pytest for PyCharm compatability
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -310,3 +311,35 @@ class TestGroupbyDataFrame(TestData):
         assert_frame_equal(
             pd_groupby, oml_groupby, check_exact=False, check_dtype=False, rtol=2
         )
+
+    @pytest.mark.parametrize("columns", ["DestCountry", ["DestCountry", "Cancelled"]])
+    def test_groupby_pages(self, columns):
+        pd_flights = self.pd_flights().filter(self.filter_data + ["DestCountry"])
+        oml_flights = self.oml_flights().filter(self.filter_data + ["DestCountry"])
+
+        pd_groupby = pd_flights.groupby(columns).agg(["min", "max", "mean", "count"])
+
+        # Small pages so the groups come from many composite aggregation pages
+        with mock.patch("opensearch_py_ml.operations.DEFAULT_PAGINATION_SIZE", 7):
+            oml_groupby = oml_flights.groupby(columns).agg(
+                ["min", "max", "mean", "count"]
+            )
+
+        assert_frame_equal(
+            pd_groupby, oml_groupby, check_exact=False, check_dtype=False
+        )
+
+    @pytest.mark.parametrize("dropna", [True, False])
+    @pytest.mark.parametrize("columns", ["Cancelled", ["dayOfWeek", "Cancelled"]])
+    def test_groupby_quantile_order(self, columns, dropna):
+        pd_flights = self.pd_flights().filter(self.filter_data)
+        oml_flights = self.oml_flights().filter(self.filter_data)
+
+        # Quantiles are kept in the requested order within each group
+        pd_groupby = pd_flights.groupby(columns, dropna=dropna).quantile([0.8, 0.2])
+        oml_groupby = oml_flights.groupby(columns, dropna=dropna).quantile([0.8, 0.2])
+
+        assert_index_equal(pd_groupby.index, oml_groupby.index)
+        assert_frame_equal(
+            pd_groupby, oml_groupby, check_exact=False, check_dtype=False, rtol=2
+        )
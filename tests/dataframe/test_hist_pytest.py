@@ -23,12 +23,13 @@
 #  under the License.
 
 # File called _pytest for PyCharm compatability
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
-from tests.common import TestData
+from tests.common import OPENSEARCH_TEST_CLIENT, TestData
 
 
 class TestDataFrameHist(TestData):
@@ -100,3 +101,27 @@ class TestDataFrameHist(TestData):
         # Numbers are slightly different
         assert_frame_equal(pd_bins, oml_bins, check_exact=False)
         assert_frame_equal(pd_weights, oml_weights, check_exact=False)
+
+    def test_flights_hist_single_pass(self):
+        pd_flights = self.pd_flights()
+        oml_flights = self.oml_flights()[["DistanceKilometers", "FlightDelayMin"]]
+
+        num_bins = 10
+
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "search", wraps=OPENSEARCH_TEST_CLIENT.search
+        ) as mock_search:
+            oml_bins, oml_weights = oml_flights._hist(
+                num_bins=num_bins, single_pass=True
+            )
+        assert mock_search.call_count == 1
+
+        for column in ["DistanceKilometers", "FlightDelayMin"]:
+            pd_weights, pd_bins = np.histogram(pd_flights[column], num_bins)
+
+            # Bin edges come from the exact min and max, weights are approximate
+            np.testing.assert_allclose(pd_bins, oml_bins[column])
+            assert oml_weights[column].sum() == len(pd_flights)
+            np.testing.assert_allclose(
+                pd_weights, oml_weights[column], atol=0.02 * len(pd_flights)
+            )
@@ -24,6 +24,7 @@
 
 # File called _pytest for PyCharm compatability
 from io import StringIO
+from unittest import mock
 
 import opensearch_py_ml as oml
 from tests import OPENSEARCH_TEST_CLIENT
@@ -51,6 +52,26 @@ class TestDataFrameInfo(TestData):
 
         print(self.oml_ecommerce().info())
 
+    def test_flights_info_single_msearch(self):
+        oml_flights = self.oml_flights()[["AvgTicketPrice", "Cancelled", "Carrier"]]
+        pd_flights = self.pd_flights()[["AvgTicketPrice", "Cancelled", "Carrier"]]
+
+        oml_buf = StringIO()
+        pd_buf = StringIO()
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "count", wraps=OPENSEARCH_TEST_CLIENT.count
+        ) as mock_count, mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "msearch", wraps=OPENSEARCH_TEST_CLIENT.msearch
+        ) as mock_msearch:
+            oml_flights.info(buf=oml_buf, memory_usage=False)
+        pd_flights.info(buf=pd_buf, memory_usage=False)
+
+        # The number of rows and the counts of the columns share one round trip,
+        # only head(1) and tail(1) of the index summary count the rows again
+        assert mock_count.call_count == 2
+        assert mock_msearch.call_count == 1
+        assert pd_buf.getvalue().split("\n")[1:] == oml_buf.getvalue().split("\n")[1:]
+
     def test_empty_info(self):
         mapping = {"mappings": {"properties": {}}}
 
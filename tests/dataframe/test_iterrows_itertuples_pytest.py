@@ -50,6 +50,17 @@ class TestDataFrameIterrowsItertuples(TestData):
         with pytest.raises(StopIteration):
             next(pd_flights_iterrows)
 
+    def test_iterrows_prefetch(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        assert [index for index, _ in oml_flights.iterrows(prefetch=2)] == list(
+            pd_flights.index
+        )
+        assert [row[0] for row in oml_flights.itertuples(prefetch=2)] == list(
+            pd_flights.index
+        )
+
     def test_itertuples(self):
         oml_flights = self.oml_flights()
         pd_flights = self.pd_flights()
@@ -25,6 +25,7 @@
 # File called _pytest for PyCharm compatability
 
 import ast
+import gzip
 import time
 from io import StringIO
 
@@ -127,3 +128,14 @@ class TestDataFrameToCSV(TestData):
         pd_from_csv.timestamp = pd.to_datetime(pd_from_csv.timestamp)
 
         assert_frame_equal(pd_flights, pd_from_csv)
+
+    def test_to_csv_gzip(self):
+        results_file = ROOT_DIR + "/dataframe/results/test_to_csv_gzip.csv.gz"
+
+        # Batches are compressed as they are written, the compression is
+        # inferred from the file extension
+        oml_flights = self.oml_flights()
+        oml_flights.to_csv(results_file)
+
+        with gzip.open(results_file, "rt") as f:
+            assert f.read() == oml_flights.to_csv()
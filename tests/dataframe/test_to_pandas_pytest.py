@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+
+from unittest import mock
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from opensearch_py_ml.common import PIT_MIN_OS_VERSION
+from tests import OPENSEARCH_TEST_CLIENT, OS_VERSION
+from tests.common import TestData
+
+
+class TestDataFrameToPandas(TestData):
+    def test_to_pandas_parallelism(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        # Slices are merged in the order they complete, so realign before comparing
+        pd_from_oml = oml_flights.to_pandas(parallelism=4)
+        assert len(pd_from_oml) == len(pd_flights)
+        assert_frame_equal(pd_flights, pd_from_oml.loc[pd_flights.index])
+
+    def test_to_pandas_parallelism_head(self):
+        # head() bounds the results so the scan isn't sliced
+        oml_flights = self.oml_flights().head(10)
+        pd_flights = self.pd_flights().head(10)
+
+        with pytest.warns(UserWarning, match="parallelism=4 is ignored"):
+            assert_frame_equal(pd_flights, oml_flights.to_pandas(parallelism=4))
+
+    def test_to_pandas_parallelism_clears_scrolls(self):
+        scroll_ids = []
+
+        def track_scroll_id(method):
+            def wrapper(*args, **kwargs):
+                resp = method(*args, **kwargs)
+                scroll_ids.append(resp["_scroll_id"])
+                return resp
+
+            return wrapper
+
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT,
+            "search",
+            side_effect=track_scroll_id(OPENSEARCH_TEST_CLIENT.search),
+        ), mock.patch.object(
+            OPENSEARCH_TEST_CLIENT,
+            "scroll",
+            side_effect=track_scroll_id(OPENSEARCH_TEST_CLIENT.scroll),
+        ), mock.patch.object(
+            OPENSEARCH_TEST_CLIENT,
+            "clear_scroll",
+            wraps=OPENSEARCH_TEST_CLIENT.clear_scroll,
+        ) as clear_scroll:
+            query_compiler = self.oml_flights()._query_compiler
+            batches = query_compiler._operations.search_yield_pandas_dataframes(
+                query_compiler, parallelism=2
+            )
+            # Stop reading after the first batch
+            next(batches)
+            batches.close()
+
+        cleared_scroll_ids = [
+            scroll_id
+            for call in clear_scroll.call_args_list
+            for scroll_id in call.kwargs["body"]["scroll_id"]
+        ]
+        assert scroll_ids
+        assert sorted(set(cleared_scroll_ids)) == sorted(set(scroll_ids))
+
+    def test_to_pandas_use_docvalue_fields(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        # float fields are read with float precision from doc values
+        assert_frame_equal(
+            pd_flights, oml_flights.to_pandas(use_docvalue_fields=True), rtol=1e-6
+        )
+
+    def test_to_pandas_invalid_parallelism(self):
+        with pytest.raises(ValueError):
+            self.oml_flights().to_pandas(parallelism=0)
+
+    def test_to_pandas_prefetch(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        # Pages fetched in the background are still yielded in order
+        assert_frame_equal(pd_flights, oml_flights.to_pandas(prefetch=2))
+
+    def test_to_pandas_adaptive_page_size(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        assert_frame_equal(pd_flights, oml_flights.to_pandas(adaptive_page_size=True))
+        assert_frame_equal(
+            pd_flights.head(7),
+            oml_flights.head(7).to_pandas(adaptive_page_size=True),
+        )
+
+    def test_to_pandas_invalid_prefetch(self):
+        with pytest.raises(ValueError):
+            self.oml_flights().to_pandas(prefetch=-1)
+
+    @pytest.mark.skipif(
+        OS_VERSION < PIT_MIN_OS_VERSION, reason="point in time requires OpenSearch 2.4"
+    )
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_search_yield_pandas_dataframes_deletes_pit(self, prefetch):
+        def open_pits():
+            return len(OPENSEARCH_TEST_CLIENT.get_all_pits().get("pits", []))
+
+        pits_before = open_pits()
+
+        # Stop consuming after the first page, the PIT must still be deleted
+        batches = self.oml_flights()._query_compiler.search_yield_pandas_dataframes(
+            prefetch=prefetch
+        )
+        next(batches)
+        assert open_pits() == pits_before + 1
+        batches.close()
+
+        assert open_pits() == pits_before
+
+    def test_to_pandas_renamed_timestamp(self):
+        oml_timestamp = self.oml_flights()["timestamp"].rename("ts")
+        pd_timestamp = self.pd_flights()["timestamp"].rename("ts")
+
+        assert_series_equal(pd_timestamp, oml_timestamp.to_pandas())
+
+    def test_flatten_hits_typed_columns(self):
+        plan = self.oml_flights()._query_compiler._flattening_plan()
+        hits = [
+            {
+                "_id": "0",
+                "_source": {
+                    "AvgTicketPrice": 1.5,
+                    "FlightDelayMin": 1,
+                    "Cancelled": True,
+                },
+            },
+            {
+                "_id": "1",
+                "_source": {
+                    "AvgTicketPrice": 2.5,
+                    "FlightDelayMin": 2,
+                    "Cancelled": False,
+                },
+            },
+        ]
+
+        columns, index = plan.flatten_hits(
+            hits, index_field="_id", index_is_source_field=False
+        )
+
+        assert index == ["0", "1"]
+        assert columns["AvgTicketPrice"].dtype == "float64"
+        assert columns["FlightDelayMin"].dtype == "int64"
+        assert columns["Cancelled"].dtype == "bool"
+
+        # Multiple and missing values fall back to object columns
+        hits[0]["_source"]["FlightDelayMin"] = [1, 2]
+        del hits[1]["_source"]["Cancelled"]
+
+        columns, _ = plan.flatten_hits(
+            hits, index_field="_id", index_is_source_field=False
+        )
+
+        assert columns["AvgTicketPrice"].dtype == "float64"
+        assert list(columns["FlightDelayMin"]) == [[1, 2], 2]
+        assert columns["Cancelled"].dtype == "object"
+        assert columns["Cancelled"][0] is True
+        assert pd.isna(columns["Cancelled"][1])
+
+        # float64 columns take whole numbers, not booleans or strings
+        hits[0]["_source"]["AvgTicketPrice"] = 1
+        columns, _ = plan.flatten_hits(
+            hits, index_field="_id", index_is_source_field=False
+        )
+        assert columns["AvgTicketPrice"].dtype == "float64"
+        assert list(columns["AvgTicketPrice"]) == [1.0, 2.5]
+
+        for value in (True, "1"):
+            hits[0]["_source"]["AvgTicketPrice"] = value
+            columns, _ = plan.flatten_hits(
+                hits, index_field="_id", index_is_source_field=False
+            )
+            assert columns["AvgTicketPrice"].dtype == "object"
+            assert columns["AvgTicketPrice"][0] is value
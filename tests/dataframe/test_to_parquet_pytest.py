@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+
+import json
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from tests.common import ROOT_DIR, TestData
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestDataFrameToParquet(TestData):
+    def test_to_arrow(self):
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        table = oml_flights.to_arrow()
+
+        assert table.num_rows == pd_flights.shape[0]
+        assert table.schema.field("AvgTicketPrice").type == pa.float64()
+        assert table.schema.field("Cancelled").type == pa.bool_()
+        assert table.schema.field("FlightDelayMin").type == pa.int64()
+        assert table.schema.field("timestamp").type == pa.timestamp("ns")
+        assert table.schema.field("Carrier").type == pa.string()
+
+        # Objects are stored as JSON
+        pd_from_arrow = table.to_pandas()
+        for column in ["DestLocation", "OriginLocation"]:
+            pd_from_arrow[column] = pd_from_arrow[column].map(json.loads)
+
+        assert_frame_equal(pd_flights, pd_from_arrow.loc[pd_flights.index])
+
+    def test_to_arrow_schema(self):
+        oml_ecommerce = self.oml_ecommerce()[["category", "products.price"]]
+        pd_ecommerce = oml_ecommerce.to_pandas()
+
+        table = oml_ecommerce.to_arrow(
+            index=False,
+            schema=pa.schema([("products.price", pa.list_(pa.float64()))]),
+        )
+
+        assert table.column_names == ["category", "products.price"]
+        for value, expected in zip(
+            table.column("products.price").to_pylist(), pd_ecommerce["products.price"]
+        ):
+            assert value == (expected if isinstance(expected, list) else [expected])
+
+        with pytest.raises(KeyError):
+            oml_ecommerce.to_arrow(schema=pa.schema([("missing", pa.string())]))
+
+    def test_to_parquet(self):
+        results_file = ROOT_DIR + "/dataframe/results/test_to_parquet.parquet"
+
+        oml_flights = self.oml_flights()
+        pd_flights = self.pd_flights()
+
+        oml_flights.to_parquet(results_file, row_group_size=1000)
+
+        parquet_file = pq.ParquetFile(results_file)
+        assert parquet_file.metadata.num_rows == pd_flights.shape[0]
+        assert parquet_file.metadata.num_row_groups >= pd_flights.shape[0] // 1000
+
+        pd_from_parquet = parquet_file.read().to_pandas()
+        assert_frame_equal(
+            pd_flights.drop(columns=["DestLocation", "OriginLocation"]),
+            pd_from_parquet.loc[pd_flights.index].drop(
+                columns=["DestLocation", "OriginLocation"]
+            ),
+        )
+
+    def test_to_parquet_empty(self):
+        results_file = ROOT_DIR + "/dataframe/results/test_to_parquet_empty.parquet"
+
+        oml_flights = self.oml_flights()
+        oml_flights[oml_flights.AvgTicketPrice > 100000].to_parquet(results_file)
+
+        table = pq.read_table(results_file)
+        assert table.num_rows == 0
+        assert table.schema.field("AvgTicketPrice").type == pa.float64()
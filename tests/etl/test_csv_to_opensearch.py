@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from io import StringIO
+from unittest import mock
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from opensearch_py_ml import DataFrame, csv_to_opensearch
+from tests.common import OPENSEARCH_TEST_CLIENT
+
+CSV = """id,a,b,c
+0,1,1.5,A
+1,2,2.5,B
+2,3,3.5,C
+3,4,4.5,D
+4,5,5.5,E
+"""
+
+
+@pytest.fixture(scope="function", autouse=True)
+def delete_test_index():
+    OPENSEARCH_TEST_CLIENT.indices.delete(index="test-index", ignore=404)
+    yield
+    OPENSEARCH_TEST_CLIENT.indices.delete(index="test-index", ignore=404)
+
+
+class TestCsvToOpenSearch:
+    def test_csv_to_opensearch(self):
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT.indices,
+            "exists",
+            wraps=OPENSEARCH_TEST_CLIENT.indices.exists,
+        ) as exists, mock.patch.object(
+            OPENSEARCH_TEST_CLIENT.indices,
+            "refresh",
+            wraps=OPENSEARCH_TEST_CLIENT.indices.refresh,
+        ) as refresh:
+            oml_df = csv_to_opensearch(
+                StringIO(CSV),
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                os_refresh=True,
+                index_col=0,
+                chunksize=2,
+            )
+
+        # The index is set up and refreshed once rather than per chunk
+        assert exists.call_count == 1
+        assert refresh.call_count == 1
+
+        assert isinstance(oml_df, DataFrame)
+        pd_df = pd.read_csv(StringIO(CSV), index_col=0)
+        pd_df.index = pd_df.index.map(str)
+        assert_frame_equal(pd_df, oml_df.to_pandas().sort_index(), check_names=False)
+
+    def test_csv_to_opensearch_incompatible_chunk(self):
+        with pytest.raises(ValueError) as e:
+            csv_to_opensearch(
+                StringIO(CSV.replace("3,4,4.5,D", "3,four,4.5,D")),
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                index_col=0,
+                chunksize=2,
+            )
+        assert "'a' column type ('keyword') not compatible" in str(e.value)
+
+    @pytest.mark.parametrize("thread_count,queue_size", [(1, 1), (2, 4)])
+    def test_csv_to_opensearch_queue_size(self, thread_count, queue_size):
+        oml_df = csv_to_opensearch(
+            StringIO(CSV),
+            os_client=OPENSEARCH_TEST_CLIENT,
+            os_dest_index="test-index",
+            os_refresh=True,
+            index_col=0,
+            chunksize=1,
+            thread_count=thread_count,
+            queue_size=queue_size,
+        )
+
+        pd_df = pd.read_csv(StringIO(CSV), index_col=0)
+        pd_df.index = pd_df.index.map(str)
+        assert_frame_equal(pd_df, oml_df.to_pandas().sort_index(), check_names=False)
+
+    def test_csv_to_opensearch_parse_error(self):
+        # Errors raised while parsing a later chunk reach the caller
+        with pytest.raises(pd.errors.ParserError):
+            csv_to_opensearch(
+                StringIO(CSV.replace("3,4,4.5,D", "3,4,4.5,D,extra")),
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                index_col=0,
+                chunksize=2,
+            )
+
+    def test_csv_to_opensearch_no_verify_mapping_compatibility(self):
+        csv_to_opensearch(
+            StringIO(CSV),
+            os_client=OPENSEARCH_TEST_CLIENT,
+            os_dest_index="test-index",
+            index_col=0,
+            chunksize=2,
+        )
+
+        with mock.patch("opensearch_py_ml.etl.verify_mapping_compatibility") as verify:
+            oml_df = csv_to_opensearch(
+                StringIO(CSV),
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                os_if_exists="append",
+                os_refresh=True,
+                index_col=0,
+                chunksize=2,
+                os_verify_mapping_compatibility=False,
+            )
+
+        assert verify.call_count == 0
+        assert oml_df.shape == (5, 3)
@@ -22,17 +22,28 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import asyncio
+import json
 from datetime import datetime, timedelta
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
+from opensearchpy.exceptions import TransportError
 from opensearchpy.helpers import BulkIndexError
 
-from opensearch_py_ml import DataFrame, pandas_to_opensearch
+from opensearch_py_ml import (
+    DataFrame,
+    etl,
+    pandas_to_opensearch,
+    pandas_to_opensearch_async,
+)
 from tests.common import (
     OPENSEARCH_TEST_CLIENT,
     assert_frame_equal,
     assert_pandas_opensearch_py_ml_frame_equal,
+    async_test_client,
 )
 
 dt = datetime.utcnow()
@@ -302,3 +313,249 @@ class TestPandasToEland:
             "Cannot use 'd' with groupby() because it has "
             "no aggregatable fields in Opensearch"
         )
+
+    def test_os_dropna(self):
+        pd_df_na = pd.DataFrame(
+            {"a": [1, 2, 3], "b": [1.0, np.nan, 3.0], "c": ["A", "B", None]},
+            index=["0", "1", "2"],
+        )
+        pandas_to_opensearch(
+            pd_df_na,
+            os_client=OPENSEARCH_TEST_CLIENT,
+            os_dest_index="test-index",
+            os_refresh=True,
+            os_dropna=True,
+            chunksize=2,
+        )
+
+        sources = {
+            hit["_id"]: hit["_source"]
+            for hit in OPENSEARCH_TEST_CLIENT.search(index="test-index")["hits"]["hits"]
+        }
+        assert sources == {
+            "0": {"a": 1, "b": 1.0, "c": "A"},
+            "1": {"a": 2, "c": "B"},
+            "2": {"a": 3, "b": 3.0},
+        }
+
+    def test_max_chunk_bytes(self):
+        pd_df_wide = pd.DataFrame(
+            {"a": range(100), "b": ["x" * 100] * 100},
+            index=[str(i) for i in range(100)],
+        )
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "bulk", wraps=OPENSEARCH_TEST_CLIENT.bulk
+        ) as bulk:
+            oml_df = pandas_to_opensearch(
+                pd_df_wide,
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                os_refresh=True,
+                thread_count=1,
+                max_chunk_bytes=2000,
+            )
+
+        # Every request is within the budget, whatever the number of rows
+        request_sizes = [len(call.kwargs["body"]) for call in bulk.call_args_list]
+        assert len(request_sizes) > 1
+        assert max(request_sizes) <= 2000
+
+        assert_pandas_opensearch_py_ml_frame_equal(pd_df_wide, oml_df)
+
+    def test_bulk_retry(self):
+        bulk = OPENSEARCH_TEST_CLIENT.bulk
+        rejected = []
+
+        def reject_first_document(body, **kwargs):
+            # Rejects the first document of the first request only
+            lines = body.splitlines()
+            if rejected:
+                return bulk(body=body, **kwargs)
+            rejected.append(lines[0])
+            resp = bulk(body=b"\n".join(lines[2:]) + b"\n", **kwargs)
+            resp["items"].insert(0, {"index": {"status": 429, "error": "rejected"}})
+            return resp
+
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "bulk", side_effect=reject_first_document
+        ) as mock_bulk:
+            oml_df = pandas_to_opensearch(
+                pd_df,
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                os_refresh=True,
+                max_retries=1,
+                initial_backoff=0,
+            )
+
+        # Only the rejected document is sent again
+        assert mock_bulk.call_count == 2
+        assert mock_bulk.call_args.kwargs["body"].splitlines()[0] == rejected[0]
+        assert_frame_equal(pd_df, oml_df.to_pandas().sort_index())
+
+    @pytest.mark.parametrize("to_file", [False, True])
+    def test_bulk_dead_letter(self, tmp_path, to_file):
+        def reject(body, **kwargs):
+            return {
+                "errors": True,
+                "items": [
+                    {"index": {"status": 429, "error": "rejected"}}
+                    for _ in body.splitlines()[::2]
+                ],
+            }
+
+        dead_letter = str(tmp_path / "dead_letter.json") if to_file else []
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "bulk", side_effect=reject
+        ) as mock_bulk:
+            pandas_to_opensearch(
+                pd_df,
+                os_client=OPENSEARCH_TEST_CLIENT,
+                os_dest_index="test-index",
+                max_retries=2,
+                initial_backoff=0,
+                dead_letter=dead_letter,
+            )
+
+        assert mock_bulk.call_count == 3
+        if to_file:
+            with open(dead_letter) as f:
+                dead_letter = [json.loads(line) for line in f]
+        assert len(dead_letter) == len(pd_df)
+        assert dead_letter[0] == {
+            "index": {
+                "status": 429,
+                "error": "rejected",
+                "data": {"a": 1, "b": 1.0, "c": "A", "d": dt.isoformat()},
+            }
+        }
+
+    def test_bulk_rejected_without_dead_letter(self):
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT,
+            "bulk",
+            side_effect=TransportError(429, "rejected"),
+        ) as mock_bulk:
+            with pytest.raises(TransportError):
+                pandas_to_opensearch(
+                    pd_df,
+                    os_client=OPENSEARCH_TEST_CLIENT,
+                    os_dest_index="test-index",
+                    max_retries=1,
+                    initial_backoff=0,
+                )
+
+        assert mock_bulk.call_count == 2
+
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_os_bulk_tuning(self, fail):
+        pandas_to_opensearch(
+            pd_df, os_client=OPENSEARCH_TEST_CLIENT, os_dest_index="test-index"
+        )
+        OPENSEARCH_TEST_CLIENT.indices.put_settings(
+            index="test-index", body={"index.refresh_interval": "5s"}
+        )
+
+        def get_settings():
+            return OPENSEARCH_TEST_CLIENT.indices.get_settings(
+                index="test-index", flat_settings=True
+            )["test-index"]["settings"]
+
+        replicas = get_settings()["index.number_of_replicas"]
+        bulk_settings = []
+        bulk = OPENSEARCH_TEST_CLIENT.bulk
+
+        def tuned_bulk(body, **kwargs):
+            bulk_settings.append(get_settings())
+            if fail:
+                raise TransportError(400, "failed")
+            return bulk(body=body, **kwargs)
+
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT, "bulk", side_effect=tuned_bulk
+        ), mock.patch.object(
+            OPENSEARCH_TEST_CLIENT.indices,
+            "forcemerge",
+            wraps=OPENSEARCH_TEST_CLIENT.indices.forcemerge,
+        ) as forcemerge:
+            try:
+                pandas_to_opensearch(
+                    pd_df,
+                    os_client=OPENSEARCH_TEST_CLIENT,
+                    os_dest_index="test-index",
+                    os_if_exists="append",
+                    os_bulk_tuning=True,
+                    os_force_merge=True,
+                )
+            except TransportError:
+                assert fail
+
+        assert bulk_settings[0]["index.refresh_interval"] == "-1"
+        assert bulk_settings[0]["index.number_of_replicas"] == "0"
+        # Force merged only if indexing succeeded
+        assert forcemerge.call_count == (0 if fail else 1)
+        # The settings are restored even if indexing failed
+        assert get_settings()["index.refresh_interval"] == "5s"
+        assert get_settings()["index.number_of_replicas"] == replicas
+
+    def test_pandas_to_opensearch_async(self):
+        async def index():
+            async with async_test_client() as os_client:
+                await pandas_to_opensearch_async(
+                    pd_df,
+                    os_client=os_client,
+                    os_dest_index="test-index",
+                    os_refresh=True,
+                    concurrency=2,
+                    chunksize=1,
+                )
+
+        asyncio.run(index())
+
+        oml_df = DataFrame(OPENSEARCH_TEST_CLIENT, "test-index")
+        assert_frame_equal(pd_df, oml_df.to_pandas().sort_index())
+
+    def test_pandas_to_opensearch_async_os_bulk_tuning(self):
+        pandas_to_opensearch(
+            pd_df, os_client=OPENSEARCH_TEST_CLIENT, os_dest_index="test-index"
+        )
+        OPENSEARCH_TEST_CLIENT.indices.put_settings(
+            index="test-index", body={"index.refresh_interval": "5s"}
+        )
+
+        def get_settings():
+            return OPENSEARCH_TEST_CLIENT.indices.get_settings(
+                index="test-index", flat_settings=True
+            )["test-index"]["settings"]
+
+        bulk_settings = []
+        bulk_index_async = etl._bulk_index_async
+
+        async def tuned_bulk_index_async(*args, **kwargs):
+            bulk_settings.append(get_settings())
+            await bulk_index_async(*args, **kwargs)
+
+        async def index():
+            async with async_test_client() as os_client:
+                await pandas_to_opensearch_async(
+                    pd_df,
+                    os_client=os_client,
+                    os_dest_index="test-index",
+                    os_if_exists="append",
+                    os_refresh=True,
+                    os_bulk_tuning=True,
+                    os_force_merge=True,
+                )
+
+        with mock.patch.object(
+            etl, "_bulk_index_async", side_effect=tuned_bulk_index_async
+        ):
+            asyncio.run(index())
+
+        assert bulk_settings[0]["index.refresh_interval"] == "-1"
+        assert bulk_settings[0]["index.number_of_replicas"] == "0"
+        # The settings are restored once indexed
+        assert get_settings()["index.refresh_interval"] == "5s"
+
+        oml_df = DataFrame(OPENSEARCH_TEST_CLIENT, "test-index")
+        assert_frame_equal(pd_df, oml_df.to_pandas().sort_index())
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+from unittest import mock
+
+from opensearch_py_ml.field_mappings import FieldMappings
+from tests import ECOMMERCE_INDEX_NAME, FLIGHTS_INDEX_NAME, OPENSEARCH_TEST_CLIENT
+from tests.common import TestData
+
+
+class TestDocvalueFields(TestData):
+    def test_flights_docvalue_fields(self):
+        oml_field_mappings = FieldMappings(
+            client=OPENSEARCH_TEST_CLIENT,
+            index_pattern=FLIGHTS_INDEX_NAME,
+            display_names=[
+                "AvgTicketPrice",
+                "Cancelled",
+                "Carrier",
+                "DestLocation",
+                "timestamp",
+            ],
+        )
+
+        docvalue_fields = oml_field_mappings.docvalue_fields()
+
+        # geo_point fields are read from _source
+        assert [field.os_field_name for field in docvalue_fields] == [
+            "AvgTicketPrice",
+            "Cancelled",
+            "Carrier",
+            "timestamp",
+        ]
+
+    def test_ecommerce_docvalue_fields_exclude_text(self):
+        oml_field_mappings = FieldMappings(
+            client=OPENSEARCH_TEST_CLIENT,
+            index_pattern=ECOMMERCE_INDEX_NAME,
+            display_names=["category", "currency", "total_quantity"],
+        )
+
+        docvalue_fields = oml_field_mappings.docvalue_fields()
+
+        # category is a text field with a keyword sub-field
+        assert [field.os_field_name for field in docvalue_fields] == [
+            "currency",
+            "total_quantity",
+        ]
+
+    def test_docvalue_fields_exclude_ignore_above(self):
+        client = mock.Mock()
+        client.indices.get_mapping.return_value = {
+            "test-index": {
+                "mappings": {
+                    "properties": {
+                        "code": {"type": "keyword"},
+                        "url": {"type": "keyword", "ignore_above": 256},
+                        "count": {"type": "long"},
+                    }
+                }
+            }
+        }
+        client.field_caps.return_value = {
+            "fields": {
+                name: {
+                    os_dtype: {
+                        "type": os_dtype,
+                        "searchable": True,
+                        "aggregatable": True,
+                    }
+                }
+                for name, os_dtype in [
+                    ("code", "keyword"),
+                    ("url", "keyword"),
+                    ("count", "long"),
+                ]
+            }
+        }
+        oml_field_mappings = FieldMappings(client=client, index_pattern="test-index")
+
+        docvalue_fields = oml_field_mappings.docvalue_fields()
+
+        # Values of url longer than 256 characters have no doc values
+        assert [field.os_field_name for field in docvalue_fields] == ["code", "count"]
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from opensearch_py_ml.field_mappings import FieldMappings, FieldMappingsCache
+from tests import FLIGHTS_INDEX_NAME, FLIGHTS_SMALL_INDEX_NAME, OPENSEARCH_TEST_CLIENT
+from tests.common import TestData
+
+
+@pytest.fixture(scope="function", autouse=True)
+def enable_cache():
+    FieldMappings.cache.invalidate()
+    FieldMappings.cache.ttl = 60
+    yield
+    FieldMappings.cache.ttl = 0
+    FieldMappings.cache.invalidate()
+
+
+class TestFieldMappingsCache(TestData):
+    def test_cached_mappings(self):
+        with mock.patch.object(
+            OPENSEARCH_TEST_CLIENT.indices,
+            "get_mapping",
+            wraps=OPENSEARCH_TEST_CLIENT.indices.get_mapping,
+        ) as get_mapping:
+            first = FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME)
+            second = FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME)
+            assert get_mapping.call_count == 1
+
+            FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_SMALL_INDEX_NAME)
+            assert get_mapping.call_count == 2
+
+            FieldMappings.cache.invalidate(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME)
+            FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME)
+            FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_SMALL_INDEX_NAME)
+            assert get_mapping.call_count == 3
+
+        # Instances don't share changes to their mappings
+        first.rename({"Carrier": "Airline"})
+        assert "Carrier" in second.display_names
+        assert "Airline" not in second.display_names
+        assert (
+            FieldMappings(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME).display_names
+            == second.display_names
+        )
+
+    def test_cache_ttl(self):
+        cache = FieldMappingsCache(ttl=10)
+        capabilities = FieldMappings(
+            OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME
+        )._mappings_capabilities
+
+        with mock.patch(
+            "opensearch_py_ml.field_mappings.time.monotonic", return_value=100.0
+        ):
+            cache.put(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME, capabilities)
+        with mock.patch(
+            "opensearch_py_ml.field_mappings.time.monotonic", return_value=109.0
+        ):
+            assert cache.get(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME) is not None
+        with mock.patch(
+            "opensearch_py_ml.field_mappings.time.monotonic", return_value=110.0
+        ):
+            assert cache.get(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME) is None
+
+        # A TTL of 0 disables the cache
+        cache.ttl = 0
+        cache.put(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME, capabilities)
+        assert cache.get(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME) is None
+
+    def test_cache_max_size(self):
+        cache = FieldMappingsCache(ttl=60, max_size=2)
+        capabilities = FieldMappings(
+            OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME
+        )._mappings_capabilities
+
+        cache.put(OPENSEARCH_TEST_CLIENT, "a", capabilities)
+        cache.put(OPENSEARCH_TEST_CLIENT, "b", capabilities)
+        # 'a' is used more recently than 'b', so 'b' is evicted
+        cache.get(OPENSEARCH_TEST_CLIENT, "a")
+        cache.put(OPENSEARCH_TEST_CLIENT, "c", capabilities)
+
+        assert cache.get(OPENSEARCH_TEST_CLIENT, "a") is not None
+        assert cache.get(OPENSEARCH_TEST_CLIENT, "b") is None
+        assert cache.get(OPENSEARCH_TEST_CLIENT, "c") is not None
+
+        cache.invalidate(OPENSEARCH_TEST_CLIENT)
+        assert cache.get(OPENSEARCH_TEST_CLIENT, "a") is None
+
+    def test_cache_per_credentials(self):
+        cache = FieldMappingsCache(ttl=60)
+        capabilities = FieldMappings(
+            OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME
+        )._mappings_capabilities
+        transport = OPENSEARCH_TEST_CLIENT.transport
+
+        def client(**kwargs):
+            # A client on the same hosts with the given connection options
+            return SimpleNamespace(
+                transport=SimpleNamespace(
+                    hosts=transport.hosts,
+                    kwargs=kwargs,
+                    connection_class=getattr(transport, "connection_class", None),
+                )
+            )
+
+        same_client = client(**getattr(transport, "kwargs", {}))
+        other_client = client(
+            **getattr(transport, "kwargs", {}), http_auth=("other", "secret")
+        )
+
+        cache.put(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME, capabilities)
+        assert cache.get(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME) is not None
+        # Clients with the same credentials share entries
+        assert cache.get(same_client, FLIGHTS_INDEX_NAME) is not None
+        assert cache.get(other_client, FLIGHTS_INDEX_NAME) is None
+
+        # Writes through any client of the cluster invalidate its entries
+        cache.invalidate(other_client)
+        assert cache.get(OPENSEARCH_TEST_CLIENT, FLIGHTS_INDEX_NAME) is None
+        assert cache.get(same_client, FLIGHTS_INDEX_NAME) is None
+
+    def test_credentials_key(self):
+        class Auth:
+            def __init__(self, secret):
+                self.secret = secret
+
+        def credentials_key(**kwargs):
+            return FieldMappingsCache._credentials_key(
+                SimpleNamespace(transport=SimpleNamespace(kwargs=kwargs))
+            )
+
+        # Auth objects are compared by their attributes, not their identity
+        assert credentials_key(http_auth=Auth("a")) == credentials_key(
+            http_auth=Auth("a")
+        )
+        assert credentials_key(http_auth=Auth("a")) != credentials_key(
+            http_auth=Auth("b")
+        )
+        assert credentials_key(api_key=("id", "a")) != credentials_key(
+            api_key=("id", "b")
+        )
+        # The credentials themselves aren't part of the key
+        assert "secret" not in credentials_key(http_auth=("user", "secret"))
+
+    def test_cache_disabled_by_default(self):
+        assert FieldMappingsCache().ttl == 0
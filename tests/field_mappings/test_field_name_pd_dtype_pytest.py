@@ -53,3 +53,23 @@ class TestFieldNamePDDType(TestData):
 
         with pytest.raises(KeyError):
             oml_field_mappings.field_name_pd_dtype("unknown")
+
+    def test_renamed_and_scripted(self):
+        oml_field_mappings = FieldMappings(
+            client=OPENSEARCH_TEST_CLIENT, index_pattern=FLIGHTS_INDEX_NAME
+        )
+
+        # Lookups by OpenSearch field name follow renames and new scripted fields
+        oml_field_mappings.rename({"AvgTicketPrice": "price"})
+        oml_field_mappings.add_scripted_field("script_field", "script", "int64")
+
+        assert oml_field_mappings.field_name_pd_dtype("AvgTicketPrice") == "float64"
+        assert oml_field_mappings.field_name_pd_dtype("script_field") == "int64"
+        assert oml_field_mappings.aggregatable_field_name("price") == "AvgTicketPrice"
+        assert oml_field_mappings.get_renames() == {
+            "AvgTicketPrice": "price",
+            "script_field": "script",
+        }
+
+        with pytest.raises(KeyError):
+            oml_field_mappings.aggregatable_field_name("AvgTicketPrice")
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from unittest import mock
+
+from opensearchpy import Transport
+
+from opensearch_py_ml.common import DEFAULT_MAX_RESULT_WINDOW, MIN_SEARCH_SIZE
+from opensearch_py_ml.operations import (
+    _AdaptivePageSize,
+    _max_result_window,
+    _ResponseSizeRecorder,
+)
+from tests.common import TestData
+
+
+def hits(n, width):
+    return [{"_id": str(i), "_source": {"field": "x" * width}} for i in range(n)]
+
+
+def test_grows_at_most_double_for_small_hits():
+    page_size = _AdaptivePageSize(size=1000, max_size=100000, target_bytes=10**6)
+
+    assert page_size.update(hits(1000, 10), seconds=0.1) == 2000
+    assert page_size.update(hits(2000, 10), seconds=0.1) == 4000
+
+
+def test_stays_within_max_size():
+    page_size = _AdaptivePageSize(size=20000, max_size=10000, target_bytes=10**8)
+
+    assert page_size.size == 10000
+    assert page_size.update(hits(10000, 10), seconds=0.1) == 10000
+
+
+def test_shrinks_for_large_hits():
+    page_size = _AdaptivePageSize(size=1000, max_size=10000, target_bytes=10**6)
+
+    # Each hit is a little over 10KB so about 100 fit in the target
+    size = page_size.update(hits(1000, 10000), seconds=0.1)
+    assert 90 <= size < 100
+
+    # Never below the minimum
+    assert page_size.update(hits(size, 10**6), seconds=0.1) == MIN_SEARCH_SIZE
+
+
+def test_shrinks_for_slow_pages():
+    page_size = _AdaptivePageSize(
+        size=1000, max_size=10000, target_bytes=10**8, target_seconds=1.0
+    )
+
+    assert page_size.update(hits(1000, 10), seconds=4.0) == 250
+
+
+def test_uses_response_bytes():
+    page_size = _AdaptivePageSize(size=1000, max_size=10000, target_bytes=10**6)
+
+    # The response is 10KB per hit, however small the hits look
+    assert page_size.update(hits(1000, 10), seconds=0.1, response_bytes=10**7) == 100
+
+
+def test_response_size_recorder():
+    client = mock.Mock(spec=["transport"])
+    client.transport = Transport([{"host": "localhost", "port": 9200}])
+    recorder = _ResponseSizeRecorder.of(client)
+
+    assert recorder is not None
+    assert _ResponseSizeRecorder.of(client) is recorder
+    assert recorder.pop_size() is None
+
+    body = '{"hits": {"hits": []}}'
+    assert client.transport.deserializer.loads(body, "application/json") == {
+        "hits": {"hits": []}
+    }
+    assert recorder.pop_size() == len(body)
+    assert recorder.pop_size() is None
+
+
+class TestMaxResultWindow(TestData):
+    def test_max_result_window(self):
+        assert (
+            _max_result_window(self.oml_flights()._query_compiler)
+            == DEFAULT_MAX_RESULT_WINDOW
+        )
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from opensearch_py_ml.field_mappings import Field
+from opensearch_py_ml.operations import Operations
+
+
+def field(name, os_dtype, pd_dtype):
+    return Field(name, name, True, os_dtype, None, pd_dtype, True, True, False, name)
+
+
+FIELDS = [
+    field("price", "double", "float64"),
+    field("quantity", "long", "int64"),
+    field("cancelled", "boolean", "bool"),
+]
+BUCKETS = [
+    {
+        f"{agg}_{name}": {
+            "value": value,
+            "count": count,
+            **{
+                result: value
+                for result in ("min", "max", "sum", "avg", "std_deviation", "variance")
+            },
+        }
+        for agg in ("min", "max", "sum", "avg", "value_count", "extended_stats")
+        for name, value in (
+            ("price", price),
+            ("quantity", quantity),
+            ("cancelled", cancelled),
+        )
+    }
+    for price, quantity, cancelled, count in (
+        (1.5, 3.0, 1.0, 4),
+        (None, None, None, 0),
+        (2.25, 5.0, 0.0, 1),
+    )
+]
+
+
+@pytest.mark.parametrize("numeric_only", [True, False, None])
+@pytest.mark.parametrize(
+    "pd_aggs", [["min", "max", "sum", "mean", "count"], ["std", "var"], ["sum"]]
+)
+def test_metric_agg_column_matches_unpacker(pd_aggs, numeric_only):
+    os_aggs = Operations._map_pd_aggs_to_os_aggs(pd_aggs)
+    plan = Operations._metric_aggs_plan(
+        FIELDS, os_aggs, pd_aggs, numeric_only, is_dataframe_agg=True
+    )
+    unpack = Operations._metric_aggs_unpacker(
+        FIELDS, os_aggs, pd_aggs, numeric_only, is_dataframe_agg=True, plan=plan
+    )
+    unpacked = [unpack(bucket) for bucket in BUCKETS]
+
+    for field, steps in plan:
+        assert all(map(Operations._is_single_value_step, steps))
+        for i, step in enumerate(steps):
+            expected = [
+                row[field.column][i] if len(steps) > 1 else row[field.column]
+                for row in unpacked
+            ]
+            pd.testing.assert_series_equal(
+                pd.Series(Operations._metric_agg_column(BUCKETS, step, numeric_only)),
+                pd.Series(expected),
+            )
+
+
+def test_is_single_value_step():
+    timestamp = field("timestamp", "date", "datetime64[ns]")
+    pd_aggs = ["min", "nunique", "median"]
+    os_aggs = Operations._map_pd_aggs_to_os_aggs(pd_aggs)
+    plan = Operations._metric_aggs_plan(
+        [FIELDS[0], timestamp], os_aggs, pd_aggs, False, is_dataframe_agg=True
+    )
+
+    assert [
+        list(map(Operations._is_single_value_step, steps)) for _, steps in plan
+    ] == [
+        [True, True, False],
+        [False, True, False],
+    ]
+
+
+def test_metric_agg_column_empty_page():
+    pd_aggs = ["count"]
+    os_aggs = Operations._map_pd_aggs_to_os_aggs(pd_aggs)
+    ((_, (step,)),) = Operations._metric_aggs_plan(
+        FIELDS[:1], os_aggs, pd_aggs, True, is_dataframe_agg=True
+    )
+
+    column = Operations._metric_agg_column([], step, True)
+    assert column.dtype == np.int64 and len(column) == 0
@@ -25,6 +25,7 @@
 # File called _pytest for PyCharm compatability
 
 from datetime import timedelta
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -214,6 +215,18 @@ class TestSeriesMetrics(TestData):
 
         np.equal(pd_unique, oml_unique)
 
+    @pytest.mark.parametrize("column", ["FlightDelayMin", "DestCountry"])
+    def test_flights_unique_pages(self, column):
+        pd_unique = np.sort(self.pd_flights()[column].unique())
+
+        # Small pages make unique() grow its buffer and iter_unique() span pages
+        with mock.patch("opensearch_py_ml.operations.DEFAULT_PAGINATION_SIZE", 7):
+            oml_unique = self.oml_flights()[column].unique()
+            oml_iter_unique = list(self.oml_flights()[column].iter_unique())
+
+        np.testing.assert_array_equal(pd_unique, oml_unique)
+        np.testing.assert_array_equal(pd_unique, np.array(oml_iter_unique))
+
     @pytest.mark.parametrize("quantiles_list", [[np.array([1, 2])], ["1", 2]])
     def test_quantile_non_numeric_values(self, quantiles_list):
         oml_flights = self.oml_flights()["dayOfWeek"]
@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: Apache-2.0
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+# Any modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+# File called _pytest for PyCharm compatability
+from io import StringIO
+
+import pandas as pd
+from pandas.testing import assert_series_equal
+
+from tests.common import TestData
+
+
+class TestSeriesToCSV(TestData):
+    def test_to_csv(self):
+        oml_avg_ticket_price = self.oml_flights()["AvgTicketPrice"]
+        pd_avg_ticket_price = self.pd_flights()["AvgTicketPrice"]
+
+        ret = oml_avg_ticket_price.to_csv()
+        pd_from_csv = pd.read_csv(StringIO(ret), index_col=0).squeeze("columns")
+        pd_from_csv.index = pd_from_csv.index.map(str)
+        pd_from_csv.index.name = None
+
+        assert_series_equal(pd_avg_ticket_price, pd_from_csv)
+
+    def test_to_csv_header(self):
+        oml_carrier = self.oml_flights()["Carrier"].head()
+        pd_carrier = self.pd_flights()["Carrier"].head()
+
+        assert oml_carrier.to_csv(header=False) == pd_carrier.to_csv(header=False)
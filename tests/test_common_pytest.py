@@ -22,13 +22,23 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import asyncio
+import json
 import unittest.mock as mock
 import warnings
 
+import pandas as pd
 import pytest
 
 import opensearch_py_ml
-from opensearch_py_ml.common import os_version
+from opensearch_py_ml.common import (
+    OrjsonSerializer,
+    _cluster_version,
+    _cluster_version_async,
+    opensearch_date_to_pandas_date,
+    opensearch_dates_to_pandas_dates,
+    os_version,
+)
 
 
 @pytest.mark.parametrize(
@@ -45,3 +55,70 @@ def test_major_version_mismatch(version_number, version_tuple):
         f"OpenSearch major version ({opensearch_py_ml.__version__}) doesn't match the major version of the OpenSearch server ({version_number}) "
         "which can lead to compatibility issues. Your major version should be the same as your cluster major version."
     )
+
+
+def test_cluster_version_doesnt_warn():
+    client = mock.Mock(spec=["info"])
+    client.info.return_value = {"version": {"number": "2.11.0"}}
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert _cluster_version(client) == (2, 11, 0)
+        assert _cluster_version(client) == (2, 11, 0)
+    assert w == []
+    client.info.assert_called_once()
+
+
+def test_cluster_version_async():
+    client = mock.Mock(spec=["info"])
+    client.info = mock.AsyncMock(return_value={"version": {"number": "2.11.0"}})
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        assert asyncio.run(_cluster_version_async(client)) == (2, 11, 0)
+        assert asyncio.run(_cluster_version_async(client)) == (2, 11, 0)
+    assert w == []
+    client.info.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ["values", "date_format"],
+    [
+        (["2019-11-26T19:58:15.246+0000", None], "strict_date_optional_time"),
+        ([1574798295246, 3000], "epoch_millis"),
+        ([1574798295, 3], "epoch_second"),
+        ([1574798295246, 3000.5], None),
+        ([1574798295246, 3000], "strict_date_optional_time"),
+        ([20191126, None], "basic_date"),
+        (["20191126", "19700101"], "basic_date"),
+        (["2019-11-26T19:58:15.246Z", "1574798295246"], None),
+        ([1574798295246, "2019-11-26T19:58:15.246Z"], None),
+        ([1574798295246, "2019-11-26"], "strict_date_optional_time||epoch_millis"),
+    ],
+)
+def test_opensearch_dates_to_pandas_dates(values, date_format):
+    expected = pd.Series(
+        [opensearch_date_to_pandas_date(value, date_format) for value in values],
+        dtype=object,
+    ).infer_objects()
+
+    dates = opensearch_dates_to_pandas_dates(values, date_format)
+
+    assert len(dates) == len(values)
+    pd.testing.assert_series_equal(
+        pd.Series(dates, dtype=object).infer_objects(), expected
+    )
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '{"hits": {"hits": [{"_id": "0", "_source": {"a": 1.5, "b": ["x", null]}}]}}',
+        '{"value": NaN}',
+        '{"value": 18446744073709551615}',
+    ],
+)
+def test_orjson_serializer_loads(response):
+    pytest.importorskip("orjson")
+
+    serializer = OrjsonSerializer()
+    assert json.dumps(serializer.loads(response)) == json.dumps(json.loads(response))
+    assert serializer.dumps({"a": 1}) == '{"a":1}'